@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from NexR_qc.SqlSource import SqlTable
+from NexR_qc.Streaming import TableAccumulator
+
+
+def _sample(data, col, sample_size, seed):
+    # 문자열 컬럼의 결측값 제외 표본 (전체 컬럼을 변환하지 않도록 행 단위 표본 추출 후 사용)
+    if isinstance(data, TableAccumulator):
+        acc = data[col]
+        if acc.dtype is None or acc.dtype.kind != "O":
+            return None
+        return pd.Series([value_ for value_, _ in acc.frequency().head(sample_size)], dtype=object)
+
+    series = data[col]
+    # 범주형: 불러오기 시 category 로 변환된 문자열 컬럼 (optimize_frame) 포함
+    categorical = isinstance(series.dtype, pd.CategoricalDtype)
+    dtype = series.dtype.categories.dtype if categorical else series.dtype
+    if not (dtype == object or isinstance(dtype, pd.StringDtype)):
+        return None
+    if series.shape[0] > sample_size:
+        series = series.iloc[np.sort(np.random.default_rng(seed).choice(series.shape[0], sample_size, replace=False))]
+    return series.dropna().astype(object) if categorical else series.dropna()
+
+
+def infer_datetime_columns(data, sample_size=1_000, threshold=0.95, seed=0):
+    """Columns whose sampled non-null values parse as dates/times (ratio >= threshold)"""
+    if hasattr(data, "time_columns"):
+        # 캐시된 테이블: 이전 실행 시 확인된 날짜/시간 컬럼
+        return list(data.time_columns)
+
+    if isinstance(data, SqlTable):
+        # DB 테이블: 앞쪽 sample_size 행 기준
+        data = data.head(sample_size)
+
+    Columns = []
+    for col in data.columns:
+        sample = _sample(data, col, sample_size, seed)
+        if sample is None or sample.shape[0] == 0:
+            continue
+        sample = sample.astype(str)
+        # 숫자로만 구성된 값(코드, 금액 등)은 날짜로 해석될 수 있으므로 제외
+        if pd.to_numeric(sample, errors="coerce").notna().all():
+            continue
+        # 날짜/시간 값은 최소 4자리 이상의 숫자를 포함 ("t1", "May" 등 dateutil 이 해석 가능한 일반 문자열 제외)
+        parsed = pd.to_datetime(sample, errors="coerce", format="mixed").notna() & (sample.str.count(r"\d") >= 4)
+        if parsed.mean() >= threshold:
+            Columns.append(col)
+    return Columns
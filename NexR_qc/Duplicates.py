@@ -0,0 +1,251 @@
+import os
+import pickle
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.ResultTable import Duplicates
+
+ExactFloat = 2**53  # float64 로 정확히 표현되는 정수 범위
+
+
+def column_hashes(series, factorize=False):
+    """64-bit hash of every value of a column
+
+    정수 컬럼은 float64 기준으로 계산 (chunk 별로 정수/실수 dtype 이 다르게 추론된 컬럼(결측값이 있는 chunk 는 float64)도 같은 값은 같은 해시값)
+    factorize: 문자열/범주형 컬럼은 문자열 대신 고유값 code 의 해시 사용 (같은 컬럼 전체를 한 번에 계산하는 경우에만 비교 가능)
+    """
+    if factorize and isinstance(series.dtype, pd.CategoricalDtype):
+        return pd.util.hash_array(series.cat.codes.to_numpy().astype(np.int64))
+    if factorize and (series.dtype == object or pd.api.types.is_string_dtype(series.dtype)):
+        return pd.util.hash_array(pd.factorize(series)[0].astype(np.int64))
+    if series.dtype.kind in "iuf":
+        # -0.0 과 0.0, 부호가 다른 NaN 은 같은 값 (DataFrame.duplicated 와 동일)
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+        if series.dtype.kind == "f" or not (np.abs(values) >= ExactFloat).any():
+            return pd.util.hash_array(np.where(np.isnan(values), np.nan, values))
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def combine_hashes(hashes, n_rows, n_items):
+    # 컬럼 해시를 행 해시로 결합 (pandas hash_pandas_object 와 동일한 방식, hashes: 컬럼 해시 iterator 로 1 개 컬럼씩 계산)
+    mult = np.uint64(1000003)
+    out = np.full(n_rows, 0x345678, dtype=np.uint64)
+    for i, hashes_ in enumerate(hashes):
+        out ^= hashes_
+        out *= mult
+        mult += np.uint64(82520 + 2 * (n_items - i))
+    return out + np.uint64(97531)
+
+
+def row_hashes(frame, factorize=False):
+    """64-bit hash of every row of frame (컬럼 값 해시 결합, index 제외)"""
+    return combine_hashes((column_hashes(frame.iloc[:, j], factorize) for j in range(frame.shape[1])), frame.shape[0], frame.shape[1])
+
+
+class HashStore:
+    """Multiset of 64-bit hashes that moves to hash-partitioned files on disk once spilled
+
+    values: 해시 별 대표 값 (키 컬럼 값 DataFrame, index 는 전체 데이터 기준 행 순번) 보관 여부 (중복 키 상위 표시용)
+    디스크 기록 후에는 파티션 1 개씩 불러와 집계하므로 최대 메모리 사용량은 전체 해시의 1 / partitions 수준
+    """
+
+    def __init__(self, values=False, partitions=16, path=None):
+        self.values = values
+        self.partitions = partitions
+        self.path = path  # 파티션 파일 폴더 (None: 메모리에만 보관)
+        self.Buffer = []  # [(해시 배열, 대표 값 DataFrame 혹은 None), ...]
+        self.nbytes = 0
+        self.n = 0
+
+    def add(self, hashes, values=None):
+        self.Buffer.append((hashes, values if self.values else None))
+        # 대표 값은 원래 값 객체를 참조하므로 참조 크기만 집계
+        self.nbytes += hashes.nbytes + (int(values.memory_usage(index=False).sum()) if self.values else 0)
+        self.n += hashes.shape[0]
+        if self.path is not None:
+            self.spill()
+
+    def _file(self, p):
+        return os.path.join(self.path, f"{id(self)}_{p:04d}.{'pkl' if self.values else 'bin'}")
+
+    def spill(self, path=None):
+        # 메모리의 해시를 해시값 기준 파티션 파일에 추가 기록 (같은 값은 항상 같은 파티션, 파티션 내 순서는 행 순서 유지)
+        self.path = path or self.path
+        for hashes, values in self.Buffer:
+            part = (hashes % np.uint64(self.partitions)).astype(np.intp)
+            order = np.argsort(part, kind="stable")
+            bounds = np.searchsorted(part[order], np.arange(self.partitions + 1))
+            for p in range(self.partitions):
+                idx = order[bounds[p] : bounds[p + 1]]
+                if idx.shape[0] == 0:
+                    continue
+                with open(self._file(p), "ab") as f:
+                    if self.values:
+                        pickle.dump((hashes[idx], values.iloc[idx]), f, protocol=pickle.HIGHEST_PROTOCOL)
+                    else:
+                        hashes[idx].tofile(f)
+        self.Buffer = []
+        self.nbytes = 0
+
+    def _read(self, p):
+        if not os.path.exists(self._file(p)):
+            return []
+        if not self.values:
+            return [(np.fromfile(self._file(p), dtype=np.uint64), None)]
+        Pieces = []
+        with open(self._file(p), "rb") as f:
+            while True:
+                try:
+                    Pieces.append(pickle.load(f))
+                except EOFError:
+                    return Pieces
+
+    def iter_partitions(self):
+        # 파티션 단위 (해시, 대표 값) 조각 목록 (디스크 기록 전: 메모리 전체를 1 개 파티션으로 처리)
+        if self.path is None:
+            yield self.Buffer
+            return
+        self.spill()
+        for p in range(self.partitions):
+            yield self._read(p)
+
+    def count(self, top_n=0):
+        """Duplicate counts of the stored hashes: (중복 값 수, 중복 행 수, 빈도 상위 top_n 개 중복 값 [(값, 건수), ...])
+
+        중복 행 수: 앞선 행과 같은 값을 갖는 행 수 / 빈도가 같은 값은 최초 등장 순서 기준
+        """
+        n_values, n_rows, Top = 0, 0, []
+        for Pieces in self.iter_partitions():
+            if not Pieces:
+                continue
+            hashes = np.concatenate([hashes_ for hashes_, _ in Pieces])
+            Counts = pd.Series(hashes).value_counts(sort=False)
+            Counts = Counts[Counts.to_numpy() > 1]
+            n_values += Counts.shape[0]
+            n_rows += int(Counts.sum()) - Counts.shape[0]
+            if self.values and top_n > 0 and Counts.shape[0] > 0:
+                Candidates = Counts.nlargest(top_n, keep="first")
+                Top += self._resolve(Pieces, Candidates)
+        Top = sorted(Top, key=lambda x: (-x[2], x[0]))[:top_n]
+        return n_values, n_rows, [(value_, count_) for _, value_, count_ in Top]
+
+    @staticmethod
+    def _resolve(Pieces, Candidates):
+        # 후보 해시값의 최초 등장 행 순번과 대표 값 [(행 순번, 값, 건수), ...]
+        Found = {}
+        targets = Candidates.index.to_numpy(dtype=np.uint64)
+        for hashes, values in Pieces:
+            for j in np.flatnonzero(np.isin(hashes, targets)):
+                hash_ = int(hashes[j])
+                if hash_ not in Found:
+                    Row = [value_.item() if isinstance(value_, np.generic) else value_ for value_ in values.iloc[j].tolist()]
+                    Found[hash_] = (int(values.index[j]), Row[0] if len(Row) == 1 else tuple(Row))
+            if len(Found) == len(targets):
+                break
+        return [(*Found[int(hash_)], int(count_)) for hash_, count_ in Candidates.items()]
+
+
+class DuplicateCounter:
+    """Duplicate rows / duplicate key values of a table, folded chunk by chunk from 64-bit row hashes
+
+    keys: 키 컬럼 목록 (None 혹은 빈 목록: 행 전체 중복만 집계, 키 컬럼 값이 결측인 행은 중복 키 집계에서 제외)
+    max_bytes: 메모리에 유지할 해시(키 컬럼 값 포함) 최대 용량, 초과 시 spill_path(None: 시스템 임시 폴더)에 partitions 개 파일로 나누어 기록
+    해시 충돌 확률은 행 수 n 에 대해 약 n² / 2⁶⁵ (10억 행 기준 3% 미만, 충돌 시 중복으로 집계)
+    """
+
+    def __init__(self, keys=None, top_n=5, max_bytes=256 * 1024**2, partitions=16, spill_path=None):
+        self.keys = list(keys or [])
+        self.top_n = top_n
+        self.max_bytes = max_bytes
+        self.spill_path = spill_path
+        self.Rows = HashStore(partitions=partitions)
+        self.Keys = HashStore(values=True, partitions=partitions) if self.keys else None
+        self.folder = None
+        self.n_rows = 0
+
+    @property
+    def spilled(self):
+        return self.folder is not None
+
+    def _check_keys(self, columns):
+        if self.n_rows == 0 and self.Keys is not None and any(col not in columns for col in self.keys):
+            # 데이터에 없는 키 컬럼 제외 (키 컬럼이 모두 없으면 행 전체 중복만 집계)
+            self.keys = [col for col in self.keys if col in columns]
+            self.Keys = self.Keys if self.keys else None
+
+    def _add_keys(self, hashes, values, start):
+        # 결측값이 없는 키만 저장 (대표 값 index 는 전체 데이터 기준 행 순번)
+        valid = values.notna().all(axis=1).to_numpy()
+        self.Keys.add(hashes[valid], values.set_axis(pd.RangeIndex(start, start + values.shape[0]), axis=0)[valid])
+        self._fit()
+
+    def _add_rows(self, hashes):
+        self.Rows.add(hashes)
+        self._fit()
+
+    def _fit(self):
+        # 메모리 한도 초과 시 이후 해시는 모두 파티션 파일에 기록
+        if self.folder is None and self.Rows.nbytes + (self.Keys.nbytes if self.Keys is not None else 0) > self.max_bytes:
+            if self.spill_path is not None:
+                os.makedirs(self.spill_path, exist_ok=True)
+            self.folder = tempfile.mkdtemp(prefix="qc_duplicates_", dir=self.spill_path)
+            for store in [self.Rows, self.Keys]:
+                if store is not None:
+                    store.spill(self.folder)
+
+    def update(self, chunk):
+        """Fold one chunk of a streamed table (chunk 간 비교를 위해 문자열/범주형은 값 기준 해시)"""
+        self._check_keys(chunk.columns)
+        if self.Keys is not None:
+            self._add_keys(row_hashes(chunk[self.keys]), chunk[self.keys], self.n_rows)
+        self._add_rows(row_hashes(chunk))
+        self.n_rows += chunk.shape[0]
+        return self
+
+    def consume(self, frame, chunk_size=100_000):
+        """Fold an in-memory frame (chunk_size 행 단위로 저장)
+
+        문자열/범주형은 frame 전체 기준 고유값 code 로 해시하고, 행 전체 해시는 중복 행이 될 수 있는 행만 계산
+        (키 값과 숫자/날짜 컬럼 값의 조합이 중복인 행, 해당 컬럼의 해시는 문자열 컬럼보다 계산 비용이 작음)
+        """
+        self._check_keys(frame.columns)
+        n_rows = frame.shape[0]
+        Partial, Covered = [], set()
+        if self.Keys is not None:
+            KeyFrame = frame[self.keys]
+            keys = row_hashes(KeyFrame, factorize=True)
+            for start in range(0, n_rows, chunk_size):
+                self._add_keys(keys[start : start + chunk_size], KeyFrame.iloc[start : start + chunk_size], self.n_rows + start)
+            Partial.append(keys)
+            Covered.update(self.keys)
+        Cheap = [j for j, (col, dtype) in enumerate(frame.dtypes.items()) if dtype.kind in "biufmM" and col not in Covered]
+        if Cheap:
+            Partial.append(row_hashes(frame.iloc[:, Cheap]))
+            Covered.update(frame.columns[Cheap])
+
+        partial = Partial[0] if len(Partial) == 1 else combine_hashes(iter(Partial), n_rows, len(Partial)) if Partial else None
+        if partial is not None and all(col in Covered for col in frame.columns):
+            # 모든 컬럼의 해시를 계산한 경우 (키 컬럼과 숫자/날짜 컬럼만 있는 테이블)
+            rows = partial
+        elif partial is not None:
+            candidates = np.flatnonzero(pd.Series(partial).duplicated(keep=False).to_numpy())
+            rows = row_hashes(frame.iloc[candidates], factorize=True)
+        else:
+            rows = row_hashes(frame, factorize=True)
+        for start in range(0, rows.shape[0], chunk_size):
+            self._add_rows(rows[start : start + chunk_size])
+        self.n_rows += n_rows
+        return self
+
+    def result(self):
+        """Duplicates of the folded rows (디스크에 기록한 파티션 파일은 집계 후 삭제)"""
+        try:
+            _, rows, _ = self.Rows.count()
+            key_values, key_rows, Top = self.Keys.count(self.top_n) if self.Keys is not None else (None, None, None)
+        finally:
+            if self.folder is not None:
+                shutil.rmtree(self.folder, ignore_errors=True)
+        return Duplicates(self.keys or None, self.n_rows, rows, key_values, key_rows, Top)
@@ -0,0 +1,216 @@
+import queue
+import threading
+
+import numpy as np
+
+from NexR_qc.Profiler import Profiler
+
+
+class FastExcelWriter:
+    """Single-pass QC결과서 writer (xlsxwriter, shared formats)
+
+    기존 openpyxl 방식(작성 → load_workbook → 셀 단위 서식 편집 → 재저장)과 동일한 서식의 결과서를
+    값/병합/하이퍼링크/서식을 한 번에 기록하여 생성함
+    """
+
+    # 색상/서식 정의 (기존 openpyxl 서식 편집과 동일)
+    Fill = {"공통": "#bfbfbf", "연속형": "#f4b084", "범주형": "#9bc2e6", "비고": "#bfbfbf"}
+    SubFill = {"공통": "#d9d9d9", "연속형": "#f8cbad", "범주형": "#bdd7ee", "비고": "#d9d9d9"}
+    Remark = {
+        "컬럼 정의서 상의 데이터 타입과 실제 데이터 타입 불일치": "#f79645",
+        "결측값 100%": "#ffff00",
+    }
+
+    def __init__(self, path, logger=None):
+        import xlsxwriter
+
+        self.workbook = xlsxwriter.Workbook(path)
+        self.logger = logger
+        self.formats = self._build_formats()
+        self.table_list = None
+
+    def _build_formats(self):
+        # 서식 객체는 workbook 단위로 1회 생성 후 공유
+        border = {"border": 1}
+        center = {"align": "center", "valign": "vcenter"}
+        add = self.workbook.add_format
+        formats = {
+            "list_header": add({"bg_color": "#ededed", "bold": True, **center, **border}),
+            "list_no": add({"bg_color": "#d8d8d8", "bold": True, **center, **border}),
+            "list_value": add({**center, **border}),
+            "list_link": add({"font_color": "#0563c1", "underline": 1, **center, **border}),
+            "title": add({"bg_color": "#000000", "font_color": "#ffffff", "bold": True, **center, **border}),
+            "label": add({"bg_color": "#bfbfbf", **center, **border}),
+            "sublabel": add({"bg_color": "#d9d9d9", **center, **border}),
+            "value": add({"valign": "vcenter", **border}),
+            "cell": add({"valign": "vcenter", "text_wrap": True, **border}),
+        }
+        for key1 in self.Fill.keys():
+            formats[f"group_{key1}"] = add({"bg_color": self.Fill[key1], **center})
+            formats[f"sub_{key1}"] = add({"bg_color": self.SubFill[key1], **center})
+        for value_, color in self.Remark.items():
+            formats[value_] = add({"bg_color": color, "bold": True, "font_color": "#ff0000", "valign": "vcenter", "text_wrap": True, **border})
+        for value_ in [Profiler.ApproxRemark, Profiler.PreviewRemark]:
+            formats[value_] = add({"bg_color": "#ddebf7", "bold": True, "font_color": "#1f4e78", "valign": "vcenter", "text_wrap": True, **border})
+        return formats
+
+    @staticmethod
+    def _value(value):
+        # pandas to_excel 과 동일하게 결측값은 빈 셀, numpy 스칼라는 python 값, 그 외 객체는 문자열로 기록
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            return None
+        if isinstance(value, np.generic):
+            value = value.item()
+            return None if isinstance(value, float) and np.isnan(value) else value
+        if isinstance(value, (str, int, float, bool)):
+            return value
+        return str(value)
+
+    def _write(self, ws, row, col, value, fmt):
+        value = self._value(value)
+        if value is None:
+            ws.write_blank(row, col, None, fmt)
+        else:
+            ws.write(row, col, value, fmt)
+
+    def reserve_table_list(self):
+        # 테이블 리스트 시트를 첫 번째 시트로 먼저 생성 (값은 write_table_list 에서 마지막에 기록)
+        self.table_list = self.workbook.add_worksheet("테이블 리스트")
+
+    def write_table_list(self, TableList, Files=None):
+        # Step 6-1-a 테이블 리스트 시트 (Files: 테이블 별 분할 결과서 파일명, 지정 시 해당 파일의 시트로 연결하는 색인 시트 작성)
+        ws = self.table_list if self.table_list is not None else self.workbook.add_worksheet("테이블 리스트")
+        Columns = ["No.", "스키마명", "테이블 영문명", "테이블 한글명"] + (["결과서 파일"] if Files is not None else [])
+        for col_i, (col, width) in enumerate(zip(Columns, [13.67, 15, 24.33, 60.83, 36])):
+            ws.set_column(col_i, col_i, width)
+            ws.write(0, col_i, col, self.formats["list_header"])
+
+        for row_i, row in enumerate(TableList.itertuples(index=False), start=1):
+            self._write(ws, row_i, 0, row[0], self.formats["list_no"])
+            self._write(ws, row_i, 1, row[1], self.formats["list_value"])
+            link = f"internal:'{row[4]}'!A1" if Files is None else f"external:{Files[row_i - 1]}#'{row[4]}'!A1"
+            ws.write_url(row_i, 2, link, self.formats["list_link"], string=str(row[2]))
+            self._write(ws, row_i, 3, row[3], self.formats["list_value"])
+            if Files is not None:
+                ws.write_url(row_i, 4, f"external:{Files[row_i - 1]}", self.formats["list_link"], string=Files[row_i - 1])
+
+    def write_table(self, sheet_name, Top, Bottom, RelCategory):
+        # Step 6-1-b 테이블 별 QC 결과서 시트
+        ws = self.workbook.add_worksheet(sheet_name)
+        f = self.formats
+
+        # 테이블 정보 (1 ~ 7행, 중복 검사 결과가 있는 경우 중복 정보 항목만큼 추가)
+        ws.merge_range(0, 0, 0, 1, "테이블 정보", f["title"])
+        TopValues = list(Top.iloc[:, 0])
+        TopIndex = list(Top.index)
+        for row_i, (key1, key2) in enumerate(TopIndex, start=1):
+            if key1 != key2:
+                # 테이블 상세/중복 정보 항목 (같은 key1 의 첫 번째 행에서 병합)
+                if row_i == 1 or TopIndex[row_i - 2][0] != key1:
+                    n_rows = sum(1 for key1_, _ in TopIndex[row_i - 1 :] if key1_ == key1)
+                    if n_rows > 1:
+                        ws.merge_range(row_i, 0, row_i + n_rows - 1, 0, key1, f["label"])
+                    else:
+                        ws.write(row_i, 0, key1, f["label"])
+                ws.write(row_i, 1, key2, f["sublabel"])
+            else:
+                ws.merge_range(row_i, 0, row_i, 1, key1, f["label"])
+            self._write(ws, row_i, 2, TopValues[row_i - 1], f["value"])
+
+        # 컬럼 정보 (9 ~ 11행, 테이블 정보 항목이 추가된 경우 그만큼 아래로 이동)
+        start = len(TopIndex) + 2
+        ws.merge_range(start, 0, start, 1, "컬럼 정보", f["title"])
+        col_i = 0
+        for key1, key2s in RelCategory.items():
+            if len(key2s) > 1:
+                ws.merge_range(start + 1, col_i, start + 1, col_i + len(key2s) - 1, key1, f[f"group_{key1}"])
+            else:
+                ws.write(start + 1, col_i, key1, f[f"group_{key1}"])
+            col_i += len(key2s)
+        col_i = 0
+        for key1, key2s in RelCategory.items():
+            for key2 in key2s:
+                ws.write(start + 2, col_i, key2, f[f"sub_{key1}"])
+                col_i += 1
+
+        # 컬럼별 QC 결과 (12행 ~)
+        for row_i, row in enumerate(Bottom.itertuples(index=False), start=start + 3):
+            for col_i, value in enumerate(row):
+                self._write(ws, row_i, col_i, value, f[value] if isinstance(value, str) and (value in self.Remark or value in [Profiler.ApproxRemark, Profiler.PreviewRemark]) else f["cell"])
+
+    def close(self):
+        self.workbook.close()
+
+
+def write_shard(path, TableList, Tables, RelCategory):
+    """Write one shard of the QC결과서 (its own 테이블 리스트 + table sheets) as an independent workbook
+
+    Tables: [(시트명, Top, Bottom), ...], 다른 분할 파일과 공유하는 상태가 없으므로 process/thread worker 에서 병렬 작성 가능
+    """
+    writer = FastExcelWriter(path)
+    writer.write_table_list(TableList)
+    for sheet_name, Top, Bottom in Tables:
+        writer.write_table(sheet_name, Top, Bottom, RelCategory)
+    writer.close()
+    return path
+
+
+class BackgroundExcelWriter:
+    """Pipelined QC결과서 writer: table sheets are built and written on a background thread while the next table is profiled
+
+    max_pending: 작성 대기 가능한 최대 테이블 수 (초과 시 submit 이 대기하여 메모리 사용량 제한)
+    테이블 리스트 시트는 첫 번째 시트로 생성 후 close 시점에 기록
+    """
+
+    def __init__(self, path, RelCategory, max_pending=4, logger=None):
+        self.writer = FastExcelWriter(path, logger=logger)
+        self.writer.reserve_table_list()
+        self.RelCategory = RelCategory
+        self.logger = logger
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.error = None
+        self.closed = False
+        self.written = 0
+        self.thread = threading.Thread(target=self._work, name="BackgroundExcelWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, sheet_name, build):
+        # build: 작성 시점에 (Top, Bottom) 을 반환하는 함수 (결과표 구성도 background thread 에서 수행)
+        if self.error is not None:
+            # 이전 시트 작성 중 오류 발생 시 남은 테이블은 요청하지 않고 작성된 시트까지 저장 후 오류 발생
+            self.close()
+        self.queue.put((sheet_name, build))
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                # 오류 발생 이후 요청은 작성하지 않고 소비만 함 (submit 대기 방지)
+                continue
+            sheet_name, build = item
+            try:
+                Top, Bottom = build()
+                self.writer.write_table(sheet_name, Top, Bottom, self.RelCategory)
+                self.written += 1
+                if self.logger and self.written % 10 == 0:
+                    self.logger.info(f"{self.written} 번째 엑셀 시트 생성 완료 (background)")
+            except Exception as e:
+                self.error = e
+
+    def close(self, TableList=None):
+        # 대기 중인 시트 작성 완료 후 테이블 리스트 시트 기록 및 저장 (작성 오류가 있는 경우 workbook 을 닫은 후 오류 발생)
+        if self.closed:
+            if self.error is not None:
+                raise self.error
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        try:
+            if self.error is not None:
+                raise self.error
+            self.writer.write_table_list(TableList)
+        finally:
+            self.writer.close()
@@ -0,0 +1,119 @@
+import datetime
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def jsonable(value):
+    # numpy 스칼라는 python 값, 날짜/시간은 ISO 문자열, NaN 은 None, dict key 는 문자열로 변환
+    if isinstance(value, dict):
+        return {str(jsonable(key_)): jsonable(value_) for key_, value_ in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonable(value_) for value_ in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (pd.Timestamp, datetime.datetime, datetime.date, np.datetime64)):
+        return None if pd.isna(value) else pd.Timestamp(value).isoformat()
+    if isinstance(value, (pd.Timedelta, datetime.timedelta)):
+        return str(value)
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value is pd.NaT or value is pd.NA:
+        return None
+    return value
+
+
+def flat_columns(Tables):
+    """Per-column QC results of every table in one flat frame
+
+    Tables: [(테이블 정보 dict, ResultTable), ...] (테이블 정보 항목이 컬럼 결과 앞에 추가됨)
+    """
+    Records = [{**Table, **record} for Table, Result in Tables for record in Result.to_records()]
+    frame = pd.DataFrame(Records)
+    # 건수 항목은 결측값이 있어도 정수 유지 (미리보기 추정값 등 소수가 있는 경우 실수)
+    for key2 in ["null 개수", "적재건수", "범주수", "정의된 범주 외 수"]:
+        if key2 in frame.columns:
+            try:
+                frame[key2] = frame[key2].astype("Int64")
+            except (TypeError, ValueError):
+                pass
+    return frame
+
+
+class Exporter:
+    """Writes the 테이블 리스트 / 컬럼 결과 of a QC run in a flat schema of raw values (기계 판독용)
+
+    <stem>_tables<suffix>, <stem>_columns<suffix> 파일 생성
+    """
+
+    name = None
+    suffix = None
+
+    def __init__(self, folder, stem, logger=None):
+        self.folder = folder
+        self.stem = stem
+        self.logger = logger
+
+    def export(self, TableFrame, ColumnFrame):
+        Paths = []
+        for part, frame in [("tables", TableFrame), ("columns", ColumnFrame)]:
+            path = os.path.join(self.folder, f"{self.stem}_{part}{self.suffix}")
+            self.write(frame, path)
+            Paths.append(path)
+        return Paths
+
+    def write(self, frame, path):
+        raise NotImplementedError
+
+    @staticmethod
+    def encode_nested(frame):
+        # list/dict 값(범주, %범주, 최빈값 등)은 JSON 문자열로 변환
+        frame = frame.copy()
+        for col in frame.columns:
+            if frame[col].dtype == object and frame[col].map(lambda x: isinstance(x, (list, dict))).any():
+                frame[col] = frame[col].map(lambda x: json.dumps(jsonable(x), ensure_ascii=False) if isinstance(x, (list, dict)) else x)
+        return frame
+
+
+class CsvExporter(Exporter):
+    name = "csv"
+    suffix = ".csv"
+
+    def write(self, frame, path):
+        self.encode_nested(frame).to_csv(path, index=False, encoding="utf-8-sig")
+
+
+class JsonLinesExporter(Exporter):
+    name = "jsonl"
+    suffix = ".jsonl"
+
+    def write(self, frame, path):
+        # list/dict 값은 JSON 배열/객체로 유지
+        with open(path, "w", encoding="utf-8") as f:
+            for record in frame.to_dict(orient="records"):
+                f.write(json.dumps(jsonable(record), ensure_ascii=False) + "\n")
+
+
+class ParquetExporter(Exporter):
+    name = "parquet"
+    suffix = ".parquet"
+
+    def write(self, frame, path):
+        # 숫자/문자 등이 섞인 항목(최솟값/최댓값 등)은 문자열로 변환 (parquet 컬럼은 단일 타입, pyarrow 필요)
+        frame = self.encode_nested(frame)
+        for col in frame.columns:
+            if frame[col].dtype == object:
+                values = frame[col].map(jsonable)
+                types = {type(value) for value in values if value is not None}
+                if types and types <= {int, float}:
+                    frame[col] = pd.to_numeric(values)
+                elif types and types != {str} and types != {bool}:
+                    frame[col] = values.map(lambda x: None if x is None else str(x))
+        frame.to_parquet(path, index=False)
+
+
+# outputFormats 설정값 별 내보내기 방식 (excel 은 QualityCheck 결과서 작성 사용)
+Exporters = {cls.name: cls for cls in [ParquetExporter, JsonLinesExporter, CsvExporter]}
@@ -0,0 +1,157 @@
+import pandas as pd
+
+
+class FrequencyTable:
+    """Hash-based frequency table of the non-null values of a column
+
+    Counts (pd.Series): value(index) - count(value), 최초 등장 순서로 정렬된 value_counts 결과
+    """
+
+    approximate = False
+    complete = True  # 모든 범주의 빈도 보유 여부
+
+    def __init__(self, Counts):
+        self.Counts = Counts
+        self.total = int(Counts.sum())
+        self._lookup = None
+        self._modes = None
+
+    @classmethod
+    def from_series(cls, series):
+        # 결측값을 제외한 value_counts 1회 계산 (최초 등장 순서 유지)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # 범주형 dtype 은 미관측 범주를 제외하기 위해 code 기준으로 집계
+            codes = series.cat.codes
+            counts_ = codes[codes >= 0].value_counts(sort=False)
+            index = pd.CategoricalIndex(pd.Categorical.from_codes(counts_.index.to_numpy(), dtype=series.dtype))
+            return cls(pd.Series(counts_.to_numpy(), index=index))
+        return cls(series.value_counts(dropna=True, sort=False))
+
+    def __len__(self):
+        return self.Counts.shape[0]
+
+    @property
+    def values(self):
+        return self.Counts.index.tolist()
+
+    @property
+    def max_count(self):
+        return int(self.Counts.max()) if len(self) > 0 else 0
+
+    def count(self, value):
+        # 값 별 빈도 (dict 조회, O(1))
+        if self._lookup is None:
+            self._lookup = dict(zip(self.Counts.index.tolist(), self.Counts.tolist()))
+        return self._lookup.get(value, 0)
+
+    def ratio(self, value):
+        return self.count(value) / self.total
+
+    def head(self, k):
+        # 최초 등장 순서 기준 앞쪽 k개 (value, count)
+        return list(zip(self.Counts.index[:k].tolist(), self.Counts.iloc[:k].tolist()))
+
+    def tail(self, k):
+        # 최초 등장 순서 기준 뒤쪽 k개 (value, count)
+        return list(zip(self.Counts.index[-k:].tolist(), self.Counts.iloc[-k:].tolist()))
+
+    def top(self, k):
+        # 빈도 기준 상위 k개 (value, count)
+        Top = self.Counts.nlargest(k, keep="first")
+        return list(zip(Top.index.tolist(), Top.tolist()))
+
+    def remainder(self, values):
+        # 주어진 값 이외의 값("그 외")이 차지하는 건수
+        return self.total - sum(self.count(value) for value in values)
+
+    def modes(self):
+        # 최빈값 (pandas mode 와 동일한 정렬 규칙 적용, 최초 호출 시 1회 계산)
+        if self._modes is None:
+            if len(self) > 0:
+                self._modes = pd.Series(self.Counts.index[self.Counts.to_numpy() == self.max_count]).mode(dropna=True).values.tolist()
+            else:
+                self._modes = []
+        return self._modes
+
+    def undefined(self, code_values, values=None):
+        # 코드정의서에 정의된 코드값 이외의 값 (values 미전달 시 전체 범주 대상, 범주 index 기준 isin 1회 연산)
+        if values is not None:
+            CodeSet = set(code_values)
+            return [val for val in values if val not in CodeSet]
+        return self.Counts.index[~self.Counts.index.isin(list(code_values))].tolist()
+
+    def undefined_count(self, code_values):
+        # 코드정의서에 정의된 코드값 이외의 값을 가진 행 수
+        return int(self.Counts.to_numpy()[~self.Counts.index.isin(list(code_values))].sum())
+
+
+class SketchFrequencyTable(FrequencyTable):
+    """Approximate frequency table built from sketches (HyperLogLog 범주수, Misra-Gries 최빈값)
+
+    head: 최초 등장 범주와 정확한 빈도 [(value, count), ...]
+    tail: 마지막 등장 범주 [value, ...]
+    top: 빈도 상위 범주와 근사 빈도 [(value, count), ...]
+    """
+
+    approximate = True
+    complete = False
+
+    def __init__(self, total, n_unique, head, tail, top):
+        self.total = total
+        self.n_unique = max(n_unique, len(head))
+        self._head = head
+        self._tail = tail
+        self._top = top
+        self._lookup = dict(top)
+        self._lookup.update(dict(head))
+        self._modes = None
+
+    def __len__(self):
+        return self.n_unique
+
+    @property
+    def values(self):
+        return [value_ for value_, _ in self._head] + [value_ for value_ in self._tail if value_ not in dict(self._head)]
+
+    @property
+    def max_count(self):
+        # head 범주는 정확한 빈도가 sketch 추정 빈도보다 우선함
+        return max(list(self._lookup.values()) + [0])
+
+    def count(self, value):
+        return self._lookup.get(value, 0)
+
+    def head(self, k):
+        return self._head[:k]
+
+    def tail(self, k):
+        return [(value_, self.count(value_)) for value_ in self._tail[-k:]]
+
+    def top(self, k):
+        return sorted(self._lookup.items(), key=lambda x: -x[1])[:k]
+
+    def modes(self):
+        if self._modes is None:
+            Modes = [value_ for value_, count_ in self._lookup.items() if count_ == self.max_count and count_ > 0]
+            self._modes = pd.Series(Modes, dtype=object).mode(dropna=True).values.tolist() if Modes else []
+        return self._modes
+
+    def undefined(self, code_values, values=None):
+        # 보유한 범주(앞/뒤 범주, 빈도 상위 범주) 중 코드값 이외의 값
+        if values is None:
+            Known = set(self.values)
+            values = self.values + [value_ for value_ in self._lookup if value_ not in Known]
+        return super().undefined(code_values, values=values)
+
+    def undefined_count(self, code_values):
+        # 보유한 범주 기준 행 수 (최소 건수)
+        return sum(self.count(value_) for value_ in self.undefined(code_values))
+
+
+class TopKFrequencyTable(SketchFrequencyTable):
+    """Frequency table of a high-cardinality column holding only its first/last and top-k categories with exact counts (DB GROUP BY 조회 결과)
+
+    범주수와 조회한 범주의 빈도는 모두 정확한 값 (근사값 표시 없음)
+    """
+
+    approximate = False
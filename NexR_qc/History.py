@@ -0,0 +1,140 @@
+import json
+import numbers
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.Exporter import jsonable
+
+
+class HistoryStore:
+    """Embedded SQLite store of per-run table/column QC metrics with drift detection between runs
+
+    runs(run_id, run_time) / table_metrics(run_id, table_name, ...) / column_metrics(run_id, table_name, column_name, ...)
+    테이블·컬럼·실행 시각 기준 index 를 사용하여 실행 이력이 많아도 조회 시간이 일정하게 유지됨
+    """
+
+    # 컬럼 결과 항목 → column_metrics 컬럼 (REAL: 숫자, TEXT: 그 외 값은 JSON 문자열)
+    ColumnMetrics = {
+        "컬럼 한글명": ("column_name_kr", "TEXT"),
+        "데이터 타입": ("dtype", "TEXT"),
+        "null 개수": ("null_count", "REAL"),
+        "%null": ("null_ratio", "REAL"),
+        "적재건수": ("valid_count", "REAL"),
+        "%적재건수": ("valid_ratio", "REAL"),
+        "최솟값": ("min", "TEXT"),
+        "최댓값": ("max", "TEXT"),
+        "평균": ("mean", "REAL"),
+        "표준편차": ("std", "REAL"),
+        "중위수": ("median", "REAL"),
+        "범주수": ("distinct_count", "REAL"),
+        "정의된 범주 외 수": ("undefined_count", "REAL"),
+        "최빈값": ("mode", "TEXT"),
+        "비고": ("remark", "TEXT"),
+        "근사 항목": ("approximate", "TEXT"),
+    }
+    TableMetrics = {"스키마명": ("schema_name", "TEXT"), "테이블 한글명": ("table_name_kr", "TEXT"), "행 수": ("row_count", "REAL"), "컬럼 수": ("column_count", "REAL")}
+
+    # 변동 감지 기본 기준값
+    # null_ratio: %null 차이 / distinct_count: 범주수 변화율 / mean: 평균 차이 (직전 표준편차 대비) / std: 표준편차 변화율 / undefined_count: 정의된 범주 외 수 증가량
+    DefaultThresholds = {"null_ratio": 0.05, "distinct_count": 0.2, "mean": 0.5, "std": 0.2, "undefined_count": 0}
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self._create()
+
+    def _create(self):
+        ColumnFields = ", ".join(f"{field} {type_}" for field, type_ in self.ColumnMetrics.values())
+        TableFields = ", ".join(f"{field} {type_}" for field, type_ in self.TableMetrics.values())
+        with self.conn:
+            self.conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS runs (run_id INTEGER PRIMARY KEY AUTOINCREMENT, run_time TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS table_metrics (run_id INTEGER NOT NULL REFERENCES runs(run_id), table_name TEXT NOT NULL, {TableFields});
+                CREATE TABLE IF NOT EXISTS column_metrics (run_id INTEGER NOT NULL REFERENCES runs(run_id), table_name TEXT NOT NULL, column_name TEXT NOT NULL, {ColumnFields});
+                CREATE INDEX IF NOT EXISTS runs_time ON runs (run_time);
+                CREATE UNIQUE INDEX IF NOT EXISTS table_metrics_key ON table_metrics (table_name, run_id);
+                CREATE UNIQUE INDEX IF NOT EXISTS column_metrics_key ON column_metrics (table_name, column_name, run_id);
+                CREATE INDEX IF NOT EXISTS column_metrics_run ON column_metrics (run_id, table_name);
+                """
+            )
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _value(value, type_):
+        # REAL 항목은 숫자만 저장 (날짜/시간 등은 None), TEXT 항목은 문자열 외 값을 JSON 문자열로 저장
+        value = jsonable(value)
+        if type_ == "REAL":
+            return float(value) if isinstance(value, numbers.Number) and not isinstance(value, bool) else None
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value, ensure_ascii=False)
+
+    def append(self, run_time, TableFrame, ColumnFrame):
+        """Append one run (flat_tables / flat_columns 결과) and return its run_id"""
+        with self.conn:
+            run_id = self.conn.execute("INSERT INTO runs (run_time) VALUES (?)", (run_time,)).lastrowid
+            TableRows = [(run_id, record["테이블 영문명"], *[self._value(record.get(key2), type_) for key2, (_, type_) in self.TableMetrics.items()]) for record in TableFrame.to_dict(orient="records")]
+            ColumnRows = [(run_id, record["테이블 영문명"], record["컬럼 영문명"], *[self._value(record.get(key2), type_) for key2, (_, type_) in self.ColumnMetrics.items()]) for record in ColumnFrame.to_dict(orient="records")]
+            TableFields = ", ".join(field for field, _ in self.TableMetrics.values())
+            ColumnFields = ", ".join(field for field, _ in self.ColumnMetrics.values())
+            self.conn.executemany(f"INSERT INTO table_metrics (run_id, table_name, {TableFields}) VALUES ({', '.join(['?'] * (len(self.TableMetrics) + 2))})", TableRows)
+            self.conn.executemany(f"INSERT INTO column_metrics (run_id, table_name, column_name, {ColumnFields}) VALUES ({', '.join(['?'] * (len(self.ColumnMetrics) + 3))})", ColumnRows)
+        return run_id
+
+    def history(self, table_name, column_name=None, limit=None):
+        """Metrics of a table (or one column) over runs, latest first"""
+        query = "SELECT r.run_time, c.* FROM column_metrics c JOIN runs r ON r.run_id = c.run_id WHERE c.table_name = ?"
+        params = [table_name]
+        if column_name is not None:
+            query += " AND c.column_name = ?"
+            params.append(column_name)
+        query += " ORDER BY c.run_id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return pd.read_sql_query(query, self.conn, params=params)
+
+    def previous_run(self, table_name, run_id):
+        # 해당 테이블이 포함된 직전 실행 (없으면 None)
+        row = self.conn.execute("SELECT MAX(run_id) FROM table_metrics WHERE table_name = ? AND run_id < ?", (table_name, run_id)).fetchone()
+        return row[0]
+
+    def _columns(self, run_id, table_name):
+        return pd.read_sql_query("SELECT * FROM column_metrics WHERE run_id = ? AND table_name = ?", self.conn, params=[run_id, table_name])
+
+    def drift(self, run_id, thresholds=None):
+        """Columns of run_id whose metrics moved beyond thresholds since the previous run of the same table
+
+        반환: DataFrame (테이블 영문명, 컬럼 영문명, 항목, 직전 실행 시각, 직전 값, 현재 값, 변화량, 기준값)
+        """
+        thresholds = {**self.DefaultThresholds, **(thresholds or {})}
+        Label = {field: key2 for key2, (field, _) in self.ColumnMetrics.items()}
+        Rows = []
+        for (table_name,) in self.conn.execute("SELECT table_name FROM table_metrics WHERE run_id = ?", (run_id,)).fetchall():
+            previous_id = self.previous_run(table_name, run_id)
+            if previous_id is None:
+                continue
+            frame = self._columns(run_id, table_name).merge(self._columns(previous_id, table_name), on="column_name", suffixes=("", "_prev"))
+            if frame.empty:
+                continue
+            previous_time = self.conn.execute("SELECT run_time FROM runs WHERE run_id = ?", (previous_id,)).fetchone()[0]
+            Change = {
+                "null_ratio": frame["null_ratio"] - frame["null_ratio_prev"],
+                "distinct_count": (frame["distinct_count"] - frame["distinct_count_prev"]) / frame["distinct_count_prev"].where(frame["distinct_count_prev"] > 0),
+                "mean": (frame["mean"] - frame["mean_prev"]) / frame["std_prev"].where(frame["std_prev"] > 0),
+                "std": (frame["std"] - frame["std_prev"]) / frame["std_prev"].where(frame["std_prev"] > 0),
+                "undefined_count": frame["undefined_count"] - frame["undefined_count_prev"],
+            }
+            for metric, change in Change.items():
+                # 정의된 범주 외 수는 증가한 경우만, 그 외 항목은 증감 모두 감지
+                moved = change > thresholds[metric] if metric == "undefined_count" else change.abs() > thresholds[metric]
+                for idx in np.flatnonzero(moved.fillna(False).to_numpy()):
+                    Rows.append([table_name, frame["column_name"].iat[idx], Label[metric], previous_time, frame[f"{metric}_prev"].iat[idx], frame[metric].iat[idx], change.iat[idx], thresholds[metric]])
+        return pd.DataFrame(Rows, columns=["테이블 영문명", "컬럼 영문명", "항목", "직전 실행 시각", "직전 값", "현재 값", "변화량", "기준값"])
@@ -0,0 +1,39 @@
+import gzip
+import hashlib
+import os
+import pickle
+
+
+class StateStore:
+    """Persisted mergeable table state (TableAccumulator) of append-only tables
+
+    state: {"DATA": TableAccumulator, "Applied": 반영된 원천 데이터 fingerprint 목록, "Result": 직전 QC 결과}
+    """
+
+    def __init__(self, path):
+        self.path = path  # 상태 폴더는 첫 저장 시 생성
+
+    def _file(self, data_name):
+        # 테이블명에 파일명으로 사용할 수 없는 문자가 포함될 수 있으므로 해시값 사용
+        return os.path.join(self.path, f"{hashlib.blake2b(data_name.encode(), digest_size=16).hexdigest()}.pkl.gz")
+
+    def load(self, data_name):
+        try:
+            with gzip.open(self._file(data_name), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, data_name, state):
+        os.makedirs(self.path, exist_ok=True)
+        file = self._file(data_name)
+        with gzip.open(f"{file}.tmp", "wb", compresslevel=6) as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{file}.tmp", file)
+
+
+def changed_columns(Previous, Result):
+    # 직전 결과 대비 결과서 값이 달라진 컬럼 (신규 컬럼 포함, Result: ResultTable 혹은 이전 버전에서 저장된 dict 형태 결과)
+    Previous, Result = [value.to_dict() if hasattr(value, "to_dict") else (value or {}) for value in [Previous, Result]]
+    PreviousDict = {entry["공통"]["컬럼 영문명"]: repr(entry) for entry in Previous.values()}
+    return [entry["공통"]["컬럼 영문명"] for entry in Result.values() if PreviousDict.get(entry["공통"]["컬럼 영문명"]) != repr(entry)]
@@ -0,0 +1,131 @@
+import importlib.util
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+DefaultNaList = ["?", "na", "null", "Null", "NULL", " ", "[NULL]"]
+
+ReadFunc = {".csv": pd.read_csv, ".xlsx": pd.read_excel, ".parquet": pd.read_parquet, ".feather": pd.read_feather}
+
+
+def optimize_frame(data, category_ratio=0.5, pyarrow_strings=True):
+    """Shrink a frame in place of its columns (정수 downcast, 저카디널리티 문자열 → category, 그 외 문자열 → pyarrow string)
+
+    실수형은 평균/표준편차 등 QC 결과 값이 달라지지 않도록 float64 유지
+    """
+    use_pyarrow = pyarrow_strings and importlib.util.find_spec("pyarrow") is not None
+    for col in data.columns:
+        series = data[col]
+        if series.dtype.kind in "iu":
+            data[col] = pd.to_numeric(series, downcast="integer" if series.dtype.kind == "i" else "unsigned")
+        elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+            n_valid = int(series.notna().sum())
+            if n_valid == 0:
+                continue
+            if series.nunique(dropna=True) <= category_ratio * n_valid:
+                data[col] = series.astype("category")
+            elif use_pyarrow and series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) == "string":
+                data[col] = series.astype("string[pyarrow]")
+    return data
+
+
+def read_raw(path, naList, columns=None, csv_engine="c"):
+    # 형식별 읽기 (columns: 불러올 컬럼 목록, 미입력 시 전체 컬럼)
+    ext = os.path.splitext(path)[-1].lower()
+    if ext == ".csv":
+        # csv_engine: c (기본값) / pyarrow (멀티스레드, 타입 추론 방식이 달라 결과서 데이터 타입이 달라질 수 있음) / auto (pyarrow 설치 시 pyarrow)
+        engine = ("pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c") if csv_engine == "auto" else csv_engine
+        return pd.read_csv(path, na_values=naList, usecols=columns, engine=engine)
+    if ext == ".xlsx":
+        # pandas 는 openpyxl read-only 모드로 시트를 읽음
+        return pd.read_excel(path, na_values=naList, usecols=columns)
+    # parquet/feather: 필요한 컬럼만 읽고, 타입이 보존되는 형식이므로 결측값은 문자열 컬럼만 값 치환으로 처리 (숫자/날짜 컬럼은 복사하지 않음)
+    data = ReadFunc[ext](path, columns=columns)
+    Text = [col for col in data.columns if data.dtypes[col] == object or isinstance(data.dtypes[col], pd.StringDtype)]
+    if Text:
+        data[Text] = data[Text].replace(naList, np.nan)
+    return data
+
+
+def read_table(path, naList=None, category_ratio=0.5, pyarrow_strings=True, columns=None, csv_engine="c"):
+    """Read a csv/xlsx/parquet/feather file with naList applied at read time and shrink its dtypes
+
+    data.attrs["ingest"]: {"naList": 적용된 결측값 목록, "dtypes": {컬럼: (원본 dtype 명, 최적화 후 dtype 명)}, "bytes": (최적화 전, 최적화 후)}
+    """
+    naList = DefaultNaList if naList is None else naList
+    data = read_raw(path, naList, columns=columns, csv_engine=csv_engine)
+    dtypes = {col: data.dtypes[col].name for col in data.columns}
+    bytes_before = int(data.memory_usage(index=True, deep=True).sum())
+    optimize_frame(data, category_ratio=category_ratio, pyarrow_strings=pyarrow_strings)
+    data.attrs["ingest"] = {
+        "naList": list(naList),
+        "dtypes": {col: (dtypes[col], data.dtypes[col].name) for col in data.columns},
+        "bytes": (bytes_before, int(data.memory_usage(index=True, deep=True).sum())),
+    }
+    return data
+
+
+def discover_files(folder):
+    # 하위 폴더를 포함한 데이터 파일 탐색 ({파일명 대문자: 파일 경로}, 동일 테이블명이 여러 개인 경우 먼저 탐색된 파일 사용)
+    PathDict, Duplicated = {}, []
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for file in sorted(files):
+            if file.startswith(".") or os.path.splitext(file)[-1].lower() not in ReadFunc:
+                continue
+            data_name = os.path.splitext(file)[0].upper()
+            if data_name in PathDict:
+                Duplicated.append(os.path.join(root, file))
+                continue
+            PathDict[data_name] = os.path.join(root, file)
+    return PathDict, Duplicated
+
+
+def _load(path, kwargs):
+    # 파일 단위 읽기 (실패 시 오류 내용을 반환하여 나머지 파일은 계속 처리)
+    start = time.perf_counter()
+    try:
+        return read_table(path, **kwargs), time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+def load_folder(folder, naList=None, stream=False, workers=1, executor="thread", columns=None, logger=None, **kwargs):
+    """Load every data file under folder into a DataDict (stream=True: 파일 경로를 전달하여 스트리밍 모드로 처리)
+
+    workers: 동시에 읽을 파일 수, executor: thread (ThreadPoolExecutor) / process (ProcessPoolExecutor)
+    columns: {테이블명: [불러올 컬럼, ...]} (csv usecols / parquet, feather column projection)
+    """
+    PathDict, Duplicated = discover_files(folder)
+    for path in Duplicated:
+        if logger:
+            logger.error(f"동일한 테이블명의 파일이 이미 존재하여 제외합니다: {path}")
+    if stream:
+        return dict(PathDict)
+
+    columns = columns or {}
+    DataNames = list(PathDict.keys())
+    Kwargs = [{"naList": naList, "columns": columns.get(data_name), **kwargs} for data_name in DataNames]
+    if workers > 1 and len(DataNames) > 1:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # 동시 불러오기 시에만 불러옴
+
+        Executor = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with Executor(max_workers=workers) as pool:
+            Outputs = list(pool.map(_load, [PathDict[data_name] for data_name in DataNames], Kwargs))
+    else:
+        Outputs = [_load(PathDict[data_name], kwargs_) for data_name, kwargs_ in zip(DataNames, Kwargs)]
+
+    DataDict = {}
+    for data_name, (data, elapsed, error) in zip(DataNames, Outputs):
+        if error is not None:
+            if logger:
+                logger.error(f"[{data_name}] 불러오기 실패 ({PathDict[data_name]}): {error}")
+            continue
+        DataDict[data_name] = data
+        if logger:
+            logger.info(f"[{data_name}] 불러오기 완료 ({elapsed:,.2f} 초, {data.shape[0]:,} 행 x {data.shape[1]:,} 열, {os.path.getsize(PathDict[data_name]) / 1024**2:,.1f} MB, {PathDict[data_name]})")
+    if logger:
+        logger.info(f"총 {len(DataDict):,} 개 데이터 파일 불러오기 완료 (소요시간 합계 {sum(elapsed for _, elapsed, _ in Outputs):,.2f} 초, worker {workers} 개)")
+    return DataDict
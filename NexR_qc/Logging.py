@@ -1,42 +1,118 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 from datetime import datetime
 
+LogLevels = {"DEBUG": logging.DEBUG, "INFO": logging.INFO, "WARNING": logging.WARNING, "ERROR": logging.ERROR}
+AnsiCode = re.compile(r"\x1b\[[0-9;]*m")  # 콘솔 색상 코드 (JSON 로그에서 제거)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, source (+ 호출 시 전달한 항목)"""
+
+    def format(self, record):
+        Record = {"time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"), "level": record.levelname, "logger": record.name, "message": AnsiCode.sub("", record.getMessage()), "source": getattr(record, "source", None)}
+        Record.update(getattr(record, "fields", None) or {})
+        return json.dumps(Record, ensure_ascii=False, default=str)
+
+
+class FileHandler(logging.FileHandler):
+    """FileHandler that creates the log file (and its folder) when the first record is written"""
+
+    def __init__(self, path):
+        super().__init__(path, encoding="utf-8", delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 
 # Logger 정의
 class Logger:
-    def __init__(self, file=sys.argv[0], proc_name=None, log_folder_path=None, save=True):
+    """Console/file logger whose handlers run on a background thread (QueueHandler → QueueListener)
+
+    호출한 thread 는 레코드를 queue 에 넣기만 하므로 콘솔/파일 I/O 를 기다리지 않음 (종료 시 close 로 남은 레코드 기록)
+    level: 출력 수준 (DEBUG: 컬럼 단위 메시지 포함, INFO: 테이블 단위 요약), json_format: 콘솔/로그 파일을 JSON Lines 로 기록
+    인스턴스마다 별도 handler 와 로그 파일을 사용 (같은 로그 파일에 기록하려면 Logger 인스턴스를 공유)
+    """
+
+    def __init__(self, file=None, proc_name=None, log_folder_path=None, save=True, level="INFO", json_format=False):
         self.today = datetime.today().strftime(format="%Y%m%d")
         self.created_time = datetime.now().strftime(format="%Y%m%d_%H%M%S")
-        self.file_name = os.path.basename(file)
+        self.file_name = os.path.basename(file or sys.argv[0])
         self.colorSetting = {"grey": "\x1b[38;20m", "blue": "\033[34m", "green": "\033[32m", "yellow": "\x1b[33;20m", "red": "\x1b[31;20m", "bold_red": "\x1b[31;1m", "reset": "\x1b[0m"}
+        self.json_format = json_format
+
+        name = proc_name or self.file_name
+        self.log_path = os.path.join(log_folder_path, f"{name}_{self.created_time}.log") if save and log_folder_path else None
+        self.logger = logging.Logger(name)  # logging 전역 등록 없이 생성 (같은 이름의 Logger 간 handler 공유 방지)
+        self.logger.setLevel(LogLevels.get(str(level).upper(), logging.INFO))
+
+        formatter = JsonFormatter() if json_format else logging.Formatter("(%(asctime)s) [%(levelname)s] %(message)s (at %(source)s)")
+        Handlers = [logging.StreamHandler()]  # StreamHandler
+        if self.log_path is not None:
+            Handlers.append(FileHandler(self.log_path))  # FileHandler (첫 로그 기록 시 파일 생성)
+        for handler in Handlers:
+            handler.setFormatter(formatter)
+
+        self.queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(self.queue))
+        self.listener = logging.handlers.QueueListener(self.queue, *Handlers)
+        self.listener.start()
+        self.active = True
+        atexit.register(self.close)
+
+    def _log(self, level, value, Fields):
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, str(value), extra={"source": self.file_name, "fields": Fields})
+
+    def debug(self, value, **Fields):
+        self._log(logging.DEBUG, value, Fields)
+
+    def info(self, value, **Fields):
+        self._log(logging.INFO, value, Fields)
+
+    def error(self, value, **Fields):
+        self._log(logging.ERROR, f"{self.colorSetting['red']}{str(value)}{self.colorSetting['reset']}", Fields)
+
+    def flush(self):
+        # queue 에 남은 레코드를 모두 기록 (input() 으로 입력 받기 전 안내 문구 출력 등)
+        if self.active:
+            self.listener.stop()
+            self.listener.start()
 
-        if not proc_name:
-            self.logger = logging.getLogger(f"{self.file_name}")
-            self.log_path = os.path.join(log_folder_path, f"{self.file_name}_{self.created_time}.log")
-        else:
-            self.logger = logging.getLogger(f"{proc_name}")
-            self.log_path = os.path.join(log_folder_path, f"{proc_name}_{self.created_time}.log")
+    def close(self):
+        # 남은 레코드 기록 후 handler 정리 (이후 로그는 기록되지 않음)
+        if not self.active:
+            return
+        self.active = False
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.logger.handlers.clear()
+        atexit.unregister(self.close)
 
-        if len(self.logger.handlers) == 0:
-            formatter = logging.Formatter("(%(asctime)s) [%(levelname)s] %(message)s")
 
-            # StreamHandler
-            stream_handler = logging.StreamHandler()
-            stream_handler.setFormatter(formatter)
-            self.logger.addHandler(stream_handler)
+# 병렬 처리 시 worker 별 로그를 모아두었다가 테이블 순서대로 출력하기 위한 Logger
+class BufferLogger:
+    def __init__(self):
+        self.records = []
 
-            # FileHandler
-            if save == True:
-                file_handler = logging.FileHandler(self.log_path)
-                file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+    def debug(self, value, **Fields):
+        self.records.append(("debug", str(value), Fields))
 
-            self.logger.setLevel(logging.INFO)
+    def info(self, value, **Fields):
+        self.records.append(("info", str(value), Fields))
 
-    def info(self, value):
-        self.logger.info(f"{str(value)} (at {self.file_name})")
+    def error(self, value, **Fields):
+        self.records.append(("error", str(value), Fields))
 
-    def error(self, value):
-        self.logger.error(f"{self.colorSetting['red']}{str(value)}{self.colorSetting['reset']} (at {self.file_name})")
+    def flush(self, logger):
+        for level, value, Fields in self.records:
+            getattr(logger, level)(value, **Fields)
+        self.records = []
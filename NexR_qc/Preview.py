@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+
+def sample_frame(data, size=10_000, fraction=None, method="reservoir", seed=0):
+    """Uniform row sample of an in-memory frame in original row order, returned with the population row count
+
+    method: reservoir (size 건 단순 무작위 추출) / uniform (행 별 fraction 확률로 독립 추출)
+    """
+    n_rows = data.shape[0]
+    rng = np.random.default_rng(seed)
+    if method == "uniform":
+        return data[rng.random(n_rows) < fraction], n_rows
+    if n_rows <= size:
+        return data, n_rows
+    return data.iloc[np.sort(rng.choice(n_rows, size, replace=False))], n_rows
+
+
+def sample_chunks(chunks, size=10_000, fraction=None, method="reservoir", seed=0, naList=None):
+    """Uniform row sample streamed from chunks (전체 데이터를 메모리에 올리지 않음), returned with the population row count"""
+    rng = np.random.default_rng(seed)
+    Parts, priorities, positions = [], np.empty(0), np.empty(0, dtype=np.int64)
+    n_rows = 0
+    for chunk in chunks:
+        chunk = chunk.reset_index(drop=True)
+        position = np.arange(n_rows, n_rows + chunk.shape[0])
+        n_rows += chunk.shape[0]
+        if method == "uniform":
+            Parts.append(chunk[rng.random(chunk.shape[0]) < fraction])
+            continue
+
+        # reservoir: 임의 우선순위가 작은 size 건 유지 (bottom-k), 현재 기준값보다 작은 행만 후보로 추가
+        priority = rng.random(chunk.shape[0])
+        if priorities.shape[0] == size:
+            keep = priority < priorities.max()
+            chunk, priority, position = chunk[keep], priority[keep], position[keep]
+        sample = pd.concat(Parts + [chunk], ignore_index=True) if Parts else chunk
+        priorities, positions = np.concatenate([priorities, priority]), np.concatenate([positions, position])
+        if priorities.shape[0] > size:
+            keep = np.argpartition(priorities, size)[:size]
+            sample, priorities, positions = sample.iloc[keep].reset_index(drop=True), priorities[keep], positions[keep]
+        Parts = [sample]
+
+    sample = pd.concat(Parts, ignore_index=True) if len(Parts) > 1 else (Parts[0].reset_index(drop=True) if Parts else pd.DataFrame())
+    if method != "uniform" and sample.shape[0] > 0:
+        sample = sample.iloc[np.argsort(positions, kind="stable")].reset_index(drop=True)
+    if naList:
+        sample = sample.replace(naList, np.nan)
+    return sample, n_rows
+
+
+def estimate_count(k, n, population, confidence=0.95):
+    """Scale a sample count k (of n) to the population with a Wilson score interval
+
+    유한 모집단 보정: 유효 표본 크기 n * (N - 1) / (N - n) 기준으로 구간 산출 (전수인 경우 구간 폭 0)
+    반환값: (추정 건수, 신뢰구간 하한, 신뢰구간 상한)
+    """
+    if n == 0:
+        return 0.0, 0.0, float(population)
+    p = k / n
+    if n >= population:
+        return float(k), float(k), float(k)
+    from statistics import NormalDist  # 미리보기 시에만 불러옴
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    n_eff = n * (population - 1) / (population - n)
+    denominator = 1 + z**2 / n_eff
+    center = (p + z**2 / (2 * n_eff)) / denominator
+    half = z * np.sqrt(p * (1 - p) / n_eff + z**2 / (4 * n_eff**2)) / denominator
+    return float(p * population), float(max(center - half, 0.0) * population), float(min(center + half, 1.0) * population)
@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+import os
+import pickle
+
+import pandas as pd
+
+
+class CachedTable:
+    """Frame-like stand-in (columns, dtypes, shape) of a file source whose QC result is cached"""
+
+    def __init__(self, source, columns, dtypes, shape, time_columns=()):
+        self.source = source
+        self.columns = pd.Index(columns)
+        self.dtypes = pd.Series(dtypes, dtype=object)
+        self.shape = shape
+        self.time_columns = list(time_columns)
+
+
+class ProfileCache:
+    """On-disk cache of per-table QC results keyed by table fingerprint (LRU eviction)
+
+    key: fingerprint(원천 데이터) + QC 설정값 → payload: {"ColumnKey", "columns", "dtypes", "shape", "TIMECOL", "Result"}
+    """
+
+    VERSION = 5  # 결과 항목/산출 방식 변경 시 증가 (기존 캐시 무효화)
+
+    def __init__(self, path, max_entries=1000, max_bytes=512 * 1024**2):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evicted = 0  # 캐시 폴더는 첫 저장 시 생성
+
+    @staticmethod
+    def fingerprint(source):
+        # 파일 경로: 경로 + 수정시각 + 크기 / DataFrame: 컬럼별 값 해시 / 그 외(chunk iterator 등): 캐시 미적용(None)
+        if isinstance(source, (str, os.PathLike)):
+            stat = os.stat(source)
+            return f"file:{os.path.abspath(source)}:{stat.st_mtime_ns}:{stat.st_size}"
+        if isinstance(source, pd.DataFrame):
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr((source.columns.tolist(), source.dtypes.astype(str).tolist(), source.shape)).encode())
+            try:
+                for col in range(source.shape[1]):
+                    digest.update(pd.util.hash_pandas_object(source.iloc[:, col], index=False).to_numpy().tobytes())
+                digest.update(pd.util.hash_pandas_object(source.index).to_numpy().tobytes())
+            except TypeError:
+                # 해시 불가능한 값(list, dict 등)이 포함된 경우
+                return None
+            return f"frame:{digest.hexdigest()}"
+        return None
+
+    @classmethod
+    def key(cls, *parts):
+        return hashlib.blake2b(repr((cls.VERSION,) + parts).encode(), digest_size=16).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.pkl.gz")
+
+    def get(self, key):
+        file = self._file(key)
+        try:
+            with gzip.open(file, "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        os.utime(file)  # 최근 사용 시각 갱신 (LRU)
+        return payload
+
+    def put(self, key, payload):
+        os.makedirs(self.path, exist_ok=True)
+        file = self._file(key)
+        with gzip.open(f"{file}.tmp", "wb", compresslevel=6) as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{file}.tmp", file)
+        self.evict()
+
+    def evict(self):
+        # 최근 사용 시각이 오래된 항목부터 개수/용량 한도 이내가 될 때까지 삭제
+        Entries = []
+        for file in os.listdir(self.path):
+            if file.endswith(".pkl.gz"):
+                stat = os.stat(os.path.join(self.path, file))
+                Entries.append((stat.st_mtime_ns, stat.st_size, file))
+        Entries.sort()
+        total = sum(size for _, size, _ in Entries)
+        while Entries and (len(Entries) > self.max_entries or total > self.max_bytes):
+            _, size, file = Entries.pop(0)
+            os.remove(os.path.join(self.path, file))
+            total -= size
+            self.evicted += 1
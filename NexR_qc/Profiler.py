@@ -0,0 +1,402 @@
+import traceback
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.Duplicates import DuplicateCounter
+from NexR_qc.FrequencyTable import FrequencyTable
+from NexR_qc.Logging import BufferLogger
+from NexR_qc.Preview import estimate_count
+from NexR_qc.ResultTable import Duplicates, ResultTable
+from NexR_qc.SqlSource import SqlTable
+from NexR_qc.Streaming import TableAccumulator
+from NexR_qc.Timer import Tracer
+from NexR_qc.Validation import RuleValidator
+
+
+class Profiler:
+    # 결과 항목 값 세팅
+    RelCategory = ResultTable.RelCategory
+
+    # 데이터 타입 판별 키워드
+    NumericKeyword = ["float", "int", "numeric"]
+    DatetimeKeyword = ["datetime"]
+    CategoryKeyword = ["object", "char", "varchar", "datetime", "category"]
+
+    # 근사값 표시 (sketch 기반으로 산출된 항목의 값 앞에 표시, 비고에 안내 문구 작성)
+    ApproxMark = ResultTable.ApproxMark
+    ApproxRemark = "근사값 포함 (≈ 표시 항목)"
+    PreviewRemark = "미리보기 (표본 기준, ≈ 표시 항목은 전체 추정값)"
+    TypeErrorRemark = "컬럼 정의서 상의 데이터 타입과 실제 데이터 타입 불일치"
+
+    def __init__(self, logger=None, approx=None, tracer=None, validation=None, duplicates=None):
+        """approx: 근사 모드 설정값 {"distinct_error", "quantile_error", "frequency_error", "chunk_size"} (None: 정확한 값 산출)
+
+        tracer: 컬럼 단위 소요시간 측정 (Tracer(columns=True), frame 단위 일괄 계산되는 연속형 컬럼은 dtype 묶음 단위로 측정)
+        validation: 규칙 검증 설정값 {"sample_size"} (None: 검증 생략, 규칙은 ColumnInfo 의 "검증 규칙" 사용)
+        duplicates: 중복 검사 설정값 {"top_n", "max_bytes", "partitions", "spill_path", "chunk_size"} (None: 검사 생략)
+        """
+        self.logger = logger
+        self.approx = approx
+        self.tracer = Tracer(enabled=False) if tracer is None else tracer
+        self.validator = RuleValidator(logger=logger, **validation) if validation is not None else None
+        self.duplicates = duplicates
+
+    def init_result(self, columns):
+        # QC 항목별 초기값 설정
+        return ResultTable(columns)
+
+    def profile(self, data_name, data, ColumnInfo, engine="vectorized", Frequency=None, preview=None, keys=None):
+        """Profile every column of data and return its ResultTable (InfoDict[data_name]["Result"])
+
+        Frequency (dict): 전달 시 범주형 컬럼별 FrequencyTable 을 {No: FrequencyTable} 형태로 저장
+        preview (dict): data 가 표본인 경우 {"population": 전체 행 수, "confidence": 신뢰수준} (null 개수/적재건수를 전체 기준 추정값과 신뢰구간으로 산출)
+        keys (list): 중복 검사 키 컬럼 목록 (None: 행 전체 중복만 검사)
+        """
+        Frequency = {} if Frequency is None else Frequency
+        if isinstance(data, TableAccumulator):
+            Result = self.profile_stream(data_name, data, ColumnInfo, Frequency=Frequency, preview=preview)
+        elif isinstance(data, SqlTable):
+            Result = self.profile_sql(data_name, data, ColumnInfo, Frequency=Frequency, preview=preview)
+        elif self.approx is not None:
+            with self.tracer.span("sketch 누적", table=data_name, rows=data.shape[0]):
+                table = self.fold(data, ColumnInfo)
+            Result = self.profile_stream(data_name, table, ColumnInfo, Frequency=Frequency, preview=preview)
+        elif engine == "loop":
+            Result = self.profile_loop(data_name, data, ColumnInfo, Frequency=Frequency, preview=preview)
+        else:
+            Result = self.profile_frame(data_name, data, ColumnInfo, Frequency=Frequency, preview=preview)
+        self._summary(data_name, Result)
+
+        # Step 5-4: 규칙 검증 (메모리의 데이터는 컬럼 전체 대상, 집계만 보유한 테이블은 결측/빈도 기준)
+        if self.validator is not None and any(ColumnInfo[col].get("검증 규칙") for col in Result.columns):
+            with self.tracer.span("규칙 검증", table=data_name, rows=data.shape[0]):
+                if isinstance(data, pd.DataFrame):
+                    self.validator.validate(data_name, data, ColumnInfo, Result)
+                else:
+                    self.validator.validate_aggregate(data_name, data, ColumnInfo, Result, Frequency)
+
+        # Step 5-5: 중복 행/키 검사 (미리보기 표본은 검사하지 않음)
+        if self.duplicates is not None and preview is None:
+            with self.tracer.span("중복 검사", table=data_name, rows=data.shape[0]):
+                Result.duplicates = self.check_duplicates(data_name, data, keys)
+        return Result
+
+    def check_duplicates(self, data_name, data, keys=None):
+        """Duplicate rows / key values of data (DataFrame: 행 해시 집계, DB 테이블: GROUP BY, 스트리밍 테이블: 읽기 단계에서 집계한 결과)"""
+        keys = [col for col in (keys or []) if col in data.columns]
+        try:
+            if isinstance(data, SqlTable):
+                _, rows, _ = data.count_duplicates(data.columns.tolist())
+                key_values, key_rows, Top = data.count_duplicates(keys, self.duplicates["top_n"], skip_null=True) if keys else (None, None, None)
+                Duplicates_ = Duplicates(keys or None, data.shape[0], rows, key_values, key_rows, Top)
+            elif isinstance(data, TableAccumulator):
+                Duplicates_ = data.duplicates
+            else:
+                counter = DuplicateCounter(keys, **{key: value for key, value in self.duplicates.items() if key != "chunk_size"}).consume(data, self.duplicates["chunk_size"])
+                Duplicates_ = counter.result()
+                if counter.spilled and self.logger:
+                    self.logger.info(f"[{data_name}] 행 해시가 {self.duplicates['max_bytes'] / 1024**2:,.0f} MB 를 초과하여 {self.duplicates['partitions']} 개 파티션으로 디스크에 기록 후 중복 검사를 수행하였습니다.")
+        except Exception as e:
+            # 해시 불가능한 값(list, dict 등)이 포함된 컬럼, GROUP BY 를 지원하지 않는 컬럼 타입(LOB 등)
+            if self.logger:
+                self.logger.error(f"[{data_name}] 중복 검사를 수행할 수 없습니다. ({type(e).__name__}: {e})")
+            return None
+        if Duplicates_ is not None and self.logger:
+            self.logger.info(f"[{data_name}] 중복 검사 완료 (중복 행 {Duplicates_.rows:,} 행" + (f", 키 {Duplicates_.keys} 중복 {Duplicates_.key_values:,} 개 / {Duplicates_.key_rows:,} 행)" if Duplicates_.keys else ")"))
+        return Duplicates_
+
+    def profile_frame(self, data_name, data, ColumnInfo, Frequency=None, preview=None):
+        """Profile an in-memory frame (공통 영역 null mask 1회 계산, 연속형 dtype 별 frame 단위 집계, 범주형 컬럼별 빈도표 1회 계산)"""
+        Frequency = {} if Frequency is None else Frequency
+        Result = self.init_result(data.columns)
+        n_rows = data.shape[0]
+
+        # Step 5-1: 공통 영역 QC 수행 (null mask 1회 계산)
+        NullCount = data.isnull().sum()
+
+        NumericGroup = {}  # dtype 별 연속형 컬럼 묶음
+        CategoryList = []
+        for i, col in enumerate(Result.columns):
+            dtype_ = ColumnInfo[col]["데이터 타입"]
+
+            # 데이터 타입 정보가 문자열이 아니거나 정의서 타입과 실제 타입이 다를 수 있는 경우, 기존 컬럼 단위 방식으로 처리
+            if not isinstance(dtype_, str) or not self._vectorizable(data[col], dtype_):
+                with self.tracer.span("컬럼 QC", kind="column", table=data_name, column=col, rows=n_rows):
+                    self._profile_column(data_name, data, Result, i, ColumnInfo, Frequency, preview=preview)
+                continue
+
+            self._fill_common(Result, i, ColumnInfo[col], n_rows, NullCount[col], preview=preview)
+
+            if any(keyword in dtype_ for keyword in self.NumericKeyword):
+                NumericGroup.setdefault(data[col].dtype, []).append(i)
+            if any(keyword in dtype_ for keyword in self.CategoryKeyword):
+                CategoryList.append(i)
+
+        # Step 5-2: 연속형 영역 QC 수행 (dtype 별 frame 단위 집계)
+        for idxs in NumericGroup.values():
+            with self.tracer.span(f"연속형 일괄 집계 ({len(idxs)} 컬럼)", table=data_name, rows=n_rows):
+                cols = [Result.columns[i] for i in idxs]
+                block = data[cols]
+                Stats = {
+                    "최솟값": block.min(),
+                    "최댓값": block.max(),
+                    "평균": block.mean(),
+                    "표준편차": block.std(),
+                    "중위수": block.median(),
+                }
+                for key2, values in Stats.items():
+                    for i, value in zip(idxs, values.values):
+                        Result.set(i, key2, value)
+
+        # Step 5-3: 범주형 영역 QC 수행 (컬럼별 빈도표 1회 계산)
+        for i in CategoryList:
+            col = Result.columns[i]
+            with self.tracer.span("컬럼 QC", kind="column", table=data_name, column=col, rows=n_rows):
+                try:
+                    dtype_ = Result.get(i, "데이터 타입")
+                    if not any(keyword in dtype_ for keyword in self.NumericKeyword) and any(keyword in dtype_ for keyword in self.DatetimeKeyword):
+                        values = self._dense(data[col])
+                        Result.set(i, "최솟값", values.min())  # 최솟값
+                        Result.set(i, "최댓값", values.max())  # 최댓값
+
+                    Frequency[Result.index(i)] = FrequencyTable.from_series(data[col])
+                    self._fill_categorical(Result, i, Frequency[Result.index(i)], ColumnInfo[col]["코드값"])
+
+                except TypeError:
+                    self._type_error(data_name, col, Result, i)
+
+        return Result
+
+    def profile_loop(self, data_name, data, ColumnInfo, Frequency=None, preview=None):
+        """Profile column by column (기존 방식, 검증 및 벤치마크용)"""
+        Frequency = {} if Frequency is None else Frequency
+        Result = self.init_result(data.columns)
+        for i, col in enumerate(Result.columns):
+            with self.tracer.span("컬럼 QC", kind="column", table=data_name, column=col, rows=data.shape[0]):
+                self._profile_column(data_name, data, Result, i, ColumnInfo, Frequency, preview=preview)
+        return Result
+
+    def fold(self, data, ColumnInfo):
+        """Fold an in-memory frame into sketches chunk by chunk (근사 모드, 빈도/최솟값·최댓값은 해당 항목의 QC 대상 컬럼만 집계)"""
+        Counts = [col for col in data.columns if self._has_keyword(ColumnInfo[col]["데이터 타입"], self.CategoryKeyword)]
+        MinMax = [col for col in data.columns if self._has_keyword(ColumnInfo[col]["데이터 타입"], self.NumericKeyword + self.DatetimeKeyword)]
+        table = TableAccumulator(approx=self.approx)
+        chunk_size = self.approx.get("chunk_size", 100_000)
+        for start in range(0, max(data.shape[0], 1), chunk_size):
+            table.update(data.iloc[start : start + chunk_size], counts=Counts, minmax=MinMax)
+        return table
+
+    def profile_sql(self, data_name, table, ColumnInfo, Frequency=None, preview=None):
+        """Profile a database table whose aggregates are computed server-side (SqlTable, 항목 별 QC 대상 컬럼만 집계)"""
+        with self.tracer.span("DB 집계", table=data_name, rows=table.shape[0]):
+            table.aggregate(
+                numeric=[col for col in table.columns if self._has_keyword(ColumnInfo[col]["데이터 타입"], self.NumericKeyword)],
+                minmax=[col for col in table.columns if self._has_keyword(ColumnInfo[col]["데이터 타입"], self.NumericKeyword + self.DatetimeKeyword)],
+                counts=[col for col in table.columns if self._has_keyword(ColumnInfo[col]["데이터 타입"], self.CategoryKeyword)],
+            )
+        return self.profile_stream(data_name, table, ColumnInfo, Frequency=Frequency, preview=preview)
+
+    @staticmethod
+    def _has_keyword(dtype_, keywords):
+        # 데이터 타입 정보가 문자열이 아닌 경우 전체 항목 집계 (QC 단계에서 타입 불일치로 처리)
+        return not isinstance(dtype_, str) or any(keyword in dtype_ for keyword in keywords)
+
+    def profile_stream(self, data_name, table, ColumnInfo, Frequency=None, preview=None):
+        """Profile a table folded chunk by chunk into a TableAccumulator (스트리밍 모드)"""
+        Frequency = {} if Frequency is None else Frequency
+        Result = self.init_result(table.columns)
+        n_rows = table.shape[0]
+
+        for i, col in enumerate(Result.columns):
+            acc = table[col]
+            idx = Result.index(i)
+
+            with self.tracer.span("컬럼 QC", kind="column", table=data_name, column=col, rows=n_rows):
+                # Step 5-1: 공통 영역 QC 수행
+                self._fill_common(Result, i, ColumnInfo[col], n_rows, acc.n_null, preview=preview)
+
+                try:
+                    dtype_ = Result.get(i, "데이터 타입")
+                    # Step 5-2: 연속형 영역 QC 수행
+                    if any(keyword in dtype_ for keyword in self.NumericKeyword):
+                        self._fill_minmax(Result, i, acc)
+                        if acc.dtype.kind not in "biuf":
+                            raise TypeError(f"{col} 컬럼의 실제 데이터 타입({acc.dtype})은 연속형이 아닙니다.")
+                        Result.set(i, "평균", np.float64(acc.mean) if acc.n > 0 else np.float64(np.nan))  # 평균
+                        Result.set(i, "표준편차", acc.std)  # 표준편차
+                        Result.set(i, "중위수", acc.sample.median())  # 중위수
+                        if not acc.sample.exact:
+                            self._mark_approximate(Result, i, ["중위수"])
+                            if acc.approx is None and self.logger:
+                                self.logger.debug(f"[{data_name}] {col} 컬럼의 중위수는 {acc.sample.describe()} 기준 근사값입니다.")
+
+                    elif any(keyword in dtype_ for keyword in self.DatetimeKeyword):
+                        self._fill_minmax(Result, i, acc)
+
+                    # Step 5-3: 범주형 영역 QC 수행
+                    if any(keyword in dtype_ for keyword in self.CategoryKeyword):
+                        Frequency[idx] = acc.frequency()
+                        self._fill_categorical(Result, i, Frequency[idx], ColumnInfo[col]["코드값"])
+                        if Frequency[idx].approximate and Frequency[idx].total > 0:
+                            self._mark_approximate(Result, i, ["범주수", "최빈값 수", "%최빈값"])
+                            if acc.approx is None and self.logger:
+                                self.logger.debug(f"[{data_name}] {col} 컬럼은 범주 수가 {acc.max_distinct:,} 개를 초과하여 범주수/최빈값을 근사값으로 산출합니다.")
+
+                except TypeError:
+                    self._type_error(data_name, col, Result, i)
+
+        return Result
+
+    def _summary(self, data_name, Result):
+        # 테이블 단위 요약 로그 (컬럼 단위 메시지는 DEBUG 수준으로 기록)
+        if not self.logger:
+            return
+        Approx = {i for i, _ in Result.approx}
+        Mismatch = [Result.columns[i] for i in range(len(Result)) if Result.get(i, "비고") == self.TypeErrorRemark]
+        self.logger.info(f"[{data_name}] 컬럼 QC 완료 (컬럼 {len(Result):,} 개" + (f", 근사값 포함 {len(Approx):,} 개" if Approx else "") + (f", 데이터 타입 불일치 {len(Mismatch):,} 개: {Mismatch}" if Mismatch else "") + ")", table=data_name, columns=len(Result), approximate=len(Approx), type_mismatch=len(Mismatch))
+
+    def _mark_approximate(self, Result, i, key2s):
+        # 근사값 항목 표시 (결과서 작성 시 ≈ 표시), 비고가 비어있는 경우 안내 문구 작성
+        Result.mark_approximate(i, key2s)
+        if Result.get(i, "비고") is None:
+            Result.set(i, "비고", self.ApproxRemark)
+
+    def _fill_minmax(self, Result, i, acc):
+        if acc.minmax_error:
+            raise TypeError(f"{Result.columns[i]} 컬럼에 비교할 수 없는 타입의 값이 혼재되어 있습니다.")
+        Result.set(i, "최솟값", acc.cast(acc.min) if acc.min is not None else np.nan)  # 최솟값
+        Result.set(i, "최댓값", acc.cast(acc.max) if acc.max is not None else np.nan)  # 최댓값
+
+    def _vectorizable(self, series, dtype_):
+        # 연속형 항목은 실제 데이터가 int/float 인 경우에만 frame 단위 집계 적용
+        if any(keyword in dtype_ for keyword in self.NumericKeyword):
+            return series.dtype.kind in "iuf"
+        return True
+
+    @staticmethod
+    def _dense(series):
+        # category dtype 컬럼은 최솟값/최댓값 등 산출 시 원래 값(object)으로 변환
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.astype(series.cat.categories.dtype)
+        return series
+
+    def _type_error(self, data_name, col, Result, i):
+        # 컬럼정의서 데이터 형식과 실데이터 형식 불일치할 경우
+        if self.logger:
+            self.logger.error(f"{data_name} 테이블의 {col} 컬럼 에러")
+            self.logger.debug(traceback.format_exc())
+
+        Result.set(i, "비고", self.TypeErrorRemark)  # 비고
+
+    def _fill_common(self, Result, i, ColumnInfo_, n_rows, n_null, preview=None):
+        Result.set(i, "컬럼 한글명", ColumnInfo_["컬럼 한글명"])  # 컬럼 한글명
+        Result.set(i, "데이터 타입", ColumnInfo_["데이터 타입"])  # 데이터 타입
+        Result.set(i, "null 개수", n_null)  # null 개수
+        Result.set(i, "%null", n_null / n_rows if n_rows > 0 else np.nan)  # %null (행이 없는 테이블은 NaN)
+        Result.set(i, "적재건수", n_rows - n_null)  # 적재건수
+        Result.set(i, "%적재건수", (n_rows - n_null) / n_rows if n_rows > 0 else np.nan)  # %적재건수
+
+        # 모든 값이 결측값인 경우, 비고에 알림 문구 작성
+        if n_null == n_rows:
+            Result.set(i, "비고", "결측값 100%")  # 비고
+
+        if preview is not None and preview["population"] > n_rows:
+            self._fill_estimate(Result, i, n_rows, n_null, preview)
+
+    def _fill_estimate(self, Result, i, n_rows, n_null, preview):
+        # 미리보기: 표본 건수를 전체 행 수 기준 추정값(신뢰구간)으로 변환
+        population = preview["population"]
+        for key2, ratio_key2, count_ in [("null 개수", "%null", n_null), ("적재건수", "%적재건수", n_rows - n_null)]:
+            estimate_, lower_, upper_ = estimate_count(count_, n_rows, population, preview["confidence"])
+            Result.set_estimate(i, key2, estimate_, lower_, upper_)
+            Result.set_estimate(i, ratio_key2, estimate_ / population, lower_ / population, upper_ / population)
+        if Result.get(i, "비고") is None:
+            Result.set(i, "비고", self.PreviewRemark)
+
+    def _fill_categorical(self, Result, i, Frequency, code_values):
+        # Frequency: 결측값 제외 FrequencyTable (최초 등장 순서)
+        n_valid = Frequency.total
+        n_unique = len(Frequency)
+        Result.set(i, "범주수", n_unique)  # 범주수
+
+        if n_unique <= 5:
+            Values = Frequency.values
+            Result.set(i, "%범주", {value_: count_ / n_valid for value_, count_ in Frequency.head(5)})  # %범주
+        else:
+            Head = Frequency.head(5)
+            Values = [value_ for value_, _ in Head[:2]] + ["..."] + [value_ for value_, _ in Frequency.tail(2)]
+            Ratios = {value_: count_ / n_valid for value_, count_ in Head}
+            Ratios["그 외"] = (n_valid - sum(count_ for _, count_ in Head)) / n_valid
+            Result.set(i, "%범주", Ratios)  # %범주
+        Result.set(i, "범주", Values)  # 범주
+
+        if code_values is not None:
+            # 화면에 표시된 범주가 아닌 전체 범주 대상 (빈도 상위 범주만 보유한 경우 최소 개수)
+            _ = Frequency.undefined(code_values)
+            if not Frequency.complete:
+                self._mark_approximate(Result, i, ["정의된 범주 외 수"])
+            if len(_) > 5:
+                Result.set(i, "정의된 범주 외", _[:2] + ["..."] + _[-2:])
+            elif len(_) < 1:
+                Result.set(i, "정의된 범주 외", None)
+            else:
+                Result.set(i, "정의된 범주 외", _)
+            Result.set(i, "정의된 범주 외 수", len(_))
+
+        # 최빈값: 최대 빈도를 가지는 값
+        Modes = Frequency.modes()
+        if len(Modes) <= 3:
+            Result.set(i, "최빈값", Modes)  # 최빈값
+        else:
+            Result.set(i, "최빈값", Modes[:2] + ["..."])  # 최빈값
+            Modes = Modes[:2]
+        Result.set(i, "최빈값 수", {mode_: Frequency.max_count for mode_ in Modes})  # 최빈값 수
+        Result.set(i, "%최빈값", {mode_: Frequency.max_count / n_valid for mode_ in Modes})  # %최빈값
+
+    def _profile_column(self, data_name, data, Result, i, ColumnInfo, Frequency, preview=None):
+        col = Result.columns[i]
+        # Step 5-1: 공통 영역 QC 수행
+        self._fill_common(Result, i, ColumnInfo[col], data.shape[0], int(data[col].isnull().sum()), preview=preview)
+
+        try:
+            dtype_ = Result.get(i, "데이터 타입")
+
+            # Step 5-2: 연속형 영역 QC 수행
+            if any(keyword in dtype_ for keyword in self.NumericKeyword):
+                values = self._dense(data[col])
+                Result.set(i, "최솟값", values.min())  # 최솟값
+                Result.set(i, "최댓값", values.max())  # 최댓값
+                Result.set(i, "평균", values.mean())  # 평균
+                Result.set(i, "표준편차", values.std())  # 표준편차
+                Result.set(i, "중위수", np.nanmedian(values))  # 중위수
+
+            elif any(keyword in dtype_ for keyword in self.DatetimeKeyword):
+                values = self._dense(data[col])
+                Result.set(i, "최솟값", values.min())  # 최솟값
+                Result.set(i, "최댓값", values.max())  # 최댓값
+
+            # Step 5-3: 범주형 영역 QC 수행
+            if any(keyword in dtype_ for keyword in self.CategoryKeyword):
+                Frequency[Result.index(i)] = FrequencyTable.from_series(data[col])
+                self._fill_categorical(Result, i, Frequency[Result.index(i)], ColumnInfo[col]["코드값"])
+
+        except TypeError:
+            self._type_error(data_name, col, Result, i)
+
+
+def profile_table(data_name, data, ColumnInfo, approx=None, preview=None, trace=None, validation=None, duplicates=None, keys=None):
+    """Profile one table in a worker and return its Result, FrequencyTables, buffered log records and trace records
+
+    trace: worker 내 Tracer 설정값 {"columns", "memory"} (None: 측정 안 함)
+    validation: 규칙 검증 설정값 {"sample_size"} (None: 검증 생략)
+    duplicates / keys: 중복 검사 설정값 (None: 검사 생략) / 키 컬럼 목록
+    """
+    logger = BufferLogger()
+    tracer = Tracer(**trace) if trace is not None else Tracer(enabled=False)
+    Frequency = {}
+    logger.info(f"[{data_name}] QC 시작")
+    with tracer.span("테이블 QC", kind="table", table=data_name, rows=data.shape[0]):
+        Result = Profiler(logger=logger, approx=approx, tracer=tracer, validation=validation, duplicates=duplicates).profile(data_name, data, ColumnInfo, Frequency=Frequency, preview=preview, keys=keys)
+    logger.info(f"[{data_name}] QC 완료")
+    return Result, Frequency, logger, tracer.records
@@ -1,29 +1,38 @@
 import copy
-import datetime
+import importlib.util
 import json
 import os
-import re
-import time
 import traceback
 import unicodedata
-from pathlib import Path
+from datetime import datetime
 
 import numpy as np
 import pandas as pd
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Alignment, Border, Font, GradientFill, PatternFill, Side
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.dimensions import ColumnDimension
 
-from NexR_qc.Logging import *
-from NexR_qc.Timer import *
+from NexR_qc.DateTimeInference import infer_datetime_columns
+from NexR_qc.Duplicates import DuplicateCounter
+from NexR_qc.ExcelWriter import BackgroundExcelWriter, FastExcelWriter, write_shard
+from NexR_qc.Exporter import Exporter, Exporters, flat_columns
+from NexR_qc.Incremental import StateStore, changed_columns
+from NexR_qc.Ingestion import DefaultNaList
+from NexR_qc.Logging import Logger
+from NexR_qc.Preview import sample_chunks, sample_frame
+from NexR_qc.ProfileCache import CachedTable, ProfileCache
+from NexR_qc.Profiler import Profiler, profile_table
+from NexR_qc.ResultTable import ResultTable
+from NexR_qc.SqlSource import SqlTable
+from NexR_qc.Streaming import TableAccumulator, is_stream_source, iter_chunks
+from NexR_qc.Timer import Timer, Tracer
+from NexR_qc.Validation import compile_rules, document_rules, rule_columns
 
 
 class QualityCheck:
 
-    def __init__(self, DataDict):
+    def __init__(self, DataDict, config=None, logger=None):
         # DataDict (dict): {'데이터명1': dataframe1, ...}
-        # 초기 디렉토리 세팅
+        # config (dict): config.json 값 대신 사용할 설정값 (미입력 시 config.json 값 사용)
+        # logger (Logger): 로그를 기록할 Logger (미입력 시 log 폴더에 새 로그 파일 생성)
+        # 초기 디렉토리 세팅 (폴더/파일은 생성자에서 만들지 않고 필요한 단계에서 생성: log 첫 로그 기록 시, output 결과 저장 시, config.json Step 1)
         self.PATH = {}
         self.PATH["ROOT"] = os.getcwd()
         self.PATH["DOCS"] = os.path.join(self.PATH["ROOT"], "documents")
@@ -34,39 +43,117 @@ class QualityCheck:
 
         self.DataDict = {unicodedata.normalize("NFC", k): v for k, v in DataDict.items()}
 
-        for folder in self.PATH.keys():
-            # 구성 폴더가 없을 경우, 생성
-            if not os.path.exists(self.PATH[folder]):
-                Path(self.PATH[folder]).mkdir(parents=True, exist_ok=True)
+        # Config 파일 불러오기 (config.json 이 없는 경우 기본값 사용)
+        if os.path.exists(os.path.join(self.PATH["ROOT"], "config.json")):
+            with open(os.path.join(self.PATH["ROOT"], "config.json"), "r") as f:
+                self.config = json.load(f)
+        else:
+            self.config = {"naList": list(DefaultNaList)}
+        self.config.update(config or {})
 
-        # 로그 구성
+        # 로그 구성 (logger 전달 시 해당 Logger 에 기록, 예: python -m NexR_qc 의 불러오기 로그와 같은 로그 파일)
+        self.config.setdefault("logLevel", "INFO")  # 로그 출력 수준 (DEBUG: 컬럼 단위 메시지 포함 / INFO: 테이블 단위 요약 / ERROR: 오류만 출력)
+        self.config.setdefault("logFormat", "text")  # text: (시각) [수준] 메시지 형식 / json: 레코드 당 JSON 1 줄 (콘솔/로그 파일)
         self.logger_save = True  # 로그 파일 생성 여부 (True: 로그 파일 생성 / False: 로그 파일 미생성)
-        self.logger = Logger(
-            proc_name="QualityCheck",
-            log_folder_path=self.PATH["LOG"],
-            save=self.logger_save,
-        )
+        self.logger = logger if logger is not None else Logger(proc_name="QualityCheck", log_folder_path=self.PATH["LOG"], save=self.logger_save, level=self.config["logLevel"], json_format=self.config["logFormat"] == "json")
 
         self.timer = Timer(logger=self.logger)
         self.timer.start()
 
-        # Config 파일 불러오기
-        if "config.json" in os.listdir(self.PATH["ROOT"]):
-            with open(os.path.join(self.PATH["ROOT"], "config.json"), "r") as f:
-                self.config = json.load(f)
-        else:
-            self.config = {"naList": ["?", "na", "null", "Null", "NULL", " ", "[NULL]"]}
-            with open(os.path.join(self.PATH["ROOT"], "config.json"), "w") as f:
-                json.dump(self.config, f)
-            self.logger.info(f'config 파일을 생성하였습니다. (생성 경로: {os.path.join(self.PATH["ROOT"], "config.json")})')
+        # 실행 방식 설정값 (interactive 가 False 인 경우 input() 없이 config 값으로 실행)
+        self.config.setdefault("interactive", True)  # 날짜/시간 컬럼 정보 입력 여부 질의
+        self.config.setdefault("timeColumns", {})  # 테이블 별 날짜/시간 컬럼 {"테이블명": ["컬럼명", ...]}
+        self.config.setdefault("inferDatetime", False)  # 날짜/시간 컬럼 자동 추론 여부 (표본 기반)
+        self.config.setdefault("inferSampleSize", 1_000)  # 날짜/시간 컬럼 추론 시 사용할 표본 크기
+
+        # 스트리밍 모드 설정값 (파일 경로 혹은 chunk iterator 로 전달된 데이터에 적용)
+        self.config.setdefault("chunkSize", 100_000)  # csv 파일을 읽을 chunk 크기
+        self.config.setdefault("maxDistinct", 100_000)  # 정확한 빈도를 유지할 최대 범주 수 (초과 시 sketch 기반 근사값)
+        self.config.setdefault("sampleSize", 100_000)  # 중위수 산출용 표본 크기
+
+        # 근사 모드 설정값 (범주수 HyperLogLog, 중위수 KLL, 최빈값 Count-Min sketch 기반 근사값 산출, 결과서에 ≈ 표시)
+        self.config.setdefault("approximate", False)  # 근사 모드 사용 여부
+        self.config.setdefault("approxDistinctError", 0.01)  # 범주수 상대 오차 (표준오차)
+        self.config.setdefault("approxQuantileError", 0.01)  # 중위수 순위 오차
+        self.config.setdefault("approxFrequencyError", 0.001)  # 최빈값 수 오차 (적재건수 대비 비율, 99% 확률)
+        self.approx = {"distinct_error": self.config["approxDistinctError"], "quantile_error": self.config["approxQuantileError"], "frequency_error": self.config["approxFrequencyError"], "chunk_size": self.config["chunkSize"]} if self.config["approximate"] else None
+
+        # 미리보기 설정값 (테이블 별 표본으로 QC 수행, null 개수/적재건수는 전체 기준 추정값과 신뢰구간으로 산출)
+        self.config.setdefault("preview", False)  # 미리보기 사용 여부 (Process.run(preview=True) 로도 지정 가능)
+        self.config.setdefault("previewMethod", "reservoir")  # reservoir: previewSize 건 단순 무작위 추출 / uniform: 행 별 previewFraction 확률로 추출
+        self.config.setdefault("previewSize", 10_000)  # reservoir 표본 크기
+        self.config.setdefault("previewFraction", 0.01)  # uniform 추출 확률
+        self.config.setdefault("previewConfidence", 0.95)  # 추정값 신뢰수준
+
+        # 병렬 처리 설정값 (workers 가 1 인 경우 순차 처리)
+        self.config.setdefault("workers", 1)  # 테이블 단위 병렬 처리 worker 수
+        self.config.setdefault("executor", "process")  # process: ProcessPoolExecutor / thread: ThreadPoolExecutor
+
+        # 결과서 작성 설정값
+        self.config.setdefault("excelEngine", "openpyxl")  # openpyxl: 기존 방식 / xlsxwriter: 서식 포함 단일 패스 작성
+        self.config.setdefault("pipelineSave", False)  # 테이블 QC 완료 즉시 background thread 에서 결과서 시트 작성 (xlsxwriter 사용, run 과 save 작업 중첩)
+        self.config.setdefault("pipelineMaxPending", 4)  # 작성 대기 가능한 최대 테이블 수 (초과 시 다음 테이블 QC 대기)
+        self.config.setdefault("shardTables", 0)  # 결과서 파일 1 개당 최대 테이블 수 (0: 분할하지 않음, 지정 시 테이블 리스트 색인 파일 + 분할 결과서 파일로 작성, xlsxwriter 사용)
+        self.config.setdefault("shardColumns", 0)  # 결과서 파일 1 개당 최대 컬럼 결과 행 수 (0: 제한 없음, 컬럼 수가 많은 테이블이 모인 파일의 크기 제한)
+        self.config.setdefault("shardWorkers", 1)  # 분할 결과서 병렬 작성 worker 수 (executor 설정값의 process/thread 사용)
+        self.shard = bool(self.config["shardTables"] or self.config["shardColumns"])
+        self.config.setdefault("outputFormats", ["excel"])  # 산출물 형식 목록 (excel: QC 결과서 / parquet, jsonl, csv: 테이블 리스트·컬럼 결과 원래 값 파일)
+        self.pipeline = None
+        for format_ in self.config["outputFormats"]:
+            if format_ != "excel" and format_ not in Exporters:
+                self.logger.error(f"지원하지 않는 산출물 형식입니다: {format_} (excel, {', '.join(Exporters)} 중 선택)")
+        self.config["outputFormats"] = [format_ for format_ in self.config["outputFormats"] if format_ == "excel" or format_ in Exporters]
+
+        # 결과 캐시 설정값 (output/.cache, 데이터와 컬럼 정보가 동일한 테이블은 QC 재수행 생략)
+        self.config.setdefault("cache", False)  # 캐시 사용 여부
+        self.config.setdefault("cacheMaxEntries", 1000)  # 최대 캐시 항목 수
+        self.config.setdefault("cacheMaxMB", 512)  # 최대 캐시 용량 (MB)
+        # 미리보기 결과는 표본 기준이므로 캐시/증분 상태에 저장하지 않음
+        self.cache = ProfileCache(os.path.join(self.PATH["OUTPUT"], ".cache"), max_entries=self.config["cacheMaxEntries"], max_bytes=self.config["cacheMaxMB"] * 1024**2) if self.config["cache"] and not self.config["preview"] else None
+
+        # 증분 QC 설정값 (output/.state, 전달된 데이터를 기존 테이블에 추가된 행으로 보고 저장된 집계 상태에 병합)
+        self.config.setdefault("incremental", False)  # 증분 QC 사용 여부
+        self.state_store = StateStore(os.path.join(self.PATH["OUTPUT"], ".state")) if self.config["incremental"] and not self.config["preview"] else None
+
+        # QC 이력 설정값 (테이블/컬럼 별 지표를 실행마다 SQLite DB 에 추가, 직전 실행 대비 변동 컬럼 보고)
+        self.config.setdefault("history", False)  # 이력 저장 여부
+        self.config.setdefault("historyPath", None)  # 이력 DB 경로 (미입력 시 output/qc_history.sqlite)
+        self.config.setdefault("driftThresholds", {})  # 변동 기준값 {"null_ratio": %null 차이, "distinct_count": 범주수 변화율, "mean": 직전 표준편차 대비 평균 차이, "std": 표준편차 변화율, "undefined_count": 정의된 범주 외 수 증가량} (미입력 항목은 기본값)
+        self.config.setdefault("driftLogMax", 20)  # 로그에 출력할 최대 변동 항목 수 (전체 목록은 _drift.csv 파일)
+
+        # 규칙 검증 설정값 (컬럼정의서 규칙 컬럼/코드값 + validationRules 규칙을 컬럼 전체 대상으로 검사, 결과는 _validation.csv 파일)
+        self.config.setdefault("validation", True)  # 규칙 검증 수행 여부
+        self.config.setdefault("validationRules", {})  # 테이블/컬럼 별 추가 규칙 {"테이블명": {"컬럼명": {"not_null": true, "unique": true, "codes": [코드값, ...], "min": 0, "max": 100, "pattern": "정규식", "min_length": 1, "max_length": 10}}}
+        self.config.setdefault("validationSampleSize", 5)  # 규칙 별 위반 예시 행 수
+        self.config.setdefault("validationLogMax", 20)  # 로그에 출력할 최대 위반 규칙 수 (전체 목록은 _validation.csv 파일)
+        self.validation = {"sample_size": self.config["validationSampleSize"]} if self.config["validation"] else None
+
+        # 중복 검사 설정값 (테이블 별 중복 행 수와 키 컬럼 기준 중복 키 수/상위 중복 키를 행 해시로 집계, 결과는 테이블 정보에 표시)
+        self.config.setdefault("duplicateCheck", True)  # 중복 검사 수행 여부
+        self.config.setdefault("duplicateKeys", {})  # 테이블 별 키 컬럼 {"테이블명": ["컬럼명", ...]} (미입력 시 컬럼정의서 PK여부 Y 컬럼, 스트리밍 테이블은 duplicateKeys 만 적용)
+        self.config.setdefault("duplicateTopN", 5)  # 테이블 정보에 표시할 상위 중복 키 수
+        self.config.setdefault("duplicateMaxMB", 256)  # 메모리에 유지할 행 해시 최대 용량 (MB, 초과 시 파티션 단위로 디스크에 기록 후 집계)
+        self.config.setdefault("duplicatePartitions", 16)  # 디스크 기록 시 파티션 수 (파티션 당 메모리 사용량 = 전체 해시 용량 / 파티션 수)
+        self.config.setdefault("duplicateSpillPath", None)  # 디스크 기록 경로 (미입력 시 시스템 임시 폴더, 집계 후 삭제)
+        self.duplicates = {"top_n": self.config["duplicateTopN"], "max_bytes": self.config["duplicateMaxMB"] * 1024**2, "partitions": self.config["duplicatePartitions"], "spill_path": self.config["duplicateSpillPath"], "chunk_size": self.config["chunkSize"]} if self.config["duplicateCheck"] else None
+
+        # 성능 측정 설정값 (단계/테이블/컬럼 별 소요시간, 처리 행 수, 메모리 사용량을 log 폴더에 JSON/CSV 로 저장)
+        self.config.setdefault("trace", False)  # 성능 측정 사용 여부
+        self.config.setdefault("traceColumns", False)  # 컬럼 단위 측정 여부 (컬럼 수가 많은 경우 기록량 증가)
+        self.config.setdefault("traceMemory", False)  # tracemalloc 기반 구간 별 최대 메모리 측정 여부 (측정 시 처리 속도 저하)
+        self.config.setdefault("traceTopN", 10)  # 로그에 출력할 소요시간 상위 테이블/컬럼 수
+        self.tracer = Tracer(enabled=self.config["trace"], columns=self.config["traceColumns"], memory=self.config["traceMemory"])
 
         self.readFunc = {}
         self.readFunc[".csv"] = pd.read_csv
         self.readFunc[".xlsx"] = pd.read_excel
+        self.readFunc[".parquet"] = pd.read_parquet
+        self.readFunc[".feather"] = pd.read_feather
 
     def data_check(self):
         self.logger.info("=" * 50)
         self.logger.info(f"{self.colorSetting['green']}[Step 1] 데이터 파일 존재 여부 확인 시작{self.colorSetting['reset']}")
+        self.write_config()
 
         # 데이터 파일이 존재하지 않을 경우 에러 로그 기록
         if len(self.DataDict.keys()) == 0:
@@ -74,20 +161,61 @@ class QualityCheck:
             return
 
         self.logger.info(f"총 {len(self.DataDict):,} 개의 데이터 파일이 존재합니다.")
+        self.tracer.start("[Step 1] 데이터 파일 존재 여부 확인", kind="step")
 
         # 날짜 혹은 시간 컬럼 관련 추가 정보 입력 필요 여부값 확인
-        self.config["DateTimeInfoQuestion_YN"] = True if input(f"""{self.colorSetting['yellow']}각 테이블 내 날짜 혹은 시간 관련 컬럼에 대한 추가 정보 입력이 필요한 경우 Y, 추가 정보 입력이 필요 없는 경우는 N을 입력해주세요 (Y/N):{self.colorSetting['reset']} """) in ["Y", "y"] else False
+        if self.config["interactive"]:
+            self.logger.flush()  # 질의 전 이전 로그 출력
+            self.config["DateTimeInfoQuestion_YN"] = True if input(f"""{self.colorSetting['yellow']}각 테이블 내 날짜 혹은 시간 관련 컬럼에 대한 추가 정보 입력이 필요한 경우 Y, 추가 정보 입력이 필요 없는 경우는 N을 입력해주세요 (Y/N):{self.colorSetting['reset']} """) in ["Y", "y"] else False
+        else:
+            # 비대화형 실행: config 의 timeColumns / inferDatetime 값 사용
+            self.config["DateTimeInfoQuestion_YN"] = False
 
         for name, data in self.DataDict.items():
             self.DataDict[name] = {}
-            self.DataDict[name]["DATA"] = data.replace(self.config["naList"], np.nan)
+
+            # 캐시 조회 (원천 데이터 fingerprint + QC 설정값 기준)
+            self.DataDict[name]["CACHEKEY"] = None
+            self.DataDict[name]["CACHED"] = None
+            if self.cache is not None and self.state_store is None:
+                fingerprint = ProfileCache.fingerprint(data)
+                if fingerprint is not None:
+                    self.DataDict[name]["CACHEKEY"] = ProfileCache.key(fingerprint, self.config["naList"], self.config["chunkSize"], self.config["maxDistinct"], self.config["sampleSize"], self.approx, self.duplicates, self.validation)
+                    self.DataDict[name]["CACHED"] = self.cache.get(self.DataDict[name]["CACHEKEY"])
+
+            self.DataDict[name]["STATE"] = None
+            self.tracer.start("데이터 읽기", table=name)
+            if self.state_store is not None:
+                self.DataDict[name]["DATA"] = self.read_incremental(name, data)
+            elif isinstance(data, SqlTable):
+                # DB 테이블: 데이터를 불러오지 않고 run 단계에서 DB 서버 집계 결과 사용 (naList 미적용, DB 의 NULL 만 결측값으로 처리)
+                self.DataDict[name]["DATA"] = data
+                self.logger.info(f"[{name}] DB 테이블 확인 완료 ({data.shape[0]:,} 행, 집계는 DB 서버에서 수행)")
+            elif is_stream_source(data) and self.config["preview"]:
+                self.DataDict[name]["DATA"] = self.read_preview(name, data)
+            elif is_stream_source(data):
+                if self.DataDict[name]["CACHED"] is not None:
+                    # 캐시된 결과가 있는 파일은 읽기를 생략 (컬럼 정보 변경으로 캐시 미적중 시 run 단계에서 읽음)
+                    Cached = self.DataDict[name]["CACHED"]
+                    self.DataDict[name]["DATA"] = CachedTable(data, Cached["columns"], Cached["dtypes"], Cached["shape"], Cached["TIMECOL"])
+                else:
+                    self.DataDict[name]["DATA"] = self.read_stream(name, data)
+            elif data.attrs.get("ingest", {}).get("naList") == self.config["naList"]:
+                # read_table 로 불러온 데이터는 읽기 단계에서 결측값 처리가 완료되어 있으므로 복사 없이 사용
+                self.DataDict[name]["DATA"] = data
+                bytes_before, bytes_after = data.attrs["ingest"]["bytes"]
+                self.logger.info(f"[{name}] 메모리 사용량 {bytes_before / 1024**2:,.1f} MB → {bytes_after / 1024**2:,.1f} MB ({(bytes_before - bytes_after) / 1024**2:,.1f} MB 절감)")
+            else:
+                self.DataDict[name]["DATA"] = data.replace(self.config["naList"], np.nan)
+            self.tracer.stop()
             self.DataDict[name]["TIMECOL"] = None
             if not self.config["DateTimeInfoQuestion_YN"]:
-                self.DataDict[name]["TIMECOL"] = []
+                self.DataDict[name]["TIMECOL"] = self.time_columns(name)
             else:
                 while True:
                     # 날짜 혹은 시간 컬럼 관련 추가 정보 입력
                     self.logger.info(f"""컬럼 중 날짜 혹은 시간 관련 컬럼 존재 여부를 알려주세요. (컬럼 정의서에 명시가 되어있는 경우나 날짜 혹은 시간 관련 컬럼이 없는 경우는 Enter로 넘어가셔도 됩니다.)\n현재 {name} 데이터의 컬럼은 다음과 같습니다.\n{self.DataDict[name]["DATA"].columns.tolist()}\n\n""")
+                    self.logger.flush()
                     col_ = list(input(f"""{self.colorSetting["yellow"]}[{name}] 날짜 혹은 시간 관련 컬럼:{self.colorSetting["reset"]} """).split(","))
                     self.DataDict[name]["TIMECOL"] = [col.strip() for col in col_] if col_ != [""] else []
                     self.logger.info(f"""{self.colorSetting["yellow"]}[{name}] 날짜 혹은 시간 관련 컬럼:{self.colorSetting["reset"]}: {self.DataDict[name]["TIMECOL"]}""")
@@ -95,24 +223,142 @@ class QualityCheck:
                     if all(time_col in self.DataDict[name]["DATA"].columns.tolist() for time_col in self.DataDict[name]["TIMECOL"]):
                         break
                     self.logger.error("⛔️ 컬럼명 입력값이 잘못 입력되었습니다. 입력하신 컬럼명을 다시 한번 확인해주세요.")
+        self.tracer.stop()
         self.logger.info(f"{self.colorSetting['green']}[Step 1] 데이터 파일 존재 여부 확인 완료{self.colorSetting['reset']}")
 
+    def time_columns(self, name):
+        # config 의 timeColumns 값과 자동 추론(inferDatetime) 결과로 날짜/시간 컬럼 확인
+        Columns = self.DataDict[name]["DATA"].columns.tolist()
+        TimeCol = self.config["timeColumns"].get(name, [])
+        if any(time_col not in Columns for time_col in TimeCol):
+            self.logger.error(f"[{name}] timeColumns 에 존재하지 않는 컬럼이 포함되어 있어 제외합니다: {[time_col for time_col in TimeCol if time_col not in Columns]}")
+        TimeCol = [time_col for time_col in TimeCol if time_col in Columns]
+
+        if self.config["inferDatetime"]:
+            Inferred = [col for col in infer_datetime_columns(self.DataDict[name]["DATA"], sample_size=self.config["inferSampleSize"]) if col not in TimeCol]
+            self.logger.info(f"[{name}] 날짜 혹은 시간 관련 컬럼 추론 결과: {Inferred}")
+            TimeCol += Inferred
+        return TimeCol
+
+    def read_stream(self, name, source):
+        # 파일 경로 혹은 chunk iterator: chunk 단위로 집계하여 전체 데이터를 메모리에 올리지 않음
+        # 중복 검사는 chunk 별 행 해시를 함께 집계 (키 컬럼은 정의서를 읽기 전이므로 config duplicateKeys 기준)
+        counter = DuplicateCounter(self.config["duplicateKeys"].get(name), **{key: value for key, value in self.duplicates.items() if key != "chunk_size"}) if self.duplicates is not None else None
+        data = TableAccumulator(max_distinct=self.config["maxDistinct"], sample_size=self.config["sampleSize"], approx=self.approx).consume(iter_chunks(source, self.config["chunkSize"], self.readFunc), self.config["naList"], duplicates=counter)
+        self.logger.info(f"[{name}] 스트리밍 집계 완료 (chunk {data.n_chunks:,} 개, {data.shape[0]:,} 행)")
+        if counter is not None and counter.spilled:
+            self.logger.info(f"[{name}] 행 해시가 {self.config['duplicateMaxMB']:,} MB 를 초과하여 {self.config['duplicatePartitions']} 개 파티션으로 디스크에 기록 후 중복 검사를 수행하였습니다.")
+        return data
+
+    def read_preview(self, name, source):
+        # 미리보기: 파일 경로 혹은 chunk iterator 에서 chunk 단위로 표본만 유지 (전체 데이터를 메모리에 올리지 않음)
+        sample, population = sample_chunks(iter_chunks(source, self.config["chunkSize"], self.readFunc), **self.preview_params(), naList=self.config["naList"])
+        self.DataDict[name]["PREVIEW"] = {"DATA": sample, "population": population}
+        self.logger.info(f"[{name}] 미리보기 표본 추출 완료 (전체 {population:,} 행 중 {sample.shape[0]:,} 행)")
+        return sample
+
+    def preview_params(self):
+        return {"size": self.config["previewSize"], "fraction": self.config["previewFraction"], "method": self.config["previewMethod"]}
+
+    def read_incremental(self, name, source):
+        # 저장된 집계 상태에 추가된 행만 집계하여 병합 (기존 데이터 재집계 없음)
+        State = self.state_store.load(name)
+        if State is None:
+            State = {"DATA": TableAccumulator(max_distinct=self.config["maxDistinct"], sample_size=self.config["sampleSize"], approx=self.approx), "Applied": [], "Result": None}
+            self.logger.info(f"[{name}] 저장된 집계 상태가 없어 전달된 데이터로 새로 집계합니다.")
+        self.DataDict[name]["STATE"] = State
+
+        fingerprint = ProfileCache.fingerprint(source)
+        if fingerprint is not None and fingerprint in State["Applied"]:
+            self.logger.info(f"[{name}] 이미 반영된 데이터입니다. 저장된 집계 상태를 사용합니다.")
+            return State["DATA"]
+
+        n_rows = State["DATA"].shape[0]
+        data = TableAccumulator(**State["DATA"].params)
+        if is_stream_source(source):
+            data.consume(iter_chunks(source, self.config["chunkSize"], self.readFunc), self.config["naList"])
+        else:
+            data.consume([source], self.config["naList"])
+        State["DATA"].merge(data)
+        if fingerprint is not None:
+            State["Applied"].append(fingerprint)
+        self.logger.info(f"[{name}] 증분 집계 완료 (기존 {n_rows:,} 행 + 추가 {data.shape[0]:,} 행)")
+        return State["DATA"]
+
+    def save_state(self, data_name):
+        # 증분 QC: 변경된 컬럼 확인 후 집계 상태 저장
+        State = self.DataDict[data_name]["STATE"]
+        if State is None or "PREVIEW" in self.DataDict[data_name]:
+            return
+        self.InfoDict[data_name]["Changed"] = changed_columns(State["Result"], self.InfoDict[data_name]["Result"])
+        self.logger.info(f"[{data_name}] 통계 값이 변경된 컬럼 {len(self.InfoDict[data_name]['Changed'])} 개: {self.InfoDict[data_name]['Changed']}")
+        State["Result"] = self.InfoDict[data_name]["Result"]
+        self.state_store.save(data_name, State)
+
+    def sample_preview(self, data_name):
+        # 미리보기: 메모리에 올라온 데이터프레임에서 표본 추출 (스트리밍 집계가 완료된 테이블은 전체 기준 결과 사용)
+        data = self.DataDict[data_name]["DATA"]
+        if not isinstance(data, pd.DataFrame):
+            self.logger.info(f"[{data_name}] 전체 데이터 집계가 완료된 테이블이므로 전체 기준으로 QC 를 수행합니다.")
+            return
+        sample, population = sample_frame(data, **self.preview_params())
+        self.DataDict[data_name]["PREVIEW"] = {"DATA": sample, "population": population}
+        self.logger.info(f"[{data_name}] 미리보기 표본 추출 완료 (전체 {population:,} 행 중 {sample.shape[0]:,} 행)")
+
+    def column_key(self, data_name):
+        # 캐시 적중 확인용 컬럼 정보 key (정의서 컬럼 정보, 중복 검사 키 컬럼, 컬럼 별 검증 규칙 (정의서 규칙 + validationRules 구성 결과))
+        Rules = {col: Info["검증 규칙"] for col, Info in self.InfoDict[data_name]["Column"].items()} if self.validation is not None else None
+        return ProfileCache.key(self.InfoDict[data_name]["Column"], self.InfoDict[data_name]["Keys"], Rules)
+
+    def load_cache(self, data_name):
+        # 캐시 적중 시 저장된 결과 사용 (원천 데이터와 컬럼 정보가 모두 동일한 경우)
+        Cached = self.DataDict[data_name]["CACHED"]
+        if Cached is not None and Cached["ColumnKey"] == self.column_key(data_name):
+            self.InfoDict[data_name]["Frequency"] = {}
+            self.InfoDict[data_name]["Result"] = Cached["Result"]
+            self.set_duplicates(data_name)
+            self.logger.info(f"[{data_name}] 캐시된 QC 결과 사용")
+            return True
+
+        if isinstance(self.DataDict[data_name]["DATA"], CachedTable):
+            self.DataDict[data_name]["DATA"] = self.read_stream(data_name, self.DataDict[data_name]["DATA"].source)
+        return False
+
+    def save_cache(self, data_name):
+        if self.cache is None or self.DataDict[data_name]["CACHEKEY"] is None or "PREVIEW" in self.DataDict[data_name]:
+            return
+        data = self.DataDict[data_name]["DATA"]
+        self.cache.put(
+            self.DataDict[data_name]["CACHEKEY"],
+            {
+                "ColumnKey": self.column_key(data_name),
+                "columns": data.columns.tolist(),
+                "dtypes": dict(zip(data.columns.tolist(), data.dtypes.tolist())),
+                "shape": data.shape,
+                "TIMECOL": self.DataDict[data_name]["TIMECOL"],
+                "Result": self.InfoDict[data_name]["Result"],
+            },
+        )
+
     def document_check(self):
         self.logger.info("=" * 50)
         self.logger.info(f"{self.colorSetting['green']}[Step 2] 정의서 파일 존재 여부 확인 시작{self.colorSetting['reset']}")
+        self.tracer.start("[Step 2] 정의서 파일 존재 여부 확인", kind="step")
 
         # 정의서 파일 존재 여부 확인
         DocList = ["테이블정의서", "컬럼정의서", "코드정의서"]
+        DocFiles = os.listdir(self.PATH["DOCS"]) if os.path.isdir(self.PATH["DOCS"]) else []  # documents 폴더가 없는 경우 정의서 없음
         self.DocumentDict = {}
         for Doc in DocList:
             self.DocumentDict[Doc] = {}
 
             # 존재여부/파일경로 확인
-            if len([os.path.join(self.PATH["DOCS"], file) for file in os.listdir(self.PATH["DOCS"]) if unicodedata.normalize("NFC", Doc) in unicodedata.normalize("NFC", file)]) > 0:
+            if len([os.path.join(self.PATH["DOCS"], file) for file in DocFiles if unicodedata.normalize("NFC", Doc) in unicodedata.normalize("NFC", file)]) > 0:
                 self.DocumentDict[Doc]["EXIST"] = True
-                self.DocumentDict[Doc]["PATH"] = [os.path.join(self.PATH["DOCS"], file) for file in os.listdir(self.PATH["DOCS"]) if unicodedata.normalize("NFC", Doc) in unicodedata.normalize("NFC", file)][0]
+                self.DocumentDict[Doc]["PATH"] = [os.path.join(self.PATH["DOCS"], file) for file in DocFiles if unicodedata.normalize("NFC", Doc) in unicodedata.normalize("NFC", file)][0]
                 self.DocumentDict[Doc]["EXT"] = os.path.splitext(self.DocumentDict[Doc]["PATH"])[-1]
                 self.DocumentDict[Doc]["DATA"] = self.readFunc[self.DocumentDict[Doc]["EXT"]](self.DocumentDict[Doc]["PATH"], header=1)  # 데이터
+                self.DocumentDict[Doc]["DATA"].columns = [col.replace("\n", " ") if isinstance(col, str) else col for col in self.DocumentDict[Doc]["DATA"].columns]
                 self.logger.info(f"[{Doc}] 참고할 문서 파일 경로: {self.DocumentDict[Doc]['PATH']}")
             else:
                 self.DocumentDict[Doc]["EXIST"] = False
@@ -121,11 +367,45 @@ class QualityCheck:
                 self.DocumentDict[Doc]["DATA"] = None
                 self.logger.info(f"[{Doc}] 참고할 문서 파일이 없습니다.")
 
+        self.index_documents()
+
+        self.tracer.stop()
         self.logger.info(f"{self.colorSetting['green']}[Step 2] 정의서 파일 존재 여부를 확인 완료{self.colorSetting['reset']}")
 
+    def index_documents(self):
+        # 정의서 조회용 색인 생성 (테이블/컬럼 단위 조회 시 문서 전체 탐색 없이 dict 조회)
+        # Table: 테이블 영문명 - 테이블 정보, Column: (테이블 영문명, 컬럼 영문명) - 컬럼 정보, Code: 코드 대분류 - 코드값 목록
+        # 동일 key 가 여러 행에 존재하는 경우 첫 번째 행 기준
+        self.DocumentIndex = {"Table": {}, "Column": {}, "ColumnTable": set(), "Code": {}}
+
+        if self.DocumentDict["테이블정의서"]["EXIST"] == True:
+            table_document = self.DocumentDict["테이블정의서"]["DATA"]
+            for table_name, schema_name, table_name_kr in zip(table_document["테이블 영문명"].values, table_document["스키마명"].values, table_document["테이블 한글명"].values):
+                self.DocumentIndex["Table"].setdefault(table_name, {"스키마명": schema_name, "테이블 영문명": table_name, "테이블 한글명": table_name_kr})
+
+        if self.DocumentDict["컬럼정의서"]["EXIST"] == True:
+            column_document = self.DocumentDict["컬럼정의서"]["DATA"]
+            # 규칙 컬럼 (PK여부, NULL 값 허용여부, 길이, 허용 최솟값/최댓값, 형식) 은 정의서에 있는 경우에만 사용
+            RuleColumns = rule_columns(column_document.columns)
+            for table_name, col, col_kr, dtype, code_major, *Rules in zip(column_document["테이블 영문명"].values, column_document["컬럼 영문명"].values, column_document["컬럼 한글명"].values, column_document["데이터 타입"].values, column_document["코드대분류"].values, *[column_document[doc_col].values for doc_col in RuleColumns]):
+                self.DocumentIndex["ColumnTable"].add(table_name)
+                self.DocumentIndex["Column"].setdefault((table_name, col), {"컬럼 한글명": col_kr, "데이터 타입": dtype, "코드대분류": code_major, "검증 규칙": document_rules(dict(zip(RuleColumns, Rules)), dtype)})
+
+        if self.DocumentDict["코드정의서"]["EXIST"] == True:
+            code_document = self.DocumentDict["코드정의서"]["DATA"]
+            for code_major, code_value in zip(code_document["코드 대분류"].values, code_document["코드값"].values):
+                if pd.isna(code_major):
+                    continue
+                CodeValues = self.DocumentIndex["Code"].setdefault(code_major, [])
+                if code_value is not np.nan:
+                    CodeValues.append(code_value)
+
+        self.logger.info(f"정의서 색인 생성 완료 (테이블 {len(self.DocumentIndex['Table'])} 개, 컬럼 {len(self.DocumentIndex['Column'])} 개, 코드 대분류 {len(self.DocumentIndex['Code'])} 개)")
+
     def na_check(self):
         self.logger.info("=" * 50)
         self.logger.info(f"{self.colorSetting['green']}[Step 3] 사전에 등록된 결측값 확인 시작{self.colorSetting['reset']}")
+        self.tracer.start("[Step 3] 사전에 등록된 결측값 확인", kind="step")
 
         # 결측값 Custom 기능
         self.naList = self.config["naList"]
@@ -133,13 +413,18 @@ class QualityCheck:
         self.logger.info(f"{self.naList}")
         self.logger.info(f"결측값 추가 등록을 원하시면 config.json 파일 내 naList 값에 추가 시 반영됩니다.")
 
+        self.tracer.stop()
         self.logger.info(f"{self.colorSetting['green']}[Step 3] 사전에 등록된 결측값 확인 완료{self.colorSetting['reset']}")
 
-    def run(self):
+    def run(self, workers=None, preview=None):
+        # workers (int): 테이블 단위 병렬 처리 worker 수 (미입력 시 config.json 의 workers 값 사용)
+        # preview (bool): 테이블 별 표본으로 QC 수행 (미입력 시 config.json 의 preview 값 사용)
+        preview = self.config["preview"] if preview is None else preview
 
         # QC 수행
         self.logger.info("=" * 50)
         self.logger.info(f"{self.colorSetting['green']}[Step 4] QC 사전 정보 확인 시작{self.colorSetting['reset']}")
+        self.tracer.start("[Step 4] QC 사전 정보 확인", kind="step")
 
         self.ResultDict = {data_name: {} for data_name in self.DataDict.keys()}
         self.InfoDict = {data_name: {"Table": {}, "Column": {}} for data_name in self.DataDict.keys()}
@@ -147,15 +432,20 @@ class QualityCheck:
         # Step 1: 데이터 정보 확인
         self.logger.info("-" * 30)
         self.logger.info(f"[Step 4-1] 데이터 자체 정보 확인 시작")
+        self.tracer.start("[Step 4-1] 데이터 자체 정보 확인")
 
         for i, data_name in enumerate(self.DataDict.keys()):
             self.logger.info(f"{i + 1} 번째 데이터명: {data_name}")
+            if preview and "PREVIEW" not in self.DataDict[data_name]:
+                self.sample_preview(data_name)
 
+        self.tracer.stop()
         self.logger.info(f"[Step 4-1] 데이터 자체 정보 확인 완료")
 
         # Step 2: 정의서 문서 파일 불러오기
         self.logger.info("-" * 30)
         self.logger.info(f"[Step 4-2] 정의서 문서 정보 확인 시작")
+        self.tracer.start("[Step 4-2] 정의서 문서 정보 확인")
 
         for i, data_name in enumerate(self.DataDict.keys()):
             data = self.DataDict[data_name]["DATA"]
@@ -163,238 +453,195 @@ class QualityCheck:
             # 테이블 정의서 정보 획득
             self.logger.info(f"테이블 정의서 내 {data_name} 정보 확인 시작")
             if self.DocumentDict["테이블정의서"]["EXIST"] == True:
-                table_document = self.DocumentDict["테이블정의서"]["DATA"]
-                if data_name in table_document["테이블 영문명"].values:
+                if data_name in self.DocumentIndex["Table"]:
                     self.logger.info(f"테이블 정의서에 {data_name} 테이블 정보가 존재합니다.")
-                    self.InfoDict[data_name]["Table"]["스키마명"] = table_document.loc[table_document["테이블 영문명"] == data_name, "스키마명"].values[0]
-                    self.InfoDict[data_name]["Table"]["테이블 영문명"] = table_document.loc[table_document["테이블 영문명"] == data_name, "테이블 영문명"].values[0]
-                    self.InfoDict[data_name]["Table"]["테이블 한글명"] = table_document.loc[table_document["테이블 영문명"] == data_name, "테이블 한글명"].values[0]
+                    self.InfoDict[data_name]["Table"].update(self.DocumentIndex["Table"][data_name])
                 else:
                     self.logger.info(f"테이블 정의서에 {data_name} 테이블 정보가 존재하지 않습니다.")
                     self.InfoDict[data_name]["Table"]["스키마명"] = None
                     self.InfoDict[data_name]["Table"]["테이블 영문명"] = data_name
                     self.InfoDict[data_name]["Table"]["테이블 한글명"] = None
-                self.InfoDict[data_name]["Table"]["테이블 용량"] = None
-                self.InfoDict[data_name]["Table"]["테이블 기간"] = None
-                self.InfoDict[data_name]["Table"]["테이블 크기"] = data.shape
-
-                self.ResultDict[data_name]["Top"] = pd.DataFrame(
-                    self.InfoDict[data_name]["Table"].values(),
-                    index=[
-                        ["스키마명", "테이블 영문명", "테이블 한글명", "테이블 상세", "테이블 상세", "테이블 상세"],
-                        ["스키마명", "테이블 영문명", "테이블 한글명", "테이블 용량", "테이블 기간", "테이블 크기"],
-                    ],
-                )
-
             else:
                 self.logger.info(f"테이블 정의서 문서가 존재하지 않습니다.")
                 self.InfoDict[data_name]["Table"]["스키마명"] = None
                 self.InfoDict[data_name]["Table"]["테이블 영문명"] = data_name
                 self.InfoDict[data_name]["Table"]["테이블 한글명"] = None
-                self.InfoDict[data_name]["Table"]["테이블 용량"] = None
-                self.InfoDict[data_name]["Table"]["테이블 기간"] = None
-                self.InfoDict[data_name]["Table"]["테이블 크기"] = data.shape
-
-                self.ResultDict[data_name]["Top"] = pd.DataFrame(
-                    self.InfoDict[data_name]["Table"].values(),
-                    index=[
-                        ["스키마명", "테이블 영문명", "테이블 한글명", "테이블 상세", "테이블 상세", "테이블 상세"],
-                        ["스키마명", "테이블 영문명", "테이블 한글명", "테이블 용량", "테이블 기간", "테이블 크기"],
-                    ],
-                )
+            self.InfoDict[data_name]["Table"]["테이블 용량"] = None
+            self.InfoDict[data_name]["Table"]["테이블 기간"] = None
+            self.InfoDict[data_name]["Table"]["테이블 크기"] = data.shape
+            if "PREVIEW" in self.DataDict[data_name]:
+                Preview = self.DataDict[data_name]["PREVIEW"]
+                self.InfoDict[data_name]["Table"]["테이블 크기"] = f"{(Preview['population'], data.shape[1])} (미리보기 표본 {Preview['DATA'].shape[0]:,} 행)"
 
-            self.logger.info(f"테이블 정의서 내 {data_name} 정보 확인 완료")
+            self.build_top(data_name)
 
-            # 컬럼 정의서 & 코드 정의서 정보 획득
-            self.logger.info(f"코드 정의서 내 {data_name} 정보 확인 시작")
-            if self.DocumentDict["코드정의서"]["EXIST"] == True:
-                code_document = self.DocumentDict["코드정의서"]["DATA"]
-                code_document.columns = map(lambda x: x.replace("\n", " "), list(code_document.columns))
-                code_values = [val for val in code_document.loc[:, "코드 대분류"].drop_duplicates().values if val is not np.nan]
-            else:
-                code_document = None
-                code_values = None
-
-            self.logger.info(f"코드 정의서 내 {data_name} 정보 확인 완료")
+            self.logger.info(f"테이블 정의서 내 {data_name} 정보 확인 완료")
 
             self.logger.info(f"컬럼 정의서 내 {data_name} 정보 확인 시작")
+            # read_table 로 불러온 데이터는 최적화 전 dtype 명 사용 (불러온 이후 변환된 컬럼 제외)
+            SourceDtypes = {col: source_ for col, (source_, optimized_) in getattr(data, "attrs", {}).get("ingest", {}).get("dtypes", {}).items() if col in data.columns and data.dtypes[col].name == optimized_}
             for col in data.columns:
                 self.InfoDict[data_name]["Column"][col] = {}
 
                 # 컬럼 정보 초기 세팅
                 self.InfoDict[data_name]["Column"][col]["컬럼 영문명"] = col
                 self.InfoDict[data_name]["Column"][col]["컬럼 한글명"] = None
-                self.InfoDict[data_name]["Column"][col]["데이터 타입"] = "datetime" if col in self.DataDict[data_name]["TIMECOL"] else data[col].dtypes.name
+                self.InfoDict[data_name]["Column"][col]["데이터 타입"] = "datetime" if col in self.DataDict[data_name]["TIMECOL"] else SourceDtypes.get(col, data.dtypes[col].name)
                 self.InfoDict[data_name]["Column"][col]["코드대분류"] = None
                 self.InfoDict[data_name]["Column"][col]["코드값"] = None
+                self.InfoDict[data_name]["Column"][col]["검증 규칙"] = None
 
             if self.DocumentDict["컬럼정의서"]["EXIST"] == True:
-                column_document = self.DocumentDict["컬럼정의서"]["DATA"]
-                column_document.columns = map(lambda x: x.replace("\n", " "), list(column_document.columns))
-                column_document = column_document.loc[column_document["테이블 영문명"] == data_name, :]
-
-                if data_name in column_document["테이블 영문명"].values:
-                    self.logger.info(f"컬럼 정의서에 {data_name} 테이블의 컬럼 정보가 존재합니다.")
+                if data_name in self.DocumentIndex["ColumnTable"]:
+                    Undefined = []  # 컬럼 정의서에 정보가 없는 컬럼 (테이블 단위 요약 로그)
                     for col in data.columns:
-                        if col.upper() in column_document.loc[:, "컬럼 영문명"].values:
-                            self.logger.info(f"컬럼 정의서에 {data_name} 테이블의 {col} 컬럼 정보가 존재합니다.")
+                        ColumnDoc = self.DocumentIndex["Column"].get((data_name, col.upper()))
+                        if ColumnDoc is not None:
+                            self.logger.debug(f"컬럼 정의서에 {data_name} 테이블의 {col} 컬럼 정보가 존재합니다.")
                             self.InfoDict[data_name]["Column"][col]["컬럼 영문명"] = col
-                            self.InfoDict[data_name]["Column"][col]["컬럼 한글명"] = column_document.loc[column_document["컬럼 영문명"] == col.upper(), "컬럼 한글명"].values[0]
-                            self.InfoDict[data_name]["Column"][col]["데이터 타입"] = "datetime" if col in self.DataDict[data_name]["TIMECOL"] else column_document.loc[column_document["컬럼 영문명"] == col.upper(), "데이터 타입"].values[0]
-                            self.InfoDict[data_name]["Column"][col]["코드대분류"] = column_document.loc[column_document["컬럼 영문명"] == col.upper(), "코드대분류"].values[0]
-                            self.InfoDict[data_name]["Column"][col]["코드값"] = [val for val in code_document.loc[(code_document.loc[:, "코드 대분류"] == self.InfoDict[data_name]["Column"][col]["코드대분류"]), "코드값"].values if val is not np.nan] if self.InfoDict[data_name]["Column"][col]["코드대분류"] in code_values else None
+                            self.InfoDict[data_name]["Column"][col]["컬럼 한글명"] = ColumnDoc["컬럼 한글명"]
+                            self.InfoDict[data_name]["Column"][col]["데이터 타입"] = "datetime" if col in self.DataDict[data_name]["TIMECOL"] else ColumnDoc["데이터 타입"]
+                            self.InfoDict[data_name]["Column"][col]["코드대분류"] = ColumnDoc["코드대분류"]
+                            self.InfoDict[data_name]["Column"][col]["코드값"] = self.DocumentIndex["Code"].get(ColumnDoc["코드대분류"])
+                            self.InfoDict[data_name]["Column"][col]["검증 규칙"] = ColumnDoc["검증 규칙"]
                         else:
-                            self.logger.info(f"컬럼 정의서에 {data_name} 테이블의 {col} 컬럼 정보가 존재하지 않습니다.")
+                            Undefined.append(col)
+                            self.logger.debug(f"컬럼 정의서에 {data_name} 테이블의 {col} 컬럼 정보가 존재하지 않습니다.")
+                    self.logger.info(f"컬럼 정의서에 {data_name} 테이블의 컬럼 정보가 존재합니다. (컬럼 {data.shape[1]:,} 개 중 {data.shape[1] - len(Undefined):,} 개 정의" + (f", 미정의 컬럼: {Undefined}" if Undefined else "") + ")", table=data_name, columns=data.shape[1], undefined=len(Undefined))
                 else:
                     self.logger.info(f"컬럼 정의서에 {data_name} 테이블의 컬럼 정보가 존재하지 않습니다.")
             else:
                 self.logger.info(f"컬럼 정의서 문서가 존재하지 않습니다.")
 
+            # 중복 검사 키 컬럼 (PK여부는 검증 규칙 구성 전의 컬럼정의서 규칙 기준)
+            self.InfoDict[data_name]["Keys"] = self.duplicate_keys(data_name) if self.duplicates is not None else None
+
+            # 컬럼 별 검증 규칙 구성 (컬럼정의서 규칙 + 코드값 + config validationRules)
+            if self.validation is not None:
+                for col, Rules in compile_rules(self.InfoDict[data_name]["Column"], self.config["validationRules"].get(data_name)).items():
+                    self.InfoDict[data_name]["Column"][col]["검증 규칙"] = Rules
+                Missing = [col for col in self.config["validationRules"].get(data_name, {}) if col not in data.columns]
+                if Missing:
+                    self.logger.error(f"validationRules 에 지정된 {data_name} 테이블의 컬럼이 데이터에 존재하지 않습니다: {Missing}")
+
         # 테이블 리스트 정보 획득
         TableList_ = [[idx + 1, self.InfoDict[data_name]["Table"]["스키마명"], self.InfoDict[data_name]["Table"]["테이블 영문명"], self.InfoDict[data_name]["Table"]["테이블 한글명"], f"{idx+1:04d}_{self.InfoDict[data_name]['Table']['테이블 영문명'][:26]}"] for idx, data_name in enumerate(self.DataDict.keys())]
         self.InfoDict["TableList"] = pd.DataFrame(TableList_, columns=["No.", "스키마명", "테이블 영문명", "테이블 한글명", "워크 시트명"])
 
+        self.tracer.stop()
         self.logger.info(f"[Step 4-2] 정의서 문서 정보 확인 완료")
+        self.tracer.stop()
         self.logger.info(f"{self.colorSetting['green']}[Step 4] QC 사전 정보 확인 완료{self.colorSetting['reset']}")
 
         # Step 5. 항목별 QC 실행
         # 결과 항목 값 세팅
-        self.RelCategory = {
-            "공통": ["No", "컬럼 영문명", "컬럼 한글명", "데이터 타입", "null 개수", "%null", "적재건수", "%적재건수"],
-            "연속형": ["최솟값", "최댓값", "평균", "표준편차", "중위수"],
-            "범주형": ["범주수", "범주", "%범주", "정의된 범주 외", "정의된 범주 외 수", "최빈값", "최빈값 수", "%최빈값"],
-            "비고": ["비고"],
-        }
+        self.RelCategory = copy.deepcopy(Profiler.RelCategory)
+        self.profiler = Profiler(logger=self.logger, approx=self.approx, tracer=self.tracer, validation=self.validation, duplicates=self.duplicates)
 
         self.logger.info("=" * 50)
         self.logger.info(f"{self.colorSetting['green']}[Step 5] 항목별 데이터 QC 시작{self.colorSetting['reset']}")
-        for i, data_name in enumerate(self.DataDict.keys()):
+        self.tracer.start("[Step 5] 항목별 데이터 QC", kind="step")
+        if self.approx is not None:
+            self.logger.info(f"근사 모드로 QC 를 수행합니다. (범주수: HyperLogLog 상대 오차 ±{self.approx['distinct_error']:.2%}, 중위수: KLL 순위 오차 ±{self.approx['quantile_error']:.2%}, 최빈값 수: Count-Min 오차 적재건수의 +{self.approx['frequency_error']:.2%} 이내)")
+        DataNames = list(self.DataDict.keys())
+        if self.cache is not None:
+            DataNames = [data_name for data_name in DataNames if "PREVIEW" in self.DataDict[data_name] or not self.load_cache(data_name)]
+
+        if self.config["pipelineSave"] and "excel" in self.config["outputFormats"]:
+            self.start_pipeline()
+            self.submit_ready()
+
+        workers = self.config["workers"] if workers is None else workers
+        # DB 테이블은 DB 서버에서 집계하며 connection 을 공유하므로 순차 처리
+        Sequential = [data_name for data_name in DataNames if isinstance(self.profile_data(data_name), SqlTable)]
+        Parallel = [data_name for data_name in DataNames if data_name not in Sequential]
+        if workers > 1 and len(Parallel) > 1:
+            # 테이블 단위 병렬 처리: worker 별 로그는 버퍼링 후 테이블 순서대로 출력
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # 병렬 처리 시에만 불러옴 (multiprocessing 불러오기 시간)
+
+            Executor = ProcessPoolExecutor if self.config["executor"] == "process" else ThreadPoolExecutor
+            self.logger.info(f"{workers} 개의 worker 로 테이블 단위 병렬 QC 를 수행합니다. ({Executor.__name__})")
+            with Executor(max_workers=workers) as executor:
+                Trace = {"columns": self.tracer.columns, "memory": self.tracer.memory} if self.tracer.enabled else None
+                Outputs = executor.map(profile_table, Parallel, [self.profile_data(data_name) for data_name in Parallel], [self.InfoDict[data_name]["Column"] for data_name in Parallel], [self.approx] * len(Parallel), [self.profile_preview(data_name) for data_name in Parallel], [Trace] * len(Parallel), [self.validation] * len(Parallel), [self.duplicates] * len(Parallel), [self.InfoDict[data_name]["Keys"] for data_name in Parallel])
+                for data_name, (Result, Frequency, buffer, Records) in zip(Parallel, Outputs):
+                    buffer.flush(self.logger)
+                    self.tracer.merge(Records, parent=self.tracer.stack[-1]["id"] if self.tracer.stack else None)
+                    self.InfoDict[data_name]["Frequency"] = Frequency
+                    self.InfoDict[data_name]["Result"] = Result
+                    self.set_duplicates(data_name)
+                    self.save_cache(data_name)
+                    self.save_state(data_name)
+                    self.submit_ready()
+        else:
+            Sequential = DataNames
+        for i, data_name in enumerate(Sequential):
             self.logger.info(f"[{data_name}] QC 시작")
-            data = self.DataDict[data_name]["DATA"]
-
-            self.InfoDict[data_name]["Result"] = {f"{idx+1:03d}": {"공통": {"No": f"{idx+1:03d}", "컬럼 영문명": col}} for idx, col in enumerate(data.columns)}
-
-            # QC 항목별 초기값 설정
-            for idx in self.InfoDict[data_name]["Result"].keys():
-
-                # 공통 영역 초기값
-                self.InfoDict[data_name]["Result"][idx]["공통"]["컬럼 한글명"] = None  # 컬럼 한글명
-                self.InfoDict[data_name]["Result"][idx]["공통"]["데이터 타입"] = None  # 데이터 타입
-                self.InfoDict[data_name]["Result"][idx]["공통"]["null 개수"] = None  # null 개수
-                self.InfoDict[data_name]["Result"][idx]["공통"]["%null"] = None  # %null
-                self.InfoDict[data_name]["Result"][idx]["공통"]["적재건수"] = None  # 적재건수
-                self.InfoDict[data_name]["Result"][idx]["공통"]["%적재건수"] = None  # %적재건수
-
-                # 연속형 영역 초기값
-                self.InfoDict[data_name]["Result"][idx]["연속형"] = {}
-                self.InfoDict[data_name]["Result"][idx]["연속형"]["최솟값"] = None  # 최솟값
-                self.InfoDict[data_name]["Result"][idx]["연속형"]["최댓값"] = None  # 최댓값
-                self.InfoDict[data_name]["Result"][idx]["연속형"]["평균"] = None  # 평균
-                self.InfoDict[data_name]["Result"][idx]["연속형"]["표준편차"] = None  # 표준편차
-                self.InfoDict[data_name]["Result"][idx]["연속형"]["중위수"] = None  # 표준편차
-
-                # 범주형 영역 초기값
-                self.InfoDict[data_name]["Result"][idx]["범주형"] = {}
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["범주수"] = None  # 범주수
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["범주"] = None  # 범주
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["%범주"] = None  # %범주
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["정의된 범주 외"] = None  # 정의된 범주 외
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["정의된 범주 외 수"] = None  # 정의된 범주 외 수
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["최빈값"] = None  # 최빈값
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["최빈값 수"] = None  # 최빈값 수
-                self.InfoDict[data_name]["Result"][idx]["범주형"]["%최빈값"] = None  # %최빈값
-
-                # 비고 영역 초기값
-                self.InfoDict[data_name]["Result"][idx]["비고"] = {}
-                self.InfoDict[data_name]["Result"][idx]["비고"]["비고"] = None  # 비고
-
-            # Step 5-1: 공통 영역 QC 수행
-            for idx in self.InfoDict[data_name]["Result"].keys():
-                col = self.InfoDict[data_name]["Result"][idx]["공통"]["컬럼 영문명"]
-                self.InfoDict[data_name]["Result"][idx]["공통"]["컬럼 한글명"] = self.InfoDict[data_name]["Column"][col]["컬럼 한글명"]  # 컬럼 한글명
-                self.InfoDict[data_name]["Result"][idx]["공통"]["데이터 타입"] = self.InfoDict[data_name]["Column"][col]["데이터 타입"]  # 데이터 타입
-                self.InfoDict[data_name]["Result"][idx]["공통"]["null 개수"] = "{:,}".format(data[col].isnull().sum())  # null 개수
-                self.InfoDict[data_name]["Result"][idx]["공통"]["%null"] = "{:.2%}".format(data[col].isnull().sum() / data.shape[0])  # %null
-                self.InfoDict[data_name]["Result"][idx]["공통"]["적재건수"] = "{:,}".format(data[col].notnull().sum())  # 적재건수
-                self.InfoDict[data_name]["Result"][idx]["공통"]["%적재건수"] = "{:.2%}".format(data[col].notnull().sum() / data.shape[0])  # %적재건수
-
-                # 모든 값이 결측값인 경우, 비고에 알림 문구 작성
-                if data[col].isnull().sum() == data.shape[0]:
-                    self.InfoDict[data_name]["Result"][idx]["비고"]["비고"] = "결측값 100%"  # 비고
-
-                try:
-
-                    # Step 5-2: 연속형 영역 QC 수행
-                    if any(keyword in self.InfoDict[data_name]["Result"][idx]["공통"]["데이터 타입"] for keyword in ["float", "int", "numeric"]):
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["최솟값"] = str(data[col].min())  # 최솟값
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["최댓값"] = str(data[col].max())  # 최댓값
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["평균"] = str(data[col].mean())  # 평균
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["표준편차"] = str(data[col].std())  # 표준편차
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["중위수"] = str(np.nanmedian(data[col]))  # 표준편차
-
-                    elif any(keyword in self.InfoDict[data_name]["Result"][idx]["공통"]["데이터 타입"] for keyword in ["datetime"]):
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["최솟값"] = str(data[col].min())  # 최솟값
-                        self.InfoDict[data_name]["Result"][idx]["연속형"]["최댓값"] = str(data[col].max())  # 최댓값
-
-                    # Step 5-3: 범주형 영역 QC 수행
-                    colData = data[col].dropna()
-
-                    if any(keyword in self.InfoDict[data_name]["Result"][idx]["공통"]["데이터 타입"] for keyword in ["object", "char", "varchar", "datetime"]):
-                        self.InfoDict[data_name]["Result"][idx]["범주형"]["범주수"] = "{:,}".format(colData.nunique(dropna=True))  # 범주수
-
-                        if colData.nunique(dropna=True) <= 5:
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["범주"] = colData.dropna().unique().tolist()  # 범주
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["%범주"] = {value_: "{:.3%}".format((colData.loc[colData == value_].shape[0]) / (colData.shape[0])) for value_ in colData.unique().tolist()}  # %범주
-                        else:
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["범주"] = colData.unique()[:2].tolist() + ["..."] + colData.unique()[-2:].tolist()  # 범주
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["%범주"] = {value_: "{:.3%}".format((colData.loc[colData == value_].shape[0]) / (colData.shape[0])) for value_ in colData.unique()[:5].tolist()}  # %범주
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["%범주"]["그 외"] = "{:.3%}".format((colData.loc[~(colData.isin(colData.unique()[:5].tolist()))].shape[0]) / (colData.shape[0]))
-
-                        if self.InfoDict[data_name]["Column"][col]["코드값"] is not None:
-                            _ = [val for val in self.InfoDict[data_name]["Result"][idx]["범주형"]["범주"] if val not in self.InfoDict[data_name]["Column"][col]["코드값"]]
-                            if len(_) > 5:
-                                self.InfoDict[data_name]["Result"][idx]["범주형"]["정의된 범주 외"] = _[:2] + ["..."] + _[-2:]
-                            elif len(_) < 1:
-                                self.InfoDict[data_name]["Result"][idx]["범주형"]["정의된 범주 외"] = None
-                            else:
-                                self.InfoDict[data_name]["Result"][idx]["범주형"]["정의된 범주 외"] = _
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["정의된 범주 외 수"] = len(_)
-
-                        if len(colData.mode(dropna=True).values.tolist()) <= 3:
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["최빈값"] = colData.mode(dropna=True).values.tolist()  # 최빈값
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["최빈값 수"] = {mode_: "{:,}".format(colData.loc[colData == mode_].shape[0]) for mode_ in colData.mode(dropna=True).values.tolist()}  # 최빈값 수
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["%최빈값"] = {mode_: "{:.2%}".format((colData.loc[colData == mode_].shape[0]) / (colData.shape[0])) for mode_ in colData.mode(dropna=True).values.tolist()}  # %최빈값
-                        else:
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["최빈값"] = colData.mode(dropna=True).values.tolist()[:2] + ["..."]  # 최빈값
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["최빈값 수"] = {mode_col: "{:,}".format(colData.loc[colData == mode_col].shape[0]) for mode_col in colData.mode(dropna=True).values.tolist()[:2]}  # 최빈값 수
-                            self.InfoDict[data_name]["Result"][idx]["범주형"]["%최빈값"] = {mode_col: "{:.2%}".format((colData.loc[colData == mode_col].shape[0]) / (colData.shape[0])) for mode_col in colData.mode(dropna=True).values.tolist()[:2]}  # %최빈값
+            data = self.profile_data(data_name)
 
-                except TypeError:
-                    # 컬럼정의서 데이터 형식과 실데이터 형식 불일치할 경우
-                    self.logger.error(f"{data_name} 테이블의 {col} 컬럼 에러")
-                    self.logger.error(traceback.format_exc())
-
-                    self.InfoDict[data_name]["Result"][idx]["비고"]["비고"] = "컬럼 정의서 상의 데이터 타입과 실제 데이터 타입 불일치"  # 비고
-
-                pass
+            # Step 5-1 ~ 5-3: 공통/연속형/범주형 영역 QC 수행 (frame 단위 일괄 계산)
+            self.InfoDict[data_name]["Frequency"] = {}  # 컬럼별 빈도표 캐시
+            with self.tracer.span("테이블 QC", kind="table", table=data_name, rows=data.shape[0]):
+                self.InfoDict[data_name]["Result"] = self.profiler.profile(data_name, data, self.InfoDict[data_name]["Column"], Frequency=self.InfoDict[data_name]["Frequency"], preview=self.profile_preview(data_name), keys=self.InfoDict[data_name]["Keys"])
+            self.set_duplicates(data_name)
+            self.save_cache(data_name)
+            self.save_state(data_name)
+            self.submit_ready()
 
             self.logger.info(f"[{data_name}] QC 완료")
 
+        if self.cache is not None:
+            self.logger.info(f"[캐시] 적중 {len(self.DataDict) - len(DataNames)} 개 / 미적중 {len(DataNames)} 개 (삭제 {self.cache.evicted} 개, 경로: {self.cache.path})")
+
+        self.tracer.stop()
         self.logger.info(f"{self.colorSetting['green']}[Step 5] 항목별 데이터 QC 완료{self.colorSetting['reset']}")
 
-    def convert_to_richtext(self, src):
-        if type(src) is list:
-            try:
-                tgt = ",\n".join(src)
-            except TypeError:
-                tgt = ",\n".join(map(str, src))
-        elif type(src) is dict:
-            try:
-                tgt = "\n".join("{}: {},".format(k, v) for k, v in src.items())[:-1]
-            except TypeError:
-                tgt = ",\n".join(map(str, src))
+    def profile_data(self, data_name):
+        # QC 대상 데이터 (미리보기: 표본)
+        return self.DataDict[data_name]["PREVIEW"]["DATA"] if "PREVIEW" in self.DataDict[data_name] else self.DataDict[data_name]["DATA"]
+
+    def build_top(self, data_name):
+        # 테이블 정보 표 (테이블 상세/중복 정보 항목은 2 단계 index 로 묶어 표시)
+        Groups = {"테이블 용량": "테이블 상세", "테이블 기간": "테이블 상세", "테이블 크기": "테이블 상세", "키 컬럼": "중복 정보", "중복 행 수": "중복 정보", "중복 키 수": "중복 정보", "중복 키 상위": "중복 정보"}
+        Table = self.InfoDict[data_name]["Table"]
+        self.ResultDict[data_name]["Top"] = pd.DataFrame(Table.values(), index=[[Groups.get(key, key) for key in Table.keys()], list(Table.keys())])
+        return self.ResultDict[data_name]["Top"]
+
+    def duplicate_keys(self, data_name):
+        # 중복 검사 키 컬럼 (config duplicateKeys 우선, 미입력 시 컬럼정의서 PK여부 Y 컬럼)
+        data = self.DataDict[data_name]["DATA"]
+        if data_name in self.config["duplicateKeys"]:
+            Missing = [col for col in self.config["duplicateKeys"][data_name] if col not in data.columns]
+            if Missing:
+                self.logger.error(f"duplicateKeys 에 지정된 {data_name} 테이블의 컬럼이 데이터에 존재하지 않습니다: {Missing}")
+            return [col for col in self.config["duplicateKeys"][data_name] if col in data.columns]
+        Keys = [col for col, ColumnInfo_ in self.InfoDict[data_name]["Column"].items() if (ColumnInfo_["검증 규칙"] or {}).get("pk")]
+        if Keys and self.state_store is None and isinstance(data, (TableAccumulator, CachedTable)):
+            self.logger.info(f"[{data_name}] 스트리밍 테이블은 정의서를 읽기 전에 중복을 집계하므로 PK 컬럼 {Keys} 기준 중복 키 검사는 config duplicateKeys 에 지정한 경우에만 수행합니다.")
+            return []
+        return Keys
+
+    def set_duplicates(self, data_name):
+        # 중복 검사 결과를 테이블 정보에 추가 (검사하지 않은 테이블은 기존 항목만 표시)
+        Duplicates = self.InfoDict[data_name]["Result"].duplicates
+        if Duplicates is None:
+            if self.duplicates is not None and self.state_store is not None and "PREVIEW" not in self.DataDict[data_name]:
+                self.logger.info(f"[{data_name}] 증분 QC 테이블은 추가된 행만 읽으므로 중복 검사를 수행하지 않습니다.")
+            return
+        Table = self.InfoDict[data_name]["Table"]
+        Table["키 컬럼"] = ", ".join(map(str, Duplicates.keys)) if Duplicates.keys else None
+        Table["중복 행 수"] = Duplicates.rows
+        Table["중복 키 수"] = Duplicates.key_values
+        Table["중복 키 상위"] = ", ".join(f"{'(' + ', '.join(map(str, value_)) + ')' if isinstance(value_, tuple) else value_} ({count_:,} 건)" for value_, count_ in Duplicates.top) if Duplicates.top else None
+        self.build_top(data_name)
+
+    def profile_preview(self, data_name):
+        if "PREVIEW" not in self.DataDict[data_name]:
+            return None
+        return {"population": self.DataDict[data_name]["PREVIEW"]["population"], "confidence": self.config["previewConfidence"]}
 
-        return tgt
+    def convert_to_richtext(self, src):
+        return ResultTable.richtext(src)
 
     def save(self):
         # 결과 저장
@@ -403,28 +650,289 @@ class QualityCheck:
         # Step 6-1: 기본 Excel 파일 생성
         self.logger.info("=" * 50)
         self.logger.info(f"{self.colorSetting['green']}[Step 6] 데이터 QC 결과 저장 작업 시작{self.colorSetting['reset']}")
-        SubCol1, SubCol2 = [], []
-        for key1 in self.RelCategory.keys():
-            SubCol1 += [key1] * len(self.RelCategory[key1])
-            SubCol2 += self.RelCategory[key1]
-
-        ColList = [SubCol1, SubCol2]
+        self.tracer.start("[Step 6] 데이터 QC 결과 저장", kind="step")
+        self.FlatResult = None
+        OutputPaths = []
+        if "excel" not in self.config["outputFormats"]:
+            # 결과서 미작성 (openpyxl/xlsxwriter 미사용)
+            self.output_path()
+        elif self.pipeline is not None:
+            # 테이블 별 시트는 run 단계에서 작성 완료 (남은 시트 작성 대기 후 테이블 리스트 시트 기록)
+            OutputPath = self.OutputPath
+            self.tracer.start("[Step 6-2] 결과서 작성 대기 (pipeline)")
+            self.pipeline.close(self.InfoDict["TableList"])
+            self.tracer.stop()
+            self.logger.info(f"{self.pipeline.written} / {len(self.ResultDict.keys())} 번째 엑셀 시트 생성 완료")
+            self.pipeline = None
+            OutputPaths.append(OutputPath)
+        else:
+            OutputPath = self.output_path()
+            OutputPaths.append(OutputPath)
+            OutputPaths += self.save_workbook(OutputPath)
+        OutputPaths += self.export()
+        OutputPaths += self.save_history()
+        OutputPaths += self.save_validation()
+
+        self.tracer.stop()
+        self.logger.info(f"{self.colorSetting['green']}[Step 6] 데이터 QC 결과 저장 작업 완료{self.colorSetting['reset']}")
+        self.logger.info(f"{self.colorSetting['green']}모든 QC 프로세스가 완료되었습니다.{self.colorSetting['reset']}")
+        self.timer.stop()
+        for OutputPath in OutputPaths:
+            self.logger.info(f"산출물 파일 경로: {self.colorSetting['blue']}{OutputPath}{self.colorSetting['reset']}")
+        self.save_trace()
 
-        OutputCreatedTime = datetime.today()
-        OutputCreatedTime = OutputCreatedTime.strftime("%Y%m%d_%H%M%S")
-        OutputPath = os.path.join(self.PATH["OUTPUT"], f"QC결과서_{OutputCreatedTime}.xlsx")
+    def write_config(self):
+        # config.json 이 없는 경우 기본 설정값(naList)으로 생성 (이후 실행 시 수정하여 사용)
+        if os.path.exists(os.path.join(self.PATH["ROOT"], "config.json")):
+            return
+        with open(os.path.join(self.PATH["ROOT"], "config.json"), "w") as f:
+            json.dump({"naList": list(DefaultNaList)}, f)
+        self.logger.info(f'config 파일을 생성하였습니다. (생성 경로: {os.path.join(self.PATH["ROOT"], "config.json")})')
+
+    def output_path(self):
+        os.makedirs(self.PATH["OUTPUT"], exist_ok=True)
+        self.OutputCreatedTime = datetime.today()
+        OutputCreatedTime = self.OutputCreatedTime.strftime("%Y%m%d_%H%M%S")
+        self.OutputPath = os.path.join(self.PATH["OUTPUT"], f"QC결과서_{OutputCreatedTime}.xlsx")
+        return self.OutputPath
+
+    def flat_tables(self):
+        # 테이블 리스트 (원래 값, 미리보기 테이블의 행 수는 전체 행 수, 중복 검사를 수행하지 않은 테이블의 중복 항목은 None)
+        Rows = []
+        for idx, data_name in enumerate(self.DataDict.keys()):
+            Table = self.InfoDict[data_name]["Table"]
+            data = self.DataDict[data_name]["DATA"]
+            Preview = self.DataDict[data_name].get("PREVIEW")
+            Duplicates = self.InfoDict[data_name]["Result"].duplicates
+            Rows.append(
+                {
+                    "QC 일시": self.OutputCreatedTime.isoformat(timespec="seconds"),
+                    "No.": idx + 1,
+                    "스키마명": Table["스키마명"],
+                    "테이블 영문명": Table["테이블 영문명"],
+                    "테이블 한글명": Table["테이블 한글명"],
+                    "행 수": Preview["population"] if Preview is not None else data.shape[0],
+                    "컬럼 수": data.shape[1],
+                    "미리보기 표본 행 수": Preview["DATA"].shape[0] if Preview is not None else None,
+                    "키 컬럼": Duplicates.keys if Duplicates is not None else None,
+                    "중복 행 수": Duplicates.rows if Duplicates is not None else None,
+                    "중복 키 수": Duplicates.key_values if Duplicates is not None else None,
+                    "중복 키 행 수": Duplicates.key_rows if Duplicates is not None else None,
+                    "중복 키 상위": Duplicates.top if Duplicates is not None else None,
+                }
+            )
+        return pd.DataFrame(Rows)
+
+    def flat_results(self):
+        # 테이블 리스트 / 컬럼 결과 flat frame (결과 파일 내보내기, 이력 저장 공용으로 save 1 회당 1 회 구성)
+        if self.FlatResult is None:
+            RunTime = self.OutputCreatedTime.isoformat(timespec="seconds")
+            self.FlatResult = (self.flat_tables(), flat_columns([({"QC 일시": RunTime, "테이블 영문명": self.InfoDict[data_name]["Table"]["테이블 영문명"]}, self.InfoDict[data_name]["Result"]) for data_name in self.DataDict.keys()]))
+        return self.FlatResult
+
+    def save_history(self):
+        # Step 6-5: 테이블/컬럼 별 QC 지표를 이력 DB 에 추가하고 직전 실행 대비 변동 컬럼 보고 (미리보기 결과는 표본 기준이므로 저장하지 않음)
+        if not self.config["history"]:
+            return []
+        if any("PREVIEW" in self.DataDict[data_name] for data_name in self.DataDict.keys()):
+            self.logger.info("미리보기 결과는 QC 이력에 저장하지 않습니다.")
+            return []
+        self.tracer.start("[Step 6-5] QC 이력 저장")
+        TableFrame, ColumnFrame = self.flat_results()
+        from NexR_qc.History import HistoryStore  # 이력 저장 시에만 불러옴 (sqlite3)
+
+        store = HistoryStore(self.config["historyPath"] or os.path.join(self.PATH["OUTPUT"], "qc_history.sqlite"))
+        try:
+            run_id = store.append(self.OutputCreatedTime.isoformat(timespec="seconds"), TableFrame, ColumnFrame)
+            Drift = store.drift(run_id, self.config["driftThresholds"])
+        finally:
+            store.close()
+        self.logger.info(f"QC 이력 저장 완료 (실행 번호 {run_id}, 경로: {store.path})")
+        self.tracer.stop()
+        if Drift.empty:
+            self.logger.info("직전 실행 대비 기준값 이상 변동된 컬럼이 없습니다.")
+            return []
+
+        self.logger.info(f"{self.colorSetting['yellow']}직전 실행 대비 기준값 이상 변동된 항목 {len(Drift)} 개 ({Drift[['테이블 영문명', '컬럼 영문명']].drop_duplicates().shape[0]} 개 컬럼){self.colorSetting['reset']}")
+        for row in Drift.head(self.config["driftLogMax"]).itertuples(index=False):
+            self.logger.info(f"  {row[0]}.{row[1]} {row[2]}: {row[4]} → {row[5]} (직전 실행 {row[3]})")
+        DriftPath = os.path.join(self.PATH["OUTPUT"], f"{os.path.splitext(os.path.basename(self.OutputPath))[0]}_drift.csv")
+        Drift.to_csv(DriftPath, index=False, encoding="utf-8-sig")
+        return [DriftPath]
+
+    def save_validation(self):
+        # Step 6-6: 규칙 검증 결과를 파일로 저장하고 위반 규칙 보고 (검증 규칙이 있는 테이블만, 미리보기는 표본 기준 건수)
+        Records = [{"테이블 영문명": self.InfoDict[data_name]["Table"]["테이블 영문명"], **record} for data_name in self.DataDict.keys() for record in self.InfoDict[data_name]["Result"].violation_records()]
+        if not Records:
+            return []
+        Validation = pd.DataFrame(Records)
+        Violated = Validation[Validation["위반 건수"].fillna(0) > 0]
+        if Violated.empty:
+            self.logger.info(f"규칙 검증 결과 위반 항목이 없습니다. (규칙 {len(Validation)} 개)")
+        else:
+            self.logger.info(f"{self.colorSetting['yellow']}규칙 {len(Validation)} 개 중 {len(Violated)} 개 규칙 위반 ({Violated[['테이블 영문명', '컬럼 영문명']].drop_duplicates().shape[0]} 개 컬럼){self.colorSetting['reset']}")
+            for row in Violated.head(self.config["validationLogMax"]).to_dict(orient="records"):
+                self.logger.info(f"  {row['테이블 영문명']}.{row['컬럼 영문명']} {row['규칙 내용']}: 위반 {int(row['위반 건수']):,} 건 ({row['%위반']:.2%})")
+        ValidationPath = os.path.join(self.PATH["OUTPUT"], f"{os.path.splitext(os.path.basename(self.OutputPath))[0]}_validation.csv")
+        Exporter.encode_nested(Validation).to_csv(ValidationPath, index=False, encoding="utf-8-sig")
+        return [ValidationPath]
+
+    def export(self):
+        # Step 6-4: 테이블 리스트 / 컬럼 결과를 원래 값 그대로 parquet/jsonl/csv 파일로 저장 (outputFormats 중 excel 외 형식)
+        Formats = [format_ for format_ in self.config["outputFormats"] if format_ != "excel"]
+        if not Formats:
+            return []
+        self.tracer.start("[Step 6-4] 결과 파일 내보내기")
+        TableFrame, ColumnFrame = self.flat_results()
+        Stem = os.path.splitext(os.path.basename(self.OutputPath))[0]
+        Paths = []
+        for format_ in Formats:
+            try:
+                Paths += Exporters[format_](self.PATH["OUTPUT"], Stem, logger=self.logger).export(TableFrame, ColumnFrame)
+                self.logger.info(f"{format_} 형식 결과 파일 생성 완료")
+            except ImportError:
+                self.logger.error(f"{format_} 형식 작성에 필요한 패키지가 설치되어 있지 않아 생성하지 않습니다. (parquet: pyarrow 필요)")
+        self.tracer.stop()
+        return Paths
+
+    def build_bottom(self, data_name):
+        # 테이블 별 컬럼 QC 결과표 (결과서 서식 적용, list/dict 값은 줄바꿈 문자열로 변환)
+        self.ResultDict[data_name]["Bottom"] = self.InfoDict[data_name]["Result"].to_frame()
+        return self.ResultDict[data_name]["Bottom"]
+
+    def start_pipeline(self):
+        # 결과서 pipeline 작성: 테이블 QC 완료 순서와 무관하게 테이블 순서대로 시트 작성 (xlsxwriter 미설치 시 기존 방식으로 save 단계에서 작성)
+        if self.shard:
+            self.logger.info("분할 결과서 작성 시 pipelineSave 는 사용하지 않습니다. (save 단계에서 분할 결과서 파일 별로 작성)")
+            return
+        try:
+            self.pipeline = BackgroundExcelWriter(self.output_path(), self.RelCategory, max_pending=self.config["pipelineMaxPending"], logger=self.logger)
+        except ImportError:
+            self.logger.error("xlsxwriter 패키지가 설치되어 있지 않아 save 단계에서 결과서를 생성합니다.")
+            return
+        self.submitted = 0
+        self.logger.info(f"테이블 QC 완료 시 결과서 시트를 background 로 작성합니다. (최대 대기 테이블 {self.config['pipelineMaxPending']} 개)")
 
+    def submit_ready(self):
+        # QC 결과가 준비된 테이블을 테이블 순서대로 작성 요청 (작성 대기 테이블이 가득 찬 경우 대기)
+        if self.pipeline is None:
+            return
+        DataNames = list(self.DataDict.keys())
+        while self.submitted < len(DataNames) and "Result" in self.InfoDict[DataNames[self.submitted]]:
+            data_name = DataNames[self.submitted]
+            self.submitted += 1
+            sheet_name = f"{self.submitted:04d}_{self.InfoDict[data_name]['Table']['테이블 영문명'][:26]}"
+            self.pipeline.submit(sheet_name, lambda data_name=data_name: (self.ResultDict[data_name]["Top"], self.build_bottom(data_name)))
+
+    def save_workbook(self, OutputPath):
+        self.tracer.start("[Step 6-1] 결과표 구성")
         for data_name in self.DataDict.keys():
-            ResultList = []
-            for idx in self.InfoDict[data_name]["Result"].keys():
-                ResultList_ = []
-                for key1 in self.InfoDict[data_name]["Result"][idx]:
-                    ResultList_ += [(self.convert_to_richtext(self.InfoDict[data_name]["Result"][idx][key1][key2]) if ((type(self.InfoDict[data_name]["Result"][idx][key1][key2]) is list) or (type(self.InfoDict[data_name]["Result"][idx][key1][key2]) is dict)) else self.InfoDict[data_name]["Result"][idx][key1][key2]) for key2 in self.InfoDict[data_name]["Result"][idx][key1]]
+            self.build_bottom(data_name)
+        self.tracer.stop()
+
+        # 결과서 외에 생성한 파일 경로 목록 반환 (분할 결과서)
+        if self.shard:
+            if importlib.util.find_spec("xlsxwriter") is not None:
+                return self.save_shards(OutputPath)
+            self.logger.error("xlsxwriter 패키지가 설치되어 있지 않아 하나의 결과서 파일로 생성합니다.")
+        if self.config["excelEngine"] == "xlsxwriter":
+            try:
+                self.save_xlsxwriter(OutputPath)
+            except ImportError:
+                self.logger.error("xlsxwriter 패키지가 설치되어 있지 않아 openpyxl 방식으로 결과서를 생성합니다.")
+                self.save_openpyxl(OutputPath)
+        else:
+            self.save_openpyxl(OutputPath)
+        return []
+
+    def shard_tables(self):
+        # 테이블 순서대로 파일 당 shardTables 개, 컬럼 결과 shardColumns 행 이내로 분할 (컬럼 수가 shardColumns 를 넘는 테이블은 단독 파일)
+        Shards, Current, n_columns = [], [], 0
+        for idx, data_name in enumerate(self.DataDict.keys()):
+            n = len(self.InfoDict[data_name]["Column"])
+            if Current and ((self.config["shardTables"] and len(Current) >= self.config["shardTables"]) or (self.config["shardColumns"] and n_columns + n > self.config["shardColumns"])):
+                Shards.append(Current)
+                Current, n_columns = [], 0
+            Current.append(idx)
+            n_columns += n
+        if Current:
+            Shards.append(Current)
+        return Shards
+
+    def save_shards(self, OutputPath):
+        # Step 6-1 & 6-2: 테이블을 여러 결과서 파일(QC결과서_<생성시각>_001.xlsx, ...)로 나누어 작성 후 분할 파일의 시트로 연결하는 테이블 리스트 색인 파일 작성 (xlsxwriter)
+        self.tracer.start("[Step 6-2] 결과서 작성 (분할)")
+        DataNames = list(self.DataDict.keys())
+        TableList = self.InfoDict["TableList"]
+        Stem = os.path.splitext(OutputPath)[0]
+        Files = [None] * len(DataNames)
+        Jobs = []
+        for shard_i, Indexes in enumerate(self.shard_tables(), start=1):
+            ShardPath = f"{Stem}_{shard_i:03d}.xlsx"
+            for idx in Indexes:
+                Files[idx] = os.path.basename(ShardPath)
+            Jobs.append((ShardPath, TableList.iloc[Indexes], [(TableList.iloc[idx, 4], self.ResultDict[DataNames[idx]]["Top"], self.ResultDict[DataNames[idx]]["Bottom"]) for idx in Indexes], self.RelCategory))
+
+        def written(Paths):
+            for shard_i, (path, Job) in enumerate(zip(Paths, Jobs), start=1):
+                self.logger.info(f"{shard_i} / {len(Jobs)} 번째 결과서 파일 생성 완료 (테이블 {len(Job[2])} 개, {os.path.basename(path)})")
+                yield path
+
+        workers = min(self.config["shardWorkers"], len(Jobs))
+        if workers > 1:
+            # 분할 파일 단위 병렬 작성 (파일 별로 독립된 workbook)
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # 병렬 작성 시에만 불러옴 (multiprocessing 불러오기 시간)
+
+            Executor = ProcessPoolExecutor if self.config["executor"] == "process" else ThreadPoolExecutor
+            self.logger.info(f"{workers} 개의 worker 로 결과서 파일 {len(Jobs)} 개를 병렬 작성합니다. ({Executor.__name__})")
+            with Executor(max_workers=workers) as executor:
+                ShardPaths = list(written(executor.map(write_shard, *zip(*Jobs))))
+        else:
+            ShardPaths = list(written(map(write_shard, *zip(*Jobs))))
+
+        # 색인 파일은 분할 파일 작성 완료 후 생성 (분할 파일 작성 실패 시 열린 채로 남지 않도록)
+        index = FastExcelWriter(OutputPath, logger=self.logger)
+        index.write_table_list(TableList, Files=Files)
+        index.close()
+        self.logger.info(f"테이블 리스트 색인 파일 생성 완료 (결과서 파일 {len(ShardPaths)} 개)")
+        self.tracer.stop()
+        return ShardPaths
+
+    def save_trace(self):
+        # 성능 측정 결과 저장 (로그 파일과 같은 경로에 _trace.json / _trace.csv) 및 소요시간 상위 테이블/컬럼 출력
+        if not self.tracer.enabled:
+            return
+        self.tracer.summary(self.logger, self.config["traceTopN"])
+        # 로그 파일을 저장하지 않는 logger (save=False, 외부 전달 logger 등) 인 경우 log 폴더에 생성시각 기준 파일명으로 저장
+        LogPath = getattr(self.logger, "log_path", None) or os.path.join(self.PATH["LOG"], f"QualityCheck_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+        os.makedirs(os.path.dirname(LogPath), exist_ok=True)  # 로그 파일은 background thread 에서 생성되므로 폴더 확인
+        TracePaths = self.tracer.export(f"{os.path.splitext(LogPath)[0]}_trace")
+        self.logger.info(f"성능 측정 파일 경로: {self.colorSetting['blue']}{', '.join(TracePaths)}{self.colorSetting['reset']}")
+
+    def save_xlsxwriter(self, OutputPath):
+        # Step 6-1 & 6-2: 값/서식을 한 번에 기록 (xlsxwriter)
+        self.tracer.start("[Step 6-2] 결과서 작성 (xlsxwriter)")
+        writer = FastExcelWriter(OutputPath, logger=self.logger)
+        writer.write_table_list(self.InfoDict["TableList"])
+        self.logger.info(f"테이블 리스트 시트 생성 완료")
+
+        for idx, data_name in enumerate(self.ResultDict.keys()):
+            sheet_name = f"{idx+1:04d}_{self.InfoDict[data_name]['Table']['테이블 영문명'][:26]}"
+            writer.write_table(sheet_name, self.ResultDict[data_name]["Top"], self.ResultDict[data_name]["Bottom"], self.RelCategory)
 
-                ResultList.append(ResultList_)
+            if any([(idx + 1) % 10 == 0, (idx + 1) == len(self.ResultDict.keys())]):
+                self.logger.info(f"{idx + 1} / {len(self.ResultDict.keys())} 번째 엑셀 시트 생성 완료")
 
-            self.ResultDict[data_name]["Bottom"] = pd.DataFrame(ResultList, columns=ColList)
+        writer.close()
+        self.tracer.stop()
 
+    def save_openpyxl(self, OutputPath):
+        # Step 6-1: pandas 로 값 기록 후 Step 6-2: openpyxl 로 서식 편집
+        from openpyxl import load_workbook
+        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+        from openpyxl.worksheet.dimensions import ColumnDimension
+
+        self.tracer.start("[Step 6-2] 결과서 값 기록 (openpyxl)")
         with pd.ExcelWriter(OutputPath, mode="w", engine="openpyxl") as writer:
 
             # Step 6-1-a 테이블 리스트 시트
@@ -455,13 +963,16 @@ class QualityCheck:
                     header=True,
                     sheet_name=f"{idx+1:04d}_{self.InfoDict[data_name]['Table']['테이블 영문명'][:26]}",
                     startcol=0,
-                    startrow=9,
+                    startrow=len(self.ResultDict[data_name]["Top"]) + 3,
                 )
 
                 if any([(idx + 1) % 10 == 0, (idx + 1) == len(self.ResultDict.keys())]):
                     self.logger.info(f"{idx + 1} / {len(self.ResultDict.keys())} 번째 엑셀 시트 생성 완료")
 
+        self.tracer.stop()
+
         # Step 6-2: 저장한 Excel 파일 서식 편집
+        self.tracer.start("[Step 6-3] 결과서 서식 편집 (openpyxl)")
         wb = load_workbook(OutputPath)
 
         thin = Side(border_style="thin", color="000000")
@@ -511,8 +1022,11 @@ class QualityCheck:
 
                 sheet_name = f"{idx+1:04d}_{self.InfoDict[data_name]['Table']['테이블 영문명'][:26]}"
                 ws = wb[sheet_name]
+                # 테이블 정보 항목 수 (중복 검사 결과가 있는 경우 중복 정보 항목만큼 컬럼 정보 위치가 아래로 이동)
+                TopIndex = list(self.ResultDict[data_name]["Top"].index)
+                start = len(TopIndex) + 3
 
-                ws.delete_rows(12)
+                ws.delete_rows(start + 3)
                 ws.delete_cols(1)
 
                 for mcr in ws.merged_cells:
@@ -527,35 +1041,36 @@ class QualityCheck:
                 ws.cell(row=1, column=1).fill = PatternFill("solid", fgColor="000000")
                 ws.cell(row=1, column=1).alignment = Alignment(horizontal="center", vertical="center")
                 ws.cell(row=1, column=1).border = Border(top=thin, left=thin, right=thin, bottom=thin)
-                ws.merge_cells(start_row=2, end_row=2, start_column=1, end_column=2)
-                ws.merge_cells(start_row=3, end_row=3, start_column=1, end_column=2)
-                ws.merge_cells(start_row=4, end_row=4, start_column=1, end_column=2)
-
-                ws.merge_cells(start_row=9, end_row=9, start_column=1, end_column=2)
-                ws.cell(row=9, column=1).value = "컬럼 정보"
-                ws.cell(row=9, column=1).font = Font(bold=True, color="ffffff")
-                ws.cell(row=9, column=1).fill = PatternFill("solid", fgColor="000000")
-                ws.cell(row=9, column=1).alignment = Alignment(horizontal="center", vertical="center")
-                ws.cell(row=9, column=1).border = Border(top=thin, left=thin, right=thin, bottom=thin)
-
-                for cell_ in ws["A2":"B7"]:
+                for row_i, (key1, key2) in enumerate(TopIndex, start=2):
+                    if key1 == key2:
+                        ws.merge_cells(start_row=row_i, end_row=row_i, start_column=1, end_column=2)
+
+                ws.merge_cells(start_row=start, end_row=start, start_column=1, end_column=2)
+                ws.cell(row=start, column=1).value = "컬럼 정보"
+                ws.cell(row=start, column=1).font = Font(bold=True, color="ffffff")
+                ws.cell(row=start, column=1).fill = PatternFill("solid", fgColor="000000")
+                ws.cell(row=start, column=1).alignment = Alignment(horizontal="center", vertical="center")
+                ws.cell(row=start, column=1).border = Border(top=thin, left=thin, right=thin, bottom=thin)
+
+                for cell_ in ws["A2":f"B{len(TopIndex) + 1}"]:
                     for cell in cell_:
                         cell.fill = PatternFill("solid", fgColor="bfbfbf")
                         cell.alignment = Alignment(horizontal="center", vertical="center")
                         cell.border = Border(top=thin, left=thin, right=thin, bottom=thin)
-                for cell_ in ws["B5":"B7"]:
-                    for cell in cell_:
+                for row_i, (key1, key2) in enumerate(TopIndex, start=2):
+                    if key1 != key2:
+                        cell = ws.cell(row=row_i, column=2)
                         cell.fill = PatternFill("solid", fgColor="d9d9d9")
                         cell.alignment = Alignment(horizontal="center", vertical="center")
                         cell.border = Border(top=thin, left=thin, right=thin, bottom=thin)
-                for cell_ in ws["C2":"C7"]:
+                for cell_ in ws["C2":f"C{len(TopIndex) + 1}"]:
                     for cell in cell_:
                         cell.alignment = Alignment(vertical="center")
                         cell.border = Border(top=thin, left=thin, right=thin, bottom=thin)
 
                 for i_, row in enumerate(ws.rows):
                     for cell_ in row:
-                        if i_ == 9:
+                        if i_ == start:
                             if cell_.value in ["공통"]:
                                 cell = ws[cell_.coordinate]
                                 cell.fill = PatternFill("solid", fgColor="bfbfbf")
@@ -573,7 +1088,7 @@ class QualityCheck:
                                 cell = ws[cell_.coordinate]
                                 cell.fill = PatternFill("solid", fgColor="bfbfbf")
                                 cell.alignment = Alignment(horizontal="center", vertical="center")
-                        elif i_ == 10:
+                        elif i_ == start + 1:
                             if cell_.value in self.RelCategory["공통"] + self.RelCategory["비고"]:
                                 cell = ws[cell_.coordinate]
                                 cell.fill = PatternFill("solid", fgColor="d9d9d9")
@@ -586,7 +1101,7 @@ class QualityCheck:
                                 cell = ws[cell_.coordinate]
                                 cell.fill = PatternFill("solid", fgColor="bdd7ee")
                                 cell.alignment = Alignment(horizontal="center", vertical="center")
-                        elif i_ >= 11:
+                        elif i_ >= start + 2:
                             if cell_.value == "컬럼 정의서 상의 데이터 타입과 실제 데이터 타입 불일치":
                                 cell = ws[cell_.coordinate]
                                 cell.fill = PatternFill("solid", fgColor="f79645")
@@ -599,6 +1114,12 @@ class QualityCheck:
                                 cell.font = Font(bold=True, color="ff0000")
                                 cell.alignment = Alignment(vertical="center", wrap_text=True)
                                 cell.border = Border(top=thin, left=thin, right=thin, bottom=thin)
+                            elif cell_.value in [Profiler.ApproxRemark, Profiler.PreviewRemark]:
+                                cell = ws[cell_.coordinate]
+                                cell.fill = PatternFill("solid", fgColor="ddebf7")
+                                cell.font = Font(bold=True, color="1f4e78")
+                                cell.alignment = Alignment(vertical="center", wrap_text=True)
+                                cell.border = Border(top=thin, left=thin, right=thin, bottom=thin)
                             else:
                                 cell = ws[cell_.coordinate]
                                 cell.alignment = Alignment(vertical="center", wrap_text=True)
@@ -615,7 +1136,4 @@ class QualityCheck:
                 pass
 
         wb.save(OutputPath)
-        self.logger.info(f"{self.colorSetting['green']}[Step 6] 데이터 QC 결과 저장 작업 완료{self.colorSetting['reset']}")
-        self.logger.info(f"{self.colorSetting['green']}모든 QC 프로세스가 완료되었습니다.{self.colorSetting['reset']}")
-        self.timer.stop()
-        self.logger.info(f"산출물 파일 경로: {self.colorSetting['blue']}{OutputPath}{self.colorSetting['reset']}")
+        self.tracer.stop()
@@ -0,0 +1,176 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# 미리보기 추정값 (추정값, 신뢰구간 하한, 신뢰구간 상한)
+Estimate = namedtuple("Estimate", ["value", "lower", "upper"])
+# 규칙 검증 결과 (컬럼 순번, 규칙, 규칙 내용, 검사 행 수, 위반 건수, 위반 예시 [(행 index, 값), ...], 비고)
+Violation = namedtuple("Violation", ["i", "rule", "detail", "n_rows", "count", "samples", "remark"])
+# 중복 검사 결과 (키 컬럼 목록, 검사 행 수, 중복 행 수, 중복 키 수, 중복 키 행 수, 중복 키 상위 [(키 값, 건수), ...]), 키 컬럼이 없으면 키 항목은 None
+Duplicates = namedtuple("Duplicates", ["keys", "n_rows", "rows", "key_values", "key_rows", "top"])
+
+
+class ResultTable:
+    """Columnar QC result of one table holding raw values (결과서 서식은 export 시점에만 적용)
+
+    공통 영역의 건수/비율은 numpy 배열, 그 외 항목은 항목 별 list 로 보관
+    근사값 항목은 approx {(컬럼 순번, 항목)}, 미리보기 추정값은 estimates {(컬럼 순번, 항목): Estimate}, 규칙 검증 결과는 violations [Violation] 에 보관
+    테이블 단위 중복 검사 결과는 duplicates (Duplicates, 미수행 시 None)
+    """
+
+    # 결과 항목
+    RelCategory = {
+        "공통": ["No", "컬럼 영문명", "컬럼 한글명", "데이터 타입", "null 개수", "%null", "적재건수", "%적재건수"],
+        "연속형": ["최솟값", "최댓값", "평균", "표준편차", "중위수"],
+        "범주형": ["범주수", "범주", "%범주", "정의된 범주 외", "정의된 범주 외 수", "최빈값", "최빈값 수", "%최빈값"],
+        "비고": ["비고"],
+    }
+    Keys = [key2 for key2s in RelCategory.values() for key2 in key2s]
+    Arrays = {"null 개수": np.int64, "%null": np.float64, "적재건수": np.int64, "%적재건수": np.float64}
+
+    # 결과서 서식 (dict 값은 값마다 적용, 미입력 항목은 원래 값 사용)
+    Formats = {
+        "null 개수": "{:,}".format,
+        "%null": "{:.2%}".format,
+        "적재건수": "{:,}".format,
+        "%적재건수": "{:.2%}".format,
+        "최솟값": str,
+        "최댓값": str,
+        "평균": str,
+        "표준편차": str,
+        "중위수": str,
+        "범주수": "{:,}".format,
+        "%범주": "{:.3%}".format,
+        "최빈값 수": "{:,}".format,
+        "%최빈값": "{:.2%}".format,
+    }
+    EstimateFormats = {"null 개수": "{:,.0f}".format, "%null": "{:.2%}".format, "적재건수": "{:,.0f}".format, "%적재건수": "{:.2%}".format}
+    ApproxMark = "≈"
+    duplicates = None  # 이전 버전에서 저장된 캐시/증분 QC 결과 호환
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        n = len(self.columns)
+        self.values = {key2: (np.zeros(n, dtype=self.Arrays[key2]) if key2 in self.Arrays else [None] * n) for key2 in self.Keys if key2 not in ["No", "컬럼 영문명"]}
+        self.approx = set()
+        self.estimates = {}
+        self.violations = []
+        self.duplicates = None
+
+    def __len__(self):
+        return len(self.columns)
+
+    @staticmethod
+    def index(i):
+        # 컬럼 순번 (결과서 No, 빈도표 key)
+        return f"{i+1:03d}"
+
+    def get(self, i, key2):
+        if key2 == "No":
+            return self.index(i)
+        if key2 == "컬럼 영문명":
+            return self.columns[i]
+        return self.values[key2][i]
+
+    def set(self, i, key2, value):
+        self.values[key2][i] = value
+
+    def mark_approximate(self, i, key2s):
+        self.approx.update((i, key2) for key2 in key2s)
+
+    def set_estimate(self, i, key2, value, lower, upper):
+        self.estimates[(i, key2)] = Estimate(value, lower, upper)
+
+    def add_violation(self, i, rule, detail, n_rows, count, samples, remark):
+        self.violations.append(Violation(i, rule, detail, n_rows, count, samples, remark))
+
+    def violation_records(self):
+        """Flat per-rule records of the validation result (규칙 검증 결과 파일)"""
+        return [
+            {
+                "No": self.index(violation_.i),
+                "컬럼 영문명": self.columns[violation_.i],
+                "규칙": violation_.rule,
+                "규칙 내용": violation_.detail,
+                "검사 행 수": violation_.n_rows,
+                "위반 건수": violation_.count,
+                "%위반": violation_.count / violation_.n_rows if violation_.count is not None and violation_.n_rows > 0 else None,
+                "위반 예시": violation_.samples,
+                "비고": violation_.remark,
+            }
+            for violation_ in self.violations
+        ]
+
+    def column(self, key2, formatted=True):
+        """Values of one result item for every column (formatted: 결과서 값, 근사값 ≈ 표시, 미리보기 추정값은 신뢰구간 포함)"""
+        if key2 == "No":
+            return [self.index(i) for i in range(len(self))]
+        if key2 == "컬럼 영문명":
+            return list(self.columns)
+        values = self.values[key2]
+        values = values.tolist() if isinstance(values, np.ndarray) else list(values)
+        fmt = self.Formats.get(key2)
+        if not formatted or fmt is None:
+            return values
+
+        values = [None if value is None else ({key_: fmt(value_) for key_, value_ in value.items()} if isinstance(value, dict) else fmt(value)) for value in values]
+        for i, key2_ in self.approx:
+            if key2_ == key2 and values[i] is not None:
+                values[i] = {key_: f"{self.ApproxMark}{value_}" for key_, value_ in values[i].items()} if isinstance(values[i], dict) else f"{self.ApproxMark}{values[i]}"
+        for (i, key2_), estimate_ in self.estimates.items():
+            if key2_ == key2:
+                fmt = self.EstimateFormats[key2]
+                values[i] = f"{self.ApproxMark}{fmt(estimate_.value)} ({fmt(estimate_.lower)} ~ {fmt(estimate_.upper)})"
+        return values
+
+    def to_dict(self):
+        """Nested {No: {key1: {key2: 결과서 값}}} form (기존 InfoDict Result 형태)"""
+        Columns = {key2: self.column(key2) for key2 in self.Keys}
+        return {self.index(i): {key1: {key2: Columns[key2][i] for key2 in key2s} for key1, key2s in self.RelCategory.items()} for i in range(len(self))}
+
+    def to_records(self):
+        """Flat per-column records of raw values (기계 판독용 내보내기)
+
+        미리보기 추정 항목은 전체 기준 추정값을 사용하며, 근사값/추정값 항목명은 "근사 항목", 추정값 신뢰구간은 "신뢰구간" {항목: [하한, 상한]},
+        규칙 검증 위반 건수는 "규칙 위반" {규칙: 위반 건수} 에 기록
+        """
+        Columns = {key2: self.column(key2, formatted=False) for key2 in self.Keys}
+        Approx = [[] for _ in range(len(self))]
+        Intervals = [None] * len(self)
+        for i, key2 in sorted(self.approx | set(self.estimates), key=lambda x: (x[0], self.Keys.index(x[1]))):
+            Approx[i].append(key2)
+        for (i, key2), estimate_ in self.estimates.items():
+            Columns[key2][i] = estimate_.value
+            Intervals[i] = Intervals[i] or {}
+            Intervals[i][key2] = [estimate_.lower, estimate_.upper]
+        Violations = [None] * len(self)
+        for violation_ in self.violations:
+            Violations[violation_.i] = Violations[violation_.i] or {}
+            Violations[violation_.i][violation_.rule] = violation_.count
+        return [{**{key2: Columns[key2][i] for key2 in self.Keys}, "근사 항목": Approx[i] or None, "신뢰구간": Intervals[i], "규칙 위반": Violations[i]} for i in range(len(self))]
+
+    @staticmethod
+    def richtext(src):
+        # list/dict 값은 줄바꿈 문자열로 변환
+        if type(src) is list:
+            try:
+                return ",\n".join(src)
+            except TypeError:
+                return ",\n".join(map(str, src))
+        try:
+            return "\n".join("{}: {},".format(k, v) for k, v in src.items())[:-1]
+        except TypeError:
+            return ",\n".join(map(str, src))
+
+    def to_frame(self, formatted=True):
+        """Result frame (formatted: 결과서 값, 항목 (구분, 항목명) MultiIndex 컬럼 / raw: 원래 값, 항목명 컬럼)"""
+        Columns = {}
+        for key2 in self.Keys:
+            Columns[key2] = self.column(key2, formatted=formatted)
+            if formatted:
+                Columns[key2] = [self.richtext(value) if type(value) is list or type(value) is dict else value for value in Columns[key2]]
+        frame = pd.DataFrame(Columns, index=range(len(self)))
+        if formatted:
+            frame.columns = pd.MultiIndex.from_arrays([[key1 for key1, key2s in self.RelCategory.items() for _ in key2s], self.Keys])
+        return frame
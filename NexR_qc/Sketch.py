@@ -0,0 +1,258 @@
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values):
+    # 값 목록을 64bit 해시값으로 변환 (dtype 과 무관하게 동일 값은 동일 해시값을 갖도록 object 기준으로 계산)
+    return pd.util.hash_pandas_object(pd.Series(values).astype(object), index=False).to_numpy(dtype=np.uint64)
+
+
+class HyperLogLog:
+    """Mergeable distinct count estimator (relative error ~ 1.04 / sqrt(2 ** p))"""
+
+    def __init__(self, p=14):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @staticmethod
+    def precision(error):
+        # 목표 상대 오차(표준오차)를 만족하는 register 수 2 ** p (p: 4 ~ 18)
+        return int(np.clip(np.ceil(2 * np.log2(1.04 / error)), 4, 18))
+
+    def update(self, values):
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes):
+        if hashes.shape[0] == 0:
+            return self
+        idx = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        # rank: 남은 (64 - p) bit 중 첫 번째 1 의 위치
+        rank = np.full(rest.shape[0], 64 - self.p + 1, dtype=np.uint8)
+        nonzero = rest > 0
+        rank[nonzero] = (64 - self.p) - np.floor(np.log2(rest[nonzero].astype(np.float64))).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+        return self
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m**2 / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.m and zeros > 0:
+            # 소규모 구간 보정 (linear counting)
+            return int(round(self.m * np.log(self.m / zeros)))
+        return int(round(raw))
+
+
+class MisraGries:
+    """Mergeable top-k frequency summary (count error <= total / (k + 1))"""
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counters = {}
+        self.total = 0
+
+    def update(self, Counts):
+        # Counts: value - count 형태의 dict 혹은 pd.Series (value_counts 결과)
+        for value_, count_ in (Counts.items() if isinstance(Counts, dict) else zip(Counts.index.tolist(), Counts.tolist())):
+            self.counters[value_] = self.counters.get(value_, 0) + int(count_)
+            self.total += int(count_)
+        self._prune()
+        return self
+
+    def merge(self, other):
+        for value_, count_ in other.counters.items():
+            self.counters[value_] = self.counters.get(value_, 0) + count_
+        self.total += other.total
+        self._prune()
+        return self
+
+    def _prune(self):
+        if len(self.counters) > self.k:
+            # (k + 1) 번째 빈도만큼 전체 카운터 차감
+            threshold = sorted(self.counters.values(), reverse=True)[self.k]
+            self.counters = {value_: count_ - threshold for value_, count_ in self.counters.items() if count_ > threshold}
+
+    def query(self, values):
+        # 빈도 추정값 (과소 추정, 오차 <= total / (k + 1))
+        return np.array([self.counters.get(value_, 0) for value_ in values], dtype=np.int64)
+
+    def top(self, k=None):
+        return sorted(self.counters.items(), key=lambda x: -x[1])[: (k or self.k)]
+
+
+class CountMinTopK:
+    """Mergeable top-k frequency summary backed by a Count-Min sketch (count overestimate <= error * total, probability 1 - delta)
+
+    candidates: chunk 별 빈도 상위 k 개 범주를 후보로 유지하고 빈도는 sketch 로 추정
+    """
+
+    def __init__(self, k=100, error=0.001, delta=0.01, seed=0):
+        self.k = k
+        self.width = int(np.ceil(np.e / error))
+        self.depth = int(np.ceil(np.log(1 / delta)))
+        # 행 별 hash 함수 (동일 seed 의 sketch 끼리만 병합 가능)
+        rng = np.random.default_rng(seed)
+        self.multipliers = rng.integers(1, 2**63, size=self.depth, dtype=np.uint64) | np.uint64(1)
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.counters = {}
+        self.total = 0
+
+    def _columns(self, hashes):
+        # (depth, n) 위치 행렬: multiply-shift 방식
+        return ((hashes[None, :] * self.multipliers[:, None]) >> np.uint64(32)) % np.uint64(self.width)
+
+    def update(self, Counts, hashes=None):
+        # Counts: value_counts 결과 (pd.Series), hashes: Counts.index 의 hash_values (미전달 시 계산)
+        if Counts.shape[0] == 0:
+            return self
+        hashes = hash_values(Counts.index) if hashes is None else hashes
+        counts = Counts.to_numpy(dtype=np.int64)
+        Columns = self._columns(hashes).astype(np.int64)
+        for row in range(self.depth):
+            np.add.at(self.table[row], Columns[row], counts)
+        self.total += int(counts.sum())
+        Top = Counts.nlargest(self.k, keep="first")
+        self._refresh(list(self.counters.keys()) + Top.index.tolist())
+        return self
+
+    def merge(self, other):
+        self.table += other.table
+        self.total += other.total
+        self._refresh(list(self.counters.keys()) + list(other.counters.keys()))
+        return self
+
+    def _refresh(self, Candidates):
+        # 후보 범주의 추정 빈도를 다시 조회하여 상위 k 개 유지
+        Candidates = list(dict.fromkeys(Candidates))
+        Estimates = self.query(Candidates)
+        Order = np.argsort(-Estimates, kind="stable")[: self.k]
+        self.counters = {Candidates[i]: int(Estimates[i]) for i in Order}
+
+    def query(self, values):
+        if len(values) == 0:
+            return np.empty(0, dtype=np.int64)
+        Columns = self._columns(hash_values(values)).astype(np.int64)
+        return self.table[np.arange(self.depth)[:, None], Columns].min(axis=0)
+
+    def top(self, k=None):
+        return sorted(self.counters.items(), key=lambda x: -x[1])[: (k or self.k)]
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (KLL compactors, normalized rank error ~ error)
+
+    levels[h]: 가중치 2 ** h 인 값 목록, 압축(compaction)이 발생하지 않은 동안은 전체 값을 보관하므로 정확한 값 산출
+    """
+
+    def __init__(self, error=0.01, seed=0):
+        self.error = error
+        self.k = max(int(np.ceil(3.3 / error)), 8)
+        self.rng = np.random.default_rng(seed)
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self.count = 0
+        self.compacted = False
+
+    def _capacity(self, h):
+        # 상위 level 일수록 큰 용량 (하위 level 은 2/3 비율로 감소)
+        return max(int(np.ceil(self.k * (2 / 3) ** (len(self.levels) - h - 1))), 2)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.count += values.shape[0]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.count += other.count
+        self.compacted = self.compacted or other.compacted
+        self._compress()
+        return self
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            if self.levels[h].shape[0] > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(self.levels[h])
+                # 홀수 개인 경우 가장 큰 값 1 개는 현재 level 에 유지, 나머지는 정렬 후 짝/홀 위치 중 임의로 절반만 상위 level 로 승격
+                keep, items = items[items.shape[0] - items.shape[0] % 2 :], items[: items.shape[0] - items.shape[0] % 2]
+                self.levels[h] = keep
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], items[self.rng.integers(2) :: 2]])
+                self.compacted = True
+            h += 1
+
+    @property
+    def exact(self):
+        return not self.compacted
+
+    def describe(self):
+        return f"KLL sketch (순위 오차 ±{self.error:.2%})"
+
+    def quantile(self, q):
+        items = np.concatenate(self.levels)
+        if items.shape[0] == 0:
+            return np.float64(np.nan)
+        if not self.compacted:
+            return np.float64(np.quantile(items, q))
+        weights = np.concatenate([np.full(level.shape[0], 2**h, dtype=np.float64) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        cum = np.cumsum(weights[order])
+        return np.float64(items[order][min(int(np.searchsorted(cum, q * cum[-1])), items.shape[0] - 1)])
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+class ReservoirSample:
+    """Mergeable uniform sample (bottom-k of random priorities) for approximate quantiles"""
+
+    def __init__(self, size=100_000, seed=0):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.values = np.empty(0, dtype=np.float64)
+        self.priorities = np.empty(0, dtype=np.float64)
+        self.count = 0
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        self.count += values.shape[0]
+        self._keep(np.concatenate([self.values, values]), np.concatenate([self.priorities, self.rng.random(values.shape[0])]))
+        return self
+
+    def merge(self, other):
+        self.count += other.count
+        self._keep(np.concatenate([self.values, other.values]), np.concatenate([self.priorities, other.priorities]))
+        return self
+
+    def _keep(self, values, priorities):
+        if values.shape[0] > self.size:
+            keep = np.argpartition(priorities, self.size)[: self.size]
+            values, priorities = values[keep], priorities[keep]
+        self.values, self.priorities = values, priorities
+
+    @property
+    def exact(self):
+        # 표본 크기 이하의 데이터는 전체 값을 보관하므로 정확한 값 산출
+        return self.count <= self.size
+
+    def describe(self):
+        return f"표본({self.size:,} 건)"
+
+    def median(self):
+        return np.float64(np.nanmedian(self.values)) if self.values.shape[0] > 0 else np.float64(np.nan)
+
+    def quantile(self, q):
+        return np.float64(np.nanquantile(self.values, q)) if self.values.shape[0] > 0 else np.float64(np.nan)
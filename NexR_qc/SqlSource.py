@@ -0,0 +1,314 @@
+import datetime
+import decimal
+import threading
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.FrequencyTable import FrequencyTable, TopKFrequencyTable
+
+# DB 종류 별 SQL 차이 (quote: 식별자 감싸기, stddev: 표본 표준편차 함수 (None: 평균 기준 2 회 집계),
+# limit: 행 범위 지정, order: 범주 정렬 기준 (None: 값 순서, sqlite 는 rowid 기준 최초 등장 순서))
+Dialects = {
+    "sqlite": {"quote": '""', "stddev": None, "limit": "LIMIT {n} OFFSET {offset}", "order": "MIN(rowid)"},
+    "postgresql": {"quote": '""', "stddev": "STDDEV_SAMP", "limit": "LIMIT {n} OFFSET {offset}", "order": None},
+    "mysql": {"quote": "``", "stddev": "STDDEV_SAMP", "limit": "LIMIT {n} OFFSET {offset}", "order": None},
+    "mssql": {"quote": "[]", "stddev": "STDEV", "limit": "OFFSET {offset} ROWS FETCH NEXT {n} ROWS ONLY", "order": None},
+    "oracle": {"quote": '""', "stddev": "STDDEV_SAMP", "limit": "OFFSET {offset} ROWS FETCH NEXT {n} ROWS ONLY", "order": None},
+    "default": {"quote": '""', "stddev": "STDDEV_SAMP", "limit": "OFFSET {offset} ROWS FETCH NEXT {n} ROWS ONLY", "order": None},
+}
+# DB-API 모듈명 → DB 종류
+DriverDialects = {"sqlite3": "sqlite", "psycopg2": "postgresql", "psycopg": "postgresql", "pymysql": "mysql", "MySQLdb": "mysql", "mysql": "mysql", "pyodbc": "mssql", "pymssql": "mssql", "oracledb": "oracle", "cx_Oracle": "oracle"}
+
+
+class SqlSource:
+    """Database connection shared by the SqlTables of one QC run (DB-API 2.0 connection 혹은 SQLAlchemy Engine/Connection)
+
+    SQLAlchemy Engine 은 connection pool 에서 1 개의 connection 을 받아 모든 테이블 집계에 재사용 (close 시 반환)
+    """
+
+    def __init__(self, connection, schema=None, dialect=None, max_distinct=100_000, top_k=100, chunk_size=100_000):
+        self.schema = schema
+        self.max_distinct = max_distinct
+        self.top_k = top_k
+        self.chunk_size = chunk_size
+        self.pooled = None
+        if hasattr(connection, "raw_connection"):
+            # SQLAlchemy Engine
+            dialect = dialect or connection.dialect.name
+            self.pooled = connection.raw_connection()
+            self.connection = self.pooled
+        elif not hasattr(connection, "cursor") and hasattr(connection, "connection"):
+            # SQLAlchemy Connection
+            dialect = dialect or connection.dialect.name
+            self.connection = connection.connection
+        else:
+            self.connection = connection
+        self.dialect = dialect or DriverDialects.get(type(self.connection).__module__.split(".")[0], "default")
+        self.sql = Dialects.get(self.dialect, Dialects["default"])
+        self.lock = threading.Lock()
+
+    def quote(self, name):
+        left, right = self.sql["quote"]
+        return f"{left}{str(name).replace(right, right * 2)}{right}"
+
+    def relation(self, table):
+        return f"{self.quote(self.schema)}.{self.quote(table)}" if self.schema else self.quote(table)
+
+    def execute(self, query):
+        # 같은 connection 을 사용하는 thread 간 동시 실행 방지
+        with self.lock:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(query)
+                return [tuple(row) for row in cursor.fetchall()], [desc[0] for desc in cursor.description]
+            finally:
+                cursor.close()
+
+    def iter_rows(self, query, size):
+        # 조회 결과를 size 행 단위로 읽음 (chunk 단위 읽기)
+        with self.lock:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(query)
+                Columns = [desc[0] for desc in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(size)
+                    if not rows:
+                        return
+                    yield pd.DataFrame([tuple(row) for row in rows], columns=Columns)
+            finally:
+                cursor.close()
+
+    def table(self, name):
+        return SqlTable(self, name)
+
+    def tables(self, names):
+        """DataDict of SqlTables ({"테이블명": SqlTable})"""
+        return {name: self.table(name) for name in names}
+
+    def close(self):
+        # connection pool 에서 받은 connection 반환 (전달받은 DB-API connection 은 닫지 않음)
+        if self.pooled is not None:
+            self.pooled.close()
+            self.pooled = None
+
+
+class ExactMedian:
+    # DB 정렬 기반 정확한 중위수 (ReservoirSample 과 동일한 median/exact 인터페이스)
+    exact = True
+
+    def __init__(self, value):
+        self.value = value
+
+    def median(self):
+        return self.value
+
+
+class SqlColumn:
+    """Aggregates of one column computed by the database (ColumnAccumulator 와 동일한 항목)"""
+
+    approx = None
+    minmax_error = False
+
+    def __init__(self, dtype, n_rows, n_null, min_, max_, max_distinct):
+        self.dtype = dtype
+        self.n_rows = n_rows
+        self.n_null = n_null
+        self.n = n_rows - n_null
+        self.min = min_
+        self.max = max_
+        self.max_distinct = max_distinct
+        self.mean = np.nan
+        self.std = np.float64(np.nan)
+        self.sample = ExactMedian(np.float64(np.nan))
+        self.Frequency = None
+
+    def cast(self, value):
+        if value is not None and self.dtype.kind in "iuf":
+            return np.array([value]).astype(self.dtype)[0]
+        return value
+
+    def frequency(self):
+        return self.Frequency
+
+
+class SqlTable:
+    """Frame-like database table whose QC aggregates are pushed down to the server (columns, dtypes, shape)
+
+    공통/최솟값·최댓값/범주수: 테이블 당 1 회 SELECT COUNT(*), COUNT(col), MIN, MAX, COUNT(DISTINCT ...)
+    평균/표준편차: 테이블 당 1 회 SELECT AVG, STDDEV (표준편차 함수가 없는 DB 는 평균 기준 1 회 추가 집계)
+    중위수: 컬럼 별 정렬 후 가운데 값 조회 / 범주 빈도: 컬럼 별 GROUP BY (범주 수가 max_distinct 초과 시 앞/뒤 범주와 빈도 상위 top_k 범주만 조회)
+    중복 행/키: 전체 컬럼/키 컬럼 GROUP BY ... HAVING COUNT(*) > 1 결과의 건수 합계와 건수 상위 값만 조회
+    """
+
+    def __init__(self, source, name, sample_size=1_000):
+        self.source = source
+        self.name = name
+        self.sample_size = sample_size
+        self.Columns = {}
+        self._sample = None
+        self._n_rows = None
+
+    def head(self, n=None):
+        # 앞쪽 n 행 (컬럼 목록/dtype 확인, 날짜/시간 컬럼 추론용)
+        n = self.sample_size if n is None else n
+        if self._sample is None or self._sample.shape[0] < n:
+            rows, Columns = self.source.execute(f"SELECT * FROM {self.source.relation(self.name)} {self.source.sql['limit'].format(n=n, offset=0)}")
+            self._sample = pd.DataFrame(rows, columns=Columns)
+        return self._sample.head(n)
+
+    def __iter__(self):
+        # 전체 행을 chunk 단위 DataFrame 으로 읽음 (증분 QC/미리보기 등 DB 집계를 사용하지 않는 경우)
+        return self.source.iter_rows(f"SELECT * FROM {self.source.relation(self.name)}", self.source.chunk_size)
+
+    def __getitem__(self, col):
+        return self.Columns[col]
+
+    @property
+    def columns(self):
+        return self.head().columns
+
+    @property
+    def dtypes(self):
+        return self.head().dtypes
+
+    @property
+    def shape(self):
+        if self._n_rows is None:
+            self._n_rows = int(self.source.execute(f"SELECT COUNT(*) FROM {self.source.relation(self.name)}")[0][0][0])
+        return (self._n_rows, len(self.columns))
+
+    @staticmethod
+    def _dtype(values, n_null, sample_dtype):
+        # 최솟값/최댓값의 python 타입으로 컬럼 dtype 결정 (결측값이 있는 정수 컬럼은 pandas 와 동일하게 float64)
+        types = {type(value) for value in values if value is not None}
+        if not types:
+            return sample_dtype
+        if types <= {bool}:
+            return np.dtype(bool)
+        if types <= {int}:
+            return np.dtype("float64") if n_null > 0 else np.dtype("int64")
+        if types <= {int, float, decimal.Decimal}:
+            return np.dtype("float64")
+        if types <= {datetime.datetime, datetime.date, pd.Timestamp}:
+            return np.dtype("datetime64[ns]")
+        return np.dtype(object)
+
+    def aggregate(self, numeric=None, minmax=None, counts=None):
+        """Compute the column aggregates on the server (numeric / minmax / counts: 평균·표준편차·중위수 / 최솟값·최댓값 / 빈도를 집계할 컬럼 목록, None: 전체 컬럼)"""
+        source, relation = self.source, self.source.relation(self.name)
+        Columns = self.columns.tolist()
+        minmax = Columns if minmax is None else [col for col in Columns if col in minmax]
+        counts = Columns if counts is None else [col for col in Columns if col in counts]
+
+        # Step 1: 공통 영역 + 최솟값/최댓값 + 범주수 (테이블 당 1 회)
+        Select = ["COUNT(*)"] + [f"COUNT({source.quote(col)})" for col in Columns]
+        Select += [f"MIN({source.quote(col)}), MAX({source.quote(col)})" for col in minmax]
+        Select += [f"COUNT(DISTINCT {source.quote(col)})" for col in counts]
+        row = source.execute(f"SELECT {', '.join(Select)} FROM {relation}")[0][0]
+        self._n_rows = int(row[0])
+        NotNull = dict(zip(Columns, row[1 : 1 + len(Columns)]))
+        MinMax = {col: row[1 + len(Columns) + 2 * k : 3 + len(Columns) + 2 * k] for k, col in enumerate(minmax)}
+        Distinct = dict(zip(counts, row[1 + len(Columns) + 2 * len(minmax) :]))
+
+        SampleDtypes = self.dtypes
+        self.Columns = {}
+        for col in Columns:
+            n_null = self._n_rows - int(NotNull[col])
+            min_, max_ = MinMax.get(col, (None, None))
+            dtype = self._dtype([min_, max_], n_null, SampleDtypes[col])
+            min_, max_ = [float(value) if isinstance(value, decimal.Decimal) else value for value in [min_, max_]]
+            if dtype.kind == "M":
+                min_, max_ = [None if value is None else pd.Timestamp(value) for value in [min_, max_]]
+            self.Columns[col] = SqlColumn(dtype, self._n_rows, n_null, min_, max_, source.max_distinct)
+
+        # Step 2: 평균/표준편차 (숫자 타입 컬럼, 테이블 당 1 회)
+        numeric = [col for col in (Columns if numeric is None else numeric) if col in self.Columns and self.Columns[col].dtype.kind in "biuf" and self.Columns[col].n > 0]
+        if numeric:
+            Select = [f"AVG({source.quote(col)})" for col in numeric]
+            if source.sql["stddev"] is not None:
+                Select += [f"{source.sql['stddev']}({source.quote(col)})" for col in numeric]
+            row = source.execute(f"SELECT {', '.join(Select)} FROM {relation}")[0][0]
+            for k, col in enumerate(numeric):
+                self.Columns[col].mean = float(row[k])
+            if source.sql["stddev"] is not None:
+                Std = row[len(numeric) :]
+            else:
+                # 표준편차 함수가 없는 DB: 평균 기준 편차 제곱합 집계 (수치 안정성을 위해 SUM(x*x) 대신 사용)
+                Select = [f"SUM(({source.quote(col)} - ({self.Columns[col].mean!r})) * ({source.quote(col)} - ({self.Columns[col].mean!r})))" for col in numeric]
+                row = source.execute(f"SELECT {', '.join(Select)} FROM {relation}")[0][0]
+                Std = [np.sqrt(float(M2) / (self.Columns[col].n - 1)) if self.Columns[col].n > 1 else None for col, M2 in zip(numeric, row)]
+            for col, std_ in zip(numeric, Std):
+                self.Columns[col].std = np.float64(np.nan if std_ is None else float(std_))
+
+            # Step 3: 중위수 (컬럼 별 정렬 후 가운데 1~2 개 값)
+            for col in numeric:
+                acc = self.Columns[col]
+                rows, _ = source.execute(f"SELECT {source.quote(col)} FROM {relation} WHERE {source.quote(col)} IS NOT NULL ORDER BY {source.quote(col)} {source.sql['limit'].format(n=2 - acc.n % 2, offset=(acc.n - 1) // 2)}")
+                acc.sample = ExactMedian(np.float64(np.mean([float(value) for value, in rows])))
+
+        # Step 4: 범주 빈도 (컬럼 별 GROUP BY)
+        for col in counts:
+            self.Columns[col].Frequency = self._frequency(col, int(Distinct[col]))
+        return self
+
+    def _frequency(self, col, n_unique):
+        source, relation, acc = self.source, self.source.relation(self.name), self.Columns[col]
+        query = f"SELECT {source.quote(col)}, COUNT(*) FROM {relation} WHERE {source.quote(col)} IS NOT NULL GROUP BY {source.quote(col)}"
+
+        def ordered(direction="ASC", n=None):
+            # 최초 등장 순서 (지원하지 않는 DB 는 값 순서)
+            order = f"{source.sql['order'] or source.quote(col)} {direction}"
+            limit = "" if n is None else f" {source.sql['limit'].format(n=n, offset=0)}"
+            try:
+                return source.execute(f"{query} ORDER BY {order}{limit}")[0]
+            except Exception:
+                if source.sql["order"] is None:
+                    raise
+                # rowid 가 없는 테이블(view 등)
+                return source.execute(f"{query} ORDER BY {source.quote(col)} {direction}{limit}")[0]
+
+        def value(value_):
+            # DataFrame 으로 읽은 경우와 동일한 타입으로 변환
+            if isinstance(value_, decimal.Decimal) or (acc.dtype.kind == "f" and isinstance(value_, int)):
+                return float(value_)
+            return value_
+
+        if n_unique <= acc.max_distinct:
+            rows = ordered()
+            return FrequencyTable(pd.Series([count_ for _, count_ in rows], index=pd.Index([value(value_) for value_, _ in rows], dtype=object), dtype="int64"))
+
+        # 범주 수가 많은 경우: 앞쪽 5 개 / 뒤쪽 2 개 범주와 빈도 상위 top_k 범주만 조회 (빈도는 모두 정확한 값)
+        head = [(value(value_), int(count_)) for value_, count_ in ordered(n=5)]
+        tail = [value(value_) for value_, _ in reversed(ordered("DESC", n=2))]
+        top = [(value(value_), int(count_)) for value_, count_ in source.execute(f"{query} ORDER BY COUNT(*) DESC {source.sql['limit'].format(n=source.top_k, offset=0)}")[0]]
+        return TopKFrequencyTable(total=acc.n, n_unique=n_unique, head=head, tail=tail, top=top)
+
+    def count_duplicates(self, columns, top_n=0, skip_null=False):
+        """Duplicate counts of the columns computed by a server-side GROUP BY: (중복 값 수, 중복 행 수, 건수 상위 top_n 개 중복 값 [(값, 건수), ...])
+
+        결측값(NULL)도 하나의 값으로 묶어 집계 (DataFrame 으로 읽은 경우와 동일), skip_null: 결측값이 있는 행 제외 (키 컬럼)
+        """
+        source, relation = self.source, self.source.relation(self.name)
+        group = ", ".join(source.quote(col) for col in columns)
+        where = f" WHERE {' AND '.join(f'{source.quote(col)} IS NOT NULL' for col in columns)}" if skip_null else ""
+        query = f"SELECT {group}, COUNT(*) AS {source.quote('qc_count')} FROM {relation}{where} GROUP BY {group} HAVING COUNT(*) > 1"
+        n_values, n_rows = source.execute(f"SELECT COUNT(*), SUM({source.quote('qc_count')}) FROM ({query}) qc_duplicates")[0][0]
+        n_values, n_rows = int(n_values), int(n_rows or 0) - int(n_values)
+        if top_n <= 0 or n_values == 0:
+            return n_values, n_rows, []
+
+        def value(Row):
+            Row = [float(value_) if isinstance(value_, decimal.Decimal) else value_ for value_ in Row]
+            return Row[0] if len(Row) == 1 else tuple(Row)
+
+        limit = source.sql["limit"].format(n=top_n, offset=0)
+        try:
+            # 건수가 같은 값은 최초 등장 순서 (지원하지 않는 DB 는 값 순서)
+            rows = source.execute(f"{query} ORDER BY COUNT(*) DESC, {source.sql['order'] or group} {limit}")[0]
+        except Exception:
+            if source.sql["order"] is None:
+                raise
+            rows = source.execute(f"{query} ORDER BY COUNT(*) DESC, {group} {limit}")[0]
+        return n_values, n_rows, [(value(row[:-1]), int(row[-1])) for row in rows]
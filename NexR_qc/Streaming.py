@@ -0,0 +1,301 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.FrequencyTable import FrequencyTable, SketchFrequencyTable
+from NexR_qc.Sketch import CountMinTopK, HyperLogLog, KLLSketch, MisraGries, ReservoirSample, hash_values
+
+
+def is_stream_source(source):
+    # DataFrame 이 아닌 파일 경로 혹은 chunk iterator 는 스트리밍 방식으로 처리
+    return not isinstance(source, pd.DataFrame)
+
+
+def iter_excel_chunks(path, chunksize):
+    # openpyxl read-only 모드로 첫 번째 시트를 행 단위로 읽어 chunksize 단위 DataFrame 생성
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        Buffer = []
+        for row in rows:
+            Buffer.append(row)
+            if len(Buffer) == chunksize:
+                yield pd.DataFrame(Buffer, columns=header)
+                Buffer = []
+        if Buffer:
+            yield pd.DataFrame(Buffer, columns=header)
+    finally:
+        wb.close()
+
+
+def iter_parquet_chunks(path, chunksize):
+    # parquet row group 을 chunksize 단위 batch 로 읽음 (pyarrow 필요)
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+        yield batch.to_pandas()
+
+
+def iter_chunks(source, chunksize, readFunc):
+    # 파일 경로(csv/xlsx/parquet 는 chunksize 단위) 혹은 chunk iterator 로부터 DataFrame chunk 생성
+    if isinstance(source, (str, os.PathLike)):
+        ext = os.path.splitext(str(source))[-1].lower()
+        if ext == ".csv":
+            yield from pd.read_csv(source, chunksize=chunksize)
+        elif ext == ".xlsx":
+            yield from iter_excel_chunks(source, chunksize)
+        elif ext == ".parquet":
+            yield from iter_parquet_chunks(source, chunksize)
+        else:
+            # chunk 단위 읽기를 지원하지 않는 형식은 파일 단위로 처리
+            yield readFunc[ext](source)
+    else:
+        yield from source
+
+
+def union_dtype(a, b):
+    # chunk 별로 추론된 dtype 을 전체 데이터 기준 dtype 으로 통합 (pd.concat 과 동일한 규칙)
+    if a is None:
+        return b
+    if a == b:
+        return a
+    if a.kind in "biuf" and b.kind in "biuf" and "b" not in (a.kind, b.kind):
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+class ColumnAccumulator:
+    """Mergeable statistics of a single column, folded chunk by chunk
+
+    approx: 근사 모드 설정값 {"distinct_error", "quantile_error", "frequency_error"} (전달 시 처음부터 sketch 사용:
+    범주수 HyperLogLog, 중위수 KLL, 최빈값 Count-Min)
+    """
+
+    approx = None  # 이전 버전에서 저장된 증분 QC 집계 상태 호환
+
+    def __init__(self, max_distinct=100_000, sample_size=100_000, top_k=100, approx=None):
+        self.max_distinct = max_distinct
+        self.top_k = top_k
+        self.approx = approx
+        self.dtype = None
+        self.n_rows = 0
+        self.n_null = 0
+
+        # 최솟값/최댓값 (타입 혼재로 비교 불가한 경우 minmax_error 기록)
+        self.min = None
+        self.max = None
+        self.minmax_error = False
+
+        # Welford 평균/분산
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.sample = ReservoirSample(size=sample_size) if approx is None else KLLSketch(error=approx["quantile_error"])
+
+        # 빈도: 범주 수가 max_distinct 이하인 동안은 정확한 값, 초과 시 sketch 로 전환
+        self.counts = {}
+        self.approximate = False
+        self.hll = None
+        self.mg = None
+        self.head = None
+        self.tail = None
+        if approx is not None:
+            self._to_approximate()
+
+    def update(self, series, counts=True, minmax=True):
+        # counts: 빈도 집계 여부, minmax: 최솟값/최댓값 집계 여부 (QC 대상 항목이 아닌 경우 생략 가능)
+        self.dtype = union_dtype(self.dtype, series.dtype)
+        self.n_rows += series.shape[0]
+        valid = series.dropna()
+        self.n_null += series.shape[0] - valid.shape[0]
+        if valid.shape[0] == 0:
+            return self
+
+        if minmax:
+            try:
+                # category dtype 은 원래 값 기준으로 비교
+                dense = valid.astype(valid.cat.categories.dtype) if isinstance(valid.dtype, pd.CategoricalDtype) else valid
+                self._update_minmax(dense.min(), dense.max())
+            except TypeError:
+                self.minmax_error = True
+
+        if valid.dtype.kind in "biuf":
+            values = valid.to_numpy(dtype=np.float64)
+            mean_b = values.mean()
+            self._update_moments(values.shape[0], mean_b, float(((values - mean_b) ** 2).sum()))
+            self.sample.update(values)
+
+        if counts:
+            self._update_counts(FrequencyTable.from_series(valid).Counts)
+        return self
+
+    def merge(self, other):
+        self.dtype = union_dtype(self.dtype, other.dtype)
+        self.n_rows += other.n_rows
+        self.n_null += other.n_null
+        self.minmax_error = self.minmax_error or other.minmax_error
+        if other.min is not None:
+            try:
+                self._update_minmax(other.min, other.max)
+            except TypeError:
+                self.minmax_error = True
+        if other.n > 0:
+            self._update_moments(other.n, other.mean, other.M2)
+        self.sample.merge(other.sample)
+        if other.approximate:
+            self._to_approximate()
+            # other 의 head 에 없는 범주의 빈도는 other 의 sketch 추정값 사용
+            Missing = [value_ for value_ in self.head if value_ not in other.head]
+            Counts = dict(other.head)
+            Counts.update(zip(Missing, other.mg.query(Missing).tolist()))
+            self.hll.merge(other.hll)
+            self.mg.merge(other.mg)
+            self._update_head_tail(Counts, other.tail)
+        else:
+            self._update_counts(pd.Series(other.counts, dtype="int64") if other.counts else pd.Series([], dtype="int64"))
+        return self
+
+    def _update_minmax(self, min_, max_):
+        self.min = min_ if self.min is None else min(self.min, min_)
+        self.max = max_ if self.max is None else max(self.max, max_)
+
+    def _update_moments(self, n_b, mean_b, M2_b):
+        # Chan et al. 병렬 Welford 결합
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * n_b / n
+        self.M2 = self.M2 + M2_b + delta**2 * self.n * n_b / n
+        self.n = n
+
+    def _update_counts(self, Counts):
+        if self.approximate:
+            hashes = hash_values(Counts.index)
+            self.hll.update_hashes(hashes)
+            if isinstance(self.mg, CountMinTopK):
+                self.mg.update(Counts, hashes=hashes)
+            else:
+                self.mg.update(Counts)
+            self._update_head_tail(Counts, Counts.index[-2:].tolist())
+            return
+
+        # dict 삽입 순서 = 전체 데이터 기준 최초 등장 순서
+        for value_, count_ in zip(Counts.index.tolist(), Counts.tolist()):
+            self.counts[value_] = self.counts.get(value_, 0) + count_
+        if len(self.counts) > self.max_distinct:
+            self._to_approximate()
+
+    def _to_approximate(self):
+        if self.approximate:
+            return
+        self.approximate = True
+        Values = list(self.counts.keys())
+        if self.approx is None:
+            self.hll = HyperLogLog().update(Values)
+            self.mg = MisraGries(k=self.top_k).update(self.counts)
+        else:
+            self.hll = HyperLogLog(p=HyperLogLog.precision(self.approx["distinct_error"]))
+            self.mg = CountMinTopK(k=self.top_k, error=self.approx["frequency_error"])
+        self.head = {value_: self.counts[value_] for value_ in Values[:5]}
+        self.tail = Values[-2:]
+        self.counts = {}
+
+    def _update_head_tail(self, Counts, tail):
+        # 최초 등장 5개 범주는 정확한 빈도 유지 (Counts: value - count 형태의 dict 혹은 pd.Series)
+        for value_ in self.head:
+            self.head[value_] += int(Counts.get(value_, 0))
+        if len(self.head) < 5:
+            # 보관 중인 범주가 5개 미만이면 지금까지의 모든 범주가 head 에 있으므로, 새 범주를 등장 순서대로 추가
+            First = list(Counts.items())[:10] if isinstance(Counts, dict) else zip(Counts.index[:10].tolist(), Counts.iloc[:10].tolist())
+            for value_, count_ in First:
+                if len(self.head) >= 5:
+                    break
+                if value_ not in self.head:
+                    self.head[value_] = int(count_)
+        # 마지막 등장 범주는 chunk 단위 근사값
+        tail = [value_ for value_ in tail if value_ not in self.head]
+        if tail:
+            self.tail = ([value_ for value_ in self.tail if value_ not in tail] + tail)[-2:]
+
+    @property
+    def std(self):
+        return np.float64(np.sqrt(self.M2 / (self.n - 1))) if self.n > 1 else np.float64(np.nan)
+
+    def cast(self, value):
+        # chunk 별 dtype 차이를 보정하여 전체 데이터 기준 dtype 으로 변환
+        if value is not None and self.dtype is not None and self.dtype.kind in "iuf":
+            return np.array([value]).astype(self.dtype)[0]
+        return value
+
+    def frequency(self):
+        if self.approximate:
+            return SketchFrequencyTable(
+                total=self.n_rows - self.n_null,
+                n_unique=self.hll.estimate(),
+                head=list(self.head.items()),
+                tail=self.tail,
+                top=self.mg.top(),
+            )
+        return FrequencyTable(pd.Series(list(self.counts.values()), index=pd.Index(list(self.counts.keys())), dtype="int64"))
+
+
+class TableAccumulator:
+    """Frame-like summary of a table folded from chunks (columns, dtypes, shape)
+
+    duplicates: consume 시 DuplicateCounter 를 전달한 경우 중복 검사 결과 (Duplicates)
+    """
+
+    duplicates = None
+
+    def __init__(self, max_distinct=100_000, sample_size=100_000, top_k=100, approx=None):
+        self.params = {"max_distinct": max_distinct, "sample_size": sample_size, "top_k": top_k, "approx": approx}
+        self.Columns = {}
+        self.n_chunks = 0
+
+    def update(self, chunk, counts=None, minmax=None):
+        # counts / minmax: 빈도 / 최솟값·최댓값을 집계할 컬럼 목록 (None: 전체 컬럼)
+        for col in chunk.columns:
+            if col not in self.Columns:
+                self.Columns[col] = ColumnAccumulator(**self.params)
+            self.Columns[col].update(chunk[col], counts=counts is None or col in counts, minmax=minmax is None or col in minmax)
+        self.n_chunks += 1
+        return self
+
+    def merge(self, other):
+        for col, acc in other.Columns.items():
+            if col not in self.Columns:
+                self.Columns[col] = ColumnAccumulator(**self.params)
+            self.Columns[col].merge(acc)
+        self.n_chunks += other.n_chunks
+        return self
+
+    def consume(self, chunks, naList=None, duplicates=None):
+        # duplicates: chunk 별 행 해시를 함께 집계할 DuplicateCounter (None: 중복 검사 생략)
+        for chunk in chunks:
+            chunk = chunk.replace(naList, np.nan) if naList else chunk
+            self.update(chunk)
+            if duplicates is not None:
+                duplicates.update(chunk)
+        if duplicates is not None:
+            self.duplicates = duplicates.result()
+        return self
+
+    def __getitem__(self, col):
+        return self.Columns[col]
+
+    @property
+    def columns(self):
+        return pd.Index(list(self.Columns.keys()))
+
+    @property
+    def dtypes(self):
+        return pd.Series({col: acc.dtype for col, acc in self.Columns.items()}, dtype=object)
+
+    @property
+    def shape(self):
+        return (max((acc.n_rows for acc in self.Columns.values()), default=0), len(self.Columns))
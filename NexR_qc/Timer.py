@@ -1,15 +1,28 @@
+import csv
+import json
 import time
+import tracemalloc
+from contextlib import nullcontext
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 
 class TimerError(Exception):
     """A custom exception used to report errors in use of Timer class"""
 
 
+def format_elapsed(seconds):
+    # 시:분:초.밀리초
+    return f"{time.strftime('%H:%M:%S', time.gmtime(seconds))}.{int(seconds % 1 * 1000):03d}"
+
+
 class Timer:
     def __init__(self, logger=None):
         self._start_time = None
-        if logger:
-            self.logger = logger
+        self.logger = logger
 
     def start(self):
         """Start a new timer"""
@@ -23,10 +36,129 @@ class Timer:
         if self._start_time is None:
             raise TimerError(f"Timer is not running. Use .start() to start it")
 
-        elapsed_time = time.strftime("%H:%M:%S", time.gmtime(round(time.perf_counter() - self._start_time, 4)))
+        elapsed = time.perf_counter() - self._start_time
+        elapsed_time = format_elapsed(elapsed)
 
         self._start_time = None
         if self.logger:
             self.logger.info(f"소요시간: {elapsed_time}")
         else:
             print(f"소요시간: {elapsed_time}")
+        return elapsed
+
+
+def peak_rss_mb():
+    # 프로세스 최대 RSS (MB, 측정 불가 시 None)
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _Span:
+    def __init__(self, tracer, record):
+        self.tracer = tracer
+        self.record = record
+
+    def __enter__(self):
+        tracer, record = self.tracer, self.record
+        if tracer.stack:
+            record["parent"] = tracer.stack[-1]["id"]
+        record["depth"] = len(tracer.stack)
+        if tracer.memory:
+            # 상위 구간의 현재까지 최대 메모리를 기록한 후 구간 별 최대 메모리 측정을 위해 초기화
+            if tracer.stack:
+                tracer.stack[-1]["peak_mb"] = max(tracer.stack[-1]["peak_mb"], tracemalloc.get_traced_memory()[1] / 1024**2)
+            tracemalloc.reset_peak()
+            record["peak_mb"] = 0.0
+        tracer.stack.append(record)
+        record["start"] = time.perf_counter() - tracer.origin
+        return record
+
+    def __exit__(self, *exc):
+        tracer, record = self.tracer, self.record
+        record["elapsed"] = time.perf_counter() - tracer.origin - record["start"]
+        if record["rows"]:
+            record["rows_per_sec"] = record["rows"] / record["elapsed"] if record["elapsed"] > 0 else None
+        tracer.stack.pop()
+        if tracer.memory:
+            record["peak_mb"] = max(record["peak_mb"], tracemalloc.get_traced_memory()[1] / 1024**2)
+            if tracer.stack:
+                tracer.stack[-1]["peak_mb"] = max(tracer.stack[-1]["peak_mb"], record["peak_mb"])
+        record["rss_mb"] = peak_rss_mb()
+        return False
+
+
+class Tracer:
+    """Nested timing spans (step / table / column) with optional tracemalloc peak memory, exported as JSON/CSV trace
+
+    record: {"id", "parent", "depth", "name", "kind", "table", "column", "start", "elapsed", "rows", "rows_per_sec", "peak_mb", "rss_mb"}
+    """
+
+    Fields = ["id", "parent", "depth", "name", "kind", "table", "column", "start", "elapsed", "rows", "rows_per_sec", "peak_mb", "rss_mb"]
+
+    def __init__(self, enabled=True, columns=False, memory=False):
+        self.enabled = enabled
+        self.columns = enabled and columns
+        self.memory = enabled and memory
+        self.records = []
+        self.stack = []
+        self.opened = []
+        self.origin = time.perf_counter()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def span(self, name, kind="stage", table=None, column=None, rows=None):
+        # 비활성화 시 측정하지 않음 (nullcontext)
+        if not self.enabled or (kind == "column" and not self.columns):
+            return nullcontext()
+        record = {field: None for field in self.Fields}
+        record.update({"id": len(self.records), "name": name, "kind": kind, "table": table, "column": column, "rows": rows})
+        self.records.append(record)
+        return _Span(self, record)
+
+    def start(self, name, kind="stage", table=None, column=None, rows=None):
+        """Open a span that is closed by .stop() (여러 단계에 걸친 구간 측정)"""
+        span = self.span(name, kind=kind, table=table, column=column, rows=rows)
+        span.__enter__()
+        self.opened.append(span)
+
+    def stop(self):
+        """Close the most recently started span"""
+        if not self.opened:
+            raise TimerError("Tracer span is not running. Use .start() to start it")
+        self.opened.pop().__exit__(None, None, None)
+
+    def merge(self, records, parent=None):
+        # worker 에서 측정한 구간을 현재 구간 하위로 병합 (시작 시각은 worker 기준)
+        offset = len(self.records)
+        for record in records:
+            record = dict(record, id=record["id"] + offset, worker=True)
+            record["parent"] = parent if record["parent"] is None else record["parent"] + offset
+            record["depth"] += len(self.stack)
+            self.records.append(record)
+
+    def slowest(self, kind, n=10):
+        return sorted([record for record in self.records if record["kind"] == kind and record["elapsed"] is not None], key=lambda x: -x["elapsed"])[:n]
+
+    def summary(self, logger, n=10):
+        # 소요시간 상위 n 개 테이블/컬럼
+        for kind, label in [("table", "테이블"), ("column", "컬럼")]:
+            Records = self.slowest(kind, n)
+            if not Records:
+                continue
+            logger.info(f"[성능] 소요시간 상위 {len(Records)} 개 {label}:")
+            for rank, record in enumerate(Records, start=1):
+                target = record["table"] if kind == "table" else f"{record['table']}.{record['column']}"
+                throughput = f", {record['rows_per_sec']:,.0f} 행/초" if record["rows_per_sec"] else ""
+                memory = f", 최대 메모리 {record['peak_mb']:,.1f} MB" if record["peak_mb"] is not None else ""
+                logger.info(f"  {rank}. {target} - {record['name']} {record['elapsed']:,.3f} 초{throughput}{memory}")
+
+    def export(self, path):
+        # path.json / path.csv 로 구간 기록 저장
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(self.records, f, ensure_ascii=False, indent=1, default=str)
+        with open(f"{path}.csv", "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.Fields + ["worker"], extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(self.records)
+        return [f"{path}.json", f"{path}.csv"]
@@ -0,0 +1,204 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# 규칙 항목 → 결과 표시명
+RuleNames = {
+    "not_null": "NOT NULL",
+    "unique": "중복 불가",
+    "key": "PK 중복 불가",
+    "codes": "정의된 코드값",
+    "min": "허용 최솟값",
+    "max": "허용 최댓값",
+    "pattern": "형식",
+    "min_length": "최소 길이",
+    "max_length": "최대 길이",
+}
+
+# 컬럼정의서 규칙 컬럼 → 규칙 항목 (정의서에 있는 컬럼만 사용, 컬럼명의 줄바꿈/연속 공백은 공백 1개로 비교)
+# PK여부 Y: 테이블 단위로 묶어 unique/key 규칙 / NULL 값 허용여부 N: not_null / 길이: 문자형(char, varchar) 컬럼의 max_length
+DocumentRules = {"PK여부": "pk", "NULL 값 허용여부": "nullable", "길이": "length", "허용 최솟값": "min", "허용 최댓값": "max", "형식": "pattern"}
+FlagValues = {"Y": True, "YES": True, "TRUE": True, "O": True, "1": True, "N": False, "NO": False, "FALSE": False, "X": False, "0": False}
+
+
+def flag(value):
+    # 정의서 Y/N 항목 값 (Y → True, N → False, 빈 값 등 → None)
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return None if pd.isna(value) else FlagValues.get(str(int(value)))
+    return FlagValues.get(value.strip().upper()) if isinstance(value, str) else None
+
+
+def rule_columns(columns):
+    # 컬럼정의서 컬럼 중 규칙 컬럼
+    return [col for col in columns if isinstance(col, str) and " ".join(col.split()) in DocumentRules]
+
+
+def document_rules(Row, dtype=None):
+    """Rules declared in the 컬럼정의서 rule columns of one column (Row: {정의서 컬럼명: 값}, 규칙이 없으면 None)"""
+    Rules = {}
+    for doc_col, value in Row.items():
+        rule = DocumentRules[" ".join(doc_col.split())]
+        if rule == "pk":
+            if flag(value):
+                Rules["pk"] = True
+        elif rule == "nullable":
+            if flag(value) is False:
+                Rules["not_null"] = True
+        elif isinstance(value, str) and value.strip() == "" or not isinstance(value, str) and pd.isna(value):
+            continue
+        elif rule == "length":
+            if isinstance(dtype, str) and "char" in dtype.lower():
+                Rules["max_length"] = int(value)
+        else:
+            Rules[rule] = value
+    return Rules or None
+
+
+def compile_rules(ColumnInfo, ConfigRules=None):
+    """Rules of every column of a table ({컬럼명: 규칙 dict 혹은 None})
+
+    컬럼정의서 규칙 → 코드대분류의 코드값(codes) → config validationRules 순으로 적용 (뒤의 값 우선)
+    PK 컬럼이 1 개인 경우 unique, 여러 개인 경우 첫 번째 PK 컬럼에 key (복합 키) 규칙을 두고 PK 컬럼 모두 NOT NULL 적용
+    """
+    ConfigRules = ConfigRules or {}
+    Compiled = {}
+    for col, ColumnInfo_ in ColumnInfo.items():
+        Rules = dict(ColumnInfo_.get("검증 규칙") or {})
+        if ColumnInfo_.get("코드값") is not None:
+            Rules.setdefault("codes", ColumnInfo_["코드값"])
+        Rules.update(ConfigRules.get(col, {}))
+        Compiled[col] = Rules
+
+    Keys = [col for col, Rules in Compiled.items() if Rules.pop("pk", False)]
+    for col in Keys:
+        Compiled[col].setdefault("not_null", True)
+    if len(Keys) == 1:
+        Compiled[Keys[0]].setdefault("unique", True)
+    elif len(Keys) > 1:
+        Compiled[Keys[0]].setdefault("key", Keys)
+    return {col: (Rules or None) for col, Rules in Compiled.items()}
+
+
+def describe(rule, value):
+    # 규칙 내용 표시 (코드값은 앞쪽 5 개만 표시)
+    if rule in ["not_null", "unique"]:
+        return RuleNames.get(rule, rule)
+    if rule == "key":
+        return f"{RuleNames.get(rule, rule)} ({', '.join(map(str, value))})"
+    if rule == "codes":
+        Codes = list(value)
+        return f"{RuleNames.get(rule, rule)} {len(Codes):,} 개 ({', '.join(map(str, Codes[:5]))}{', ...' if len(Codes) > 5 else ''})"
+    return f"{RuleNames.get(rule, rule)} {value}"
+
+
+class RuleValidator:
+    """Evaluates the 검증 규칙 of every column as vectorized predicates over the whole column (규칙 당 1회 연산, 행 수에 선형)
+
+    결과는 ResultTable.violations 에 규칙 단위로 기록 (검사 행 수, 위반 건수, 위반 예시 [(행 index, 값), ...])
+    category/object/문자열 dtype 컬럼의 코드값/범위/형식/길이 규칙은 고유값 단위로 계산 후 code 로 행에 적용
+    """
+
+    def __init__(self, sample_size=5, logger=None):
+        self.sample_size = sample_size
+        self.logger = logger
+
+    def validate(self, data_name, data, ColumnInfo, Result):
+        """Validate an in-memory frame"""
+        n_rows = data.shape[0]
+        for i, col in enumerate(Result.columns):
+            Rules = ColumnInfo[col].get("검증 규칙")
+            if not Rules:
+                continue
+            Factorized = {}  # 컬럼 고유값/code (규칙 간 공유)
+            for rule, value in Rules.items():
+                try:
+                    mask = self.violation_mask(data, col, rule, value, Factorized)
+                except (TypeError, ValueError, re.error) as e:
+                    self._error(data_name, col, rule, e)
+                    Result.add_violation(i, RuleNames.get(rule, rule), describe(rule, value), n_rows, None, None, f"검사 불가: {e}")
+                    continue
+                idx = np.flatnonzero(mask)
+                Samples = [(label, data[col].iat[j]) for label, j in zip(data.index[idx[: self.sample_size]].tolist(), idx[: self.sample_size])]
+                Result.add_violation(i, RuleNames.get(rule, rule), describe(rule, value), n_rows, int(idx.shape[0]), Samples or None, None)
+        self._summary(data_name, Result)
+        return Result
+
+    def validate_aggregate(self, data_name, table, ColumnInfo, Result, Frequency):
+        """Validate a table known only by its aggregates (스트리밍/증분/DB 테이블)
+
+        NOT NULL: 결측 건수, 코드값: 빈도표 기준 정의되지 않은 범주의 건수 (예시는 행 대신 값만 기록), 그 외 행 단위 규칙은 검사하지 않음
+        """
+        Skipped = set()
+        for i, col in enumerate(Result.columns):
+            Rules = ColumnInfo[col].get("검증 규칙")
+            if not Rules:
+                continue
+            for rule, value in Rules.items():
+                if rule == "not_null":
+                    Result.add_violation(i, RuleNames.get(rule, rule), describe(rule, value), table.shape[0], int(table[col].n_null), None, None)
+                elif rule == "codes" and Result.index(i) in Frequency:
+                    Frequency_ = Frequency[Result.index(i)]
+                    Undefined = Frequency_.undefined(value)
+                    Samples = [(None, value_) for value_ in Undefined[: self.sample_size]]
+                    Result.add_violation(i, RuleNames.get(rule, rule), describe(rule, value), table.shape[0], Frequency_.undefined_count(value), Samples or None, None if Frequency_.complete else "빈도 상위 범주 기준 (최소 건수)")
+                else:
+                    Skipped.add(RuleNames.get(rule, rule))
+        if Skipped and self.logger:
+            self.logger.info(f"[{data_name}] 전체 데이터를 메모리에 불러오지 않은 테이블이므로 행 단위 규칙({', '.join(sorted(Skipped))})은 검사하지 않습니다.")
+        self._summary(data_name, Result)
+        return Result
+
+    def violation_mask(self, data, col, rule, value, Factorized=None):
+        # 규칙 위반 행 mask (결측값은 NOT NULL 규칙에서만 위반)
+        series = data[col]
+        Factorized = {} if Factorized is None else Factorized
+        if rule == "not_null":
+            return series.isna().to_numpy()
+        if rule == "unique":
+            return (series.duplicated(keep="first") & series.notna()).to_numpy()
+        if rule == "key":
+            return data[list(value)].duplicated(keep="first").to_numpy()
+        if rule == "codes":
+            return self._map_values(series, Factorized, lambda values: ~values.isin(list(value)))
+        if rule in ["min", "max"]:
+            bound = pd.Timestamp(value) if series.dtype.kind == "M" else value
+            return self._map_values(series, Factorized, lambda values: values < bound if rule == "min" else values > bound)
+        if rule == "pattern":
+            pattern = re.compile(value)
+            return self._map_values(series, Factorized, lambda values: ~values.astype(str).str.fullmatch(pattern).astype(bool))
+        if rule == "min_length":
+            return self._map_values(series, Factorized, lambda values: values.astype(str).str.len() < int(value))
+        if rule == "max_length":
+            return self._map_values(series, Factorized, lambda values: values.astype(str).str.len() > int(value))
+        raise ValueError(f"지원하지 않는 규칙입니다: {rule} ({', '.join(RuleNames)} 중 선택)")
+
+    @staticmethod
+    def _map_values(series, Factorized, predicate):
+        # 결측값이 아닌 값에 predicate 적용 (category/object/문자열 dtype 은 고유값 단위 계산 후 code 로 행에 전개, 고유값/code 는 Factorized 에 1회 계산)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            Factorized.setdefault("codes", (series.cat.codes.to_numpy(), pd.Series(series.cat.categories)))
+        elif series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+            if "codes" not in Factorized:
+                codes, uniques = pd.factorize(series)
+                Factorized["codes"] = (codes, pd.Series(uniques, dtype=object))
+        else:
+            mask = np.zeros(series.shape[0], dtype=bool)
+            valid = series.notna().to_numpy()
+            mask[valid] = np.asarray(predicate(series[valid]), dtype=bool)
+            return mask
+        codes, uniques = Factorized["codes"]
+        ByCode = np.append(np.asarray(predicate(uniques), dtype=bool), False)  # code -1 (결측값) 은 위반 아님
+        return ByCode[codes]
+
+    def _error(self, data_name, col, rule, e):
+        if self.logger:
+            self.logger.error(f"[{data_name}] {col} 컬럼의 {RuleNames.get(rule, rule)} 규칙을 검사할 수 없습니다. ({type(e).__name__}: {e})")
+
+    def _summary(self, data_name, Result):
+        if not self.logger or not Result.violations:
+            return
+        Violated = [violation_ for violation_ in Result.violations if violation_.count]
+        self.logger.info(f"[{data_name}] 규칙 검증 완료 ({len(Result.violations)} 개 규칙 중 {len(Violated)} 개 위반, 위반 {sum(violation_.count for violation_ in Violated):,} 건)")
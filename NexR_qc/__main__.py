@@ -0,0 +1,141 @@
+import argparse
+import json
+import os
+import sys
+import traceback
+
+from NexR_qc.Logging import Logger
+
+# 종료 코드
+EXIT_SUCCESS = 0  # QC 결과서 생성 완료
+EXIT_FAILURE = 1  # QC 수행 중 오류 발생
+EXIT_USAGE = 2  # 실행 인자 오류 혹은 QC 대상 데이터 없음
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m NexR_qc", description="데이터 QC 결과서 생성 (비대화형 실행: 입력 대기 없이 config/실행 인자 값으로 Step 1 ~ 6 수행)")
+    parser.add_argument("--data", required=True, help="QC 대상 데이터 파일(csv/xlsx/parquet/feather) 폴더 경로 (하위 폴더 포함, 파일명 대문자 = 테이블명)")
+    parser.add_argument("--config", help="config.json 대신 사용할 설정 파일 경로")
+    parser.add_argument("--stream", action="store_true", help="데이터 파일을 메모리에 올리지 않고 chunk 단위로 집계 (스트리밍 모드)")
+    parser.add_argument("--workers", type=int, help="테이블 단위 병렬 처리 worker 수")
+    parser.add_argument("--load-workers", type=int, help="데이터 파일 동시 불러오기 worker 수 (미입력 시 --workers 값)")
+    parser.add_argument("--excel-engine", choices=["openpyxl", "xlsxwriter"], help="QC 결과서 작성 방식")
+    parser.add_argument("--pipeline-save", action="store_true", help="테이블 QC 완료 즉시 결과서 시트를 background 로 작성 (xlsxwriter)")
+    parser.add_argument("--shard-tables", type=int, help="결과서 파일 1 개당 최대 테이블 수 (지정 시 테이블 리스트 색인 파일 + 분할 결과서 파일로 작성)")
+    parser.add_argument("--shard-workers", type=int, help="분할 결과서 병렬 작성 worker 수")
+    parser.add_argument("--output-formats", nargs="+", choices=["excel", "parquet", "jsonl", "csv"], help="산출물 형식 (excel: QC 결과서 / parquet, jsonl, csv: 테이블 리스트·컬럼 결과 원래 값 파일, 복수 선택 가능)")
+    parser.add_argument("--history", action="store_true", help="테이블/컬럼 별 QC 지표를 이력 DB(output/qc_history.sqlite)에 추가하고 직전 실행 대비 변동 컬럼 보고")
+    parser.add_argument("--na", nargs="+", help="결측값으로 처리할 값 목록 (config 의 naList 대체)")
+    parser.add_argument("--time-columns", nargs="+", default=[], metavar="TABLE=COL1,COL2", help="테이블 별 날짜/시간 컬럼")
+    parser.add_argument("--infer-datetime", action="store_true", help="날짜/시간 컬럼 자동 추론 (표본 기반)")
+    parser.add_argument("--preview", action="store_true", help="테이블 별 표본으로 QC 수행 (미리보기)")
+    parser.add_argument("--preview-size", type=int, help="미리보기 표본 크기")
+    parser.add_argument("--trace", action="store_true", help="단계/테이블 별 성능 측정 결과를 log 폴더에 JSON/CSV 로 저장")
+    parser.add_argument("--trace-columns", action="store_true", help="성능 측정 시 컬럼 단위 측정 포함")
+    parser.add_argument("--trace-memory", action="store_true", help="성능 측정 시 tracemalloc 기반 최대 메모리 측정 포함")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "ERROR"], help="로그 출력 수준 (DEBUG: 컬럼 단위 메시지 포함, 기본값 INFO)")
+    parser.add_argument("--log-json", action="store_true", help="콘솔/로그 파일을 레코드 당 JSON 1 줄로 기록")
+    parser.add_argument("--no-save", action="store_true", help="QC 결과서 파일 생성 생략")
+    return parser.parse_args(argv)
+
+
+def build_config(args):
+    # 설정 파일 값에 실행 인자 값을 덮어써서 최종 설정값 구성
+    config = {}
+    if args.config:
+        with open(args.config, "r") as f:
+            config = json.load(f)
+    config["interactive"] = False
+    if args.workers is not None:
+        config["workers"] = args.workers
+    if args.excel_engine is not None:
+        config["excelEngine"] = args.excel_engine
+    if args.shard_tables is not None:
+        config["shardTables"] = args.shard_tables
+    if args.shard_workers is not None:
+        config["shardWorkers"] = args.shard_workers
+    if args.output_formats is not None:
+        config["outputFormats"] = args.output_formats
+    if args.history:
+        config["history"] = True
+    if args.pipeline_save and not args.no_save:
+        config["pipelineSave"] = True
+    if args.na is not None:
+        config["naList"] = args.na
+    if args.preview:
+        config["preview"] = True
+    if args.preview_size is not None:
+        config["previewSize"] = args.preview_size
+    if args.trace or args.trace_columns or args.trace_memory:
+        config["trace"] = True
+        config["traceColumns"] = args.trace_columns
+        config["traceMemory"] = args.trace_memory
+    if args.log_level is not None:
+        config["logLevel"] = args.log_level
+    if args.log_json:
+        config["logFormat"] = "json"
+    if args.infer_datetime:
+        config["inferDatetime"] = True
+    if args.time_columns:
+        config["timeColumns"] = dict(config.get("timeColumns", {}))
+        for item in args.time_columns:
+            table, _, cols = item.partition("=")
+            config["timeColumns"][table] = [col.strip() for col in cols.split(",") if col.strip()]
+    return config
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not os.path.isdir(args.data):
+        print(f"데이터 폴더가 존재하지 않습니다: {args.data}", file=sys.stderr)
+        return EXIT_USAGE
+
+    # pandas 등 QC 모듈은 실행 인자 확인 후 불러옴 (--help, 실행 인자 오류 시 즉시 종료)
+    from NexR_qc.Ingestion import DefaultNaList
+
+    config = build_config(args)
+    if os.path.exists("config.json"):
+        # 불러오기 단계에서 사용할 config.json 값 (실행 인자/설정 파일 값 우선)
+        with open("config.json", "r") as f:
+            Saved = json.load(f)
+        for key, default in [("naList", DefaultNaList), ("logLevel", "INFO"), ("logFormat", "text")]:
+            config.setdefault(key, Saved.get(key, default))
+
+    # QualityCheck 에 같은 logger 전달 (불러오기 로그도 같은 로그 파일에 기록)
+    logger = Logger(proc_name="QualityCheck", log_folder_path=os.path.join(os.getcwd(), "log"), level=config.get("logLevel", "INFO"), json_format=config.get("logFormat") == "json")
+    try:
+        return run_qc(args, config, logger)
+    finally:
+        logger.close()
+
+
+def run_qc(args, config, logger):
+    from NexR_qc.Ingestion import load_folder
+    from NexR_qc.QualityCheck import QualityCheck
+
+    # 읽기 단계에서 결측값 처리 및 dtype 최적화 (스트리밍 모드는 파일 경로 전달)
+    load_workers = args.load_workers or config.get("workers", 1)
+    DataDict = load_folder(args.data, naList=config.get("naList"), stream=args.stream, workers=load_workers, logger=logger)
+    if len(DataDict) == 0:
+        print(f"QC를 수행할 데이터 파일이 존재하지 않습니다: {args.data}", file=sys.stderr)
+        return EXIT_USAGE
+
+    Process = QualityCheck(DataDict, config=config, logger=logger)
+    try:
+        Process.data_check()
+        Process.document_check()
+        Process.na_check()
+        Process.run()
+        if not args.no_save:
+            Process.save()
+        else:
+            Process.save_trace()
+    except Exception:
+        Process.logger.error(traceback.format_exc())
+        Process.logger.error("QC 수행 중 오류가 발생하여 종료합니다.")
+        return EXIT_FAILURE
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.Profiler import Profiler
+
+
+def make_data(n_rows, seed=0):
+    # 고카디널리티 범주형(ID), 편중된 범주형(zipf), 연속형 컬럼으로 구성된 가상 데이터 생성
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "ID": np.char.add("ID", rng.integers(0, n_rows, n_rows).astype(str)).astype(object),
+            "ZIPF": np.char.add("Z", np.minimum(rng.zipf(1.3, n_rows), 10**6).astype(str)).astype(object),
+            "AMOUNT": rng.lognormal(3, 1, n_rows),
+        }
+    )
+
+
+def make_column_info(data):
+    DataTypes = {"ID": "varchar", "ZIPF": "varchar", "AMOUNT": "float"}
+    return {col: {"컬럼 영문명": col, "컬럼 한글명": None, "데이터 타입": DataTypes[col], "코드대분류": None, "코드값": None} for col in data.columns}
+
+
+def measure(profiler, data, ColumnInfo):
+    # 소요시간 (tracemalloc 미사용) 및 최대 메모리 사용량 (tracemalloc, 별도 실행)
+    start = time.perf_counter()
+    Result = profiler.profile("BENCH", data, ColumnInfo)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    profiler.profile("BENCH", data, ColumnInfo)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, Result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정확한 값 산출 vs 근사 모드(HyperLogLog/KLL/Count-Min) 비교")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--error", type=float, default=0.01, help="범주수/중위수 오차 설정값")
+    args = parser.parse_args()
+
+    approx = {"distinct_error": args.error, "quantile_error": args.error, "frequency_error": 0.001, "chunk_size": 100_000}
+    print(f"{'rows':>12} {'exact(s)':>9} {'approx(s)':>10} {'exact(MB)':>10} {'approx(MB)':>11} {'범주수 오차':>10} {'중위수 순위':>10} {'최빈값':>6}")
+    for n_rows in args.rows:
+        data = make_data(n_rows)
+        ColumnInfo = make_column_info(data)
+        exact_time, exact_peak, Exact = measure(Profiler(), data, ColumnInfo)
+        approx_time, approx_peak, Approx = measure(Profiler(approx=approx), data, ColumnInfo)
+
+        distinct_error = abs(Approx.get(0, "범주수") / Exact.get(0, "범주수") - 1)
+        median_rank = (data["AMOUNT"] < Approx.get(2, "중위수")).mean()
+        same_mode = Approx.get(1, "최빈값") == Exact.get(1, "최빈값")
+        print(f"{n_rows:>12,} {exact_time:>9.2f} {approx_time:>10.2f} {exact_peak / 1024**2:>10.1f} {approx_peak / 1024**2:>11.1f} {distinct_error:>10.2%} {median_rank:>10.2%} {str(same_mode):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import copy
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.Profiler import Profiler
+from NexR_qc.QualityCheck import QualityCheck
+from NexR_qc.Timer import Tracer
+
+
+def make_result(n_tables, n_cols, seed=0):
+    # 테이블 별 QC 결과(Top/Bottom)와 테이블 리스트를 가상으로 생성 (QualityCheck.save 입력과 동일한 형태)
+    rng = np.random.default_rng(seed)
+    RelCategory = copy.deepcopy(Profiler.RelCategory)
+    ColList = [sum([[key1] * len(RelCategory[key1]) for key1 in RelCategory], []), sum(RelCategory.values(), [])]
+    InfoDict, ResultDict, TableList_ = {}, {}, []
+    for t in range(n_tables):
+        data_name = f"TABLE_{t:04d}"
+        InfoDict[data_name] = {"Table": {"스키마명": "BENCH", "테이블 영문명": data_name, "테이블 한글명": f"테이블 {t}", "테이블 용량": None, "테이블 기간": None, "테이블 크기": (100_000, n_cols)}}
+        ResultDict[data_name] = {}
+        ResultDict[data_name]["Top"] = pd.DataFrame(
+            InfoDict[data_name]["Table"].values(),
+            index=[
+                ["스키마명", "테이블 영문명", "테이블 한글명", "테이블 상세", "테이블 상세", "테이블 상세"],
+                ["스키마명", "테이블 영문명", "테이블 한글명", "테이블 용량", "테이블 기간", "테이블 크기"],
+            ],
+        )
+        Rows = []
+        for c in range(n_cols):
+            remark = ["", "결측값 100%", "컬럼 정의서 상의 데이터 타입과 실제 데이터 타입 불일치"][c % 7] if c % 7 < 3 else ""
+            Rows.append(
+                [c + 1, f"COL_{c:03d}", None, "float64", 100_000, int(rng.integers(0, 1000)), 5.0, None]
+                + [float(v) for v in rng.normal(100, 10, 5)]
+                + [None, None, int(rng.integers(1, 100)), "A : 1,000 (10.00%),\nB : 2,000 (20.00%),\n...", 20.0, None, None, None]
+                + [remark]
+            )
+        ResultDict[data_name]["Bottom"] = pd.DataFrame(Rows, columns=ColList)
+        TableList_.append([t + 1, "BENCH", data_name, f"테이블 {t}", f"{t+1:04d}_{data_name[:26]}"])
+    InfoDict["TableList"] = pd.DataFrame(TableList_, columns=["No.", "스키마명", "테이블 영문명", "테이블 한글명", "워크 시트명"])
+    return InfoDict, ResultDict, RelCategory
+
+
+def make_writer(InfoDict, ResultDict, RelCategory):
+    # 파일 시스템 초기화 없이 save_* 메서드만 사용하기 위한 QualityCheck 객체
+    qc = QualityCheck.__new__(QualityCheck)
+    qc.InfoDict, qc.ResultDict, qc.RelCategory = InfoDict, ResultDict, RelCategory
+    qc.logger = logging.getLogger("excel_writer_benchmark")
+    qc.tracer = Tracer(enabled=False)
+    return qc
+
+
+def measure(func, path, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed), os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QC결과서 작성 방식 비교 (openpyxl 작성 후 서식 편집 vs xlsxwriter 단일 패스)")
+    parser.add_argument("--tables", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--cols", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'tables':>8} {'cols':>6} {'openpyxl(s)':>12} {'xlsxwriter(s)':>14} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_tables in args.tables:
+            qc = make_writer(*make_result(n_tables, args.cols))
+            openpyxl_time, _ = measure(qc.save_openpyxl, os.path.join(tmp, "openpyxl.xlsx"), args.repeat)
+            xlsxwriter_time, _ = measure(qc.save_xlsxwriter, os.path.join(tmp, "xlsxwriter.xlsx"), args.repeat)
+            print(f"{n_tables:>8} {args.cols:>6} {openpyxl_time:>12.3f} {xlsxwriter_time:>14.3f} {openpyxl_time / xlsxwriter_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
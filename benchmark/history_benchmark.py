@@ -0,0 +1,66 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.History import HistoryStore
+
+
+def make_run(run, n_tables, n_cols, seed=0):
+    # 실행 별 테이블 리스트 / 컬럼 결과 (flat_tables / flat_columns 형태, 지표 값은 실행마다 조금씩 변동)
+    rng = np.random.default_rng(seed + run)
+    RunTime = (pd.Timestamp("2024-01-01") + pd.Timedelta(hours=run)).isoformat()
+    Tables = pd.DataFrame({"QC 일시": RunTime, "테이블 영문명": [f"TABLE_{t:04d}" for t in range(n_tables)], "행 수": 100_000, "컬럼 수": n_cols})
+    n = n_tables * n_cols
+    Columns = pd.DataFrame(
+        {
+            "QC 일시": RunTime,
+            "테이블 영문명": np.repeat(Tables["테이블 영문명"].to_numpy(), n_cols),
+            "컬럼 영문명": np.tile([f"COL_{c:04d}" for c in range(n_cols)], n_tables),
+            "데이터 타입": "numeric",
+            "%null": rng.uniform(0, 0.1, n),
+            "평균": rng.normal(100, 1, n),
+            "표준편차": rng.normal(10, 0.1, n),
+            "범주수": rng.integers(90, 110, n),
+            "정의된 범주 외 수": rng.integers(0, 2, n),
+        }
+    )
+    return RunTime, Tables, Columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QC 이력 DB 실행 추가 / 컬럼 이력 조회 / 변동 감지 소요시간 (실행 이력 수 별)")
+    parser.add_argument("--runs", type=int, nargs="+", default=[100, 1_000, 5_000], help="누적 실행 이력 수")
+    parser.add_argument("--tables", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'runs':>8} {'append(ms)':>11} {'history(ms)':>12} {'drift(ms)':>10} {'db(MB)':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(os.path.join(tmp, "qc_history.sqlite"))
+        run = 0
+        for n_runs in sorted(args.runs):
+            while run < n_runs - 1:
+                store.append(*make_run(run, args.tables, args.cols))
+                run += 1
+            start = time.perf_counter()
+            run_id = store.append(*make_run(run, args.tables, args.cols))
+            run += 1
+            append_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            store.history("TABLE_0000", "COL_0000")
+            history_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            store.drift(run_id)
+            drift_time = time.perf_counter() - start
+            print(f"{n_runs:>8,} {append_time * 1000:>11.1f} {history_time * 1000:>12.1f} {drift_time * 1000:>10.1f} {os.path.getsize(store.path) / 1024**2:>8.1f}")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
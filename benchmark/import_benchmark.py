@@ -0,0 +1,82 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# 측정 대상 (import / 생성자 / CLI 도움말), 각 항목은 새 python 프로세스에서 실행
+Targets = {
+    "pandas": "import pandas",
+    "QualityCheck": "import NexR_qc.QualityCheck",
+    "QualityCheck()": "from NexR_qc.QualityCheck import QualityCheck; QualityCheck({}, config={'interactive': False})",
+}
+
+# save 단계 등 필요한 단계에서만 불러와야 하는 모듈
+LazyModules = ["openpyxl", "xlsxwriter", "sqlite3", "multiprocessing", "concurrent.futures.process", "statistics", "pyarrow"]
+
+
+def import_times(stmt, cwd):
+    # python -X importtime 출력 → [(모듈명 (하위 import 는 들여쓰기), 누적 소요시간(초)), ...]
+    Env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])))
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt], cwd=cwd, env=Env, capture_output=True, text=True, check=True).stderr
+    Times = []
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line[len("import time:") :].split("|")
+            Times.append((name[1:].rstrip(), int(cumulative) / 1e6))
+    return Times
+
+
+def total(Times, exclude=()):
+    # 최상위 import 누적 소요시간 합계
+    return sum(value for name, value in Times if not name.startswith(" ") and name not in exclude)
+
+
+def drop_subtrees(Times, exclude):
+    # exclude 에 해당하는 최상위 import 와 그 하위 import 제외 (importtime 출력은 하위 모듈이 상위 모듈보다 먼저 기록됨)
+    Kept, depth = [], None
+    for name, value in reversed(Times):
+        indent = len(name) - len(name.lstrip())
+        if depth is not None and indent > depth:
+            continue
+        depth = indent if name.strip() in exclude else None
+        if depth is None:
+            Kept.append((name, value))
+    return Kept[::-1]
+
+
+def loaded_modules(stmt, cwd):
+    # stmt 실행 후 불러온 지연 로딩 대상 모듈 목록
+    Env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])))
+    code = f"{stmt}\nimport sys\nprint(','.join(name for name in {LazyModules!r} if name in sys.modules))"
+    stdout = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=Env, capture_output=True, text=True, check=True).stdout
+    return [name for name in stdout.strip().split(",") if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="패키지 import / QualityCheck 생성자 소요시간 (python -X importtime, 새 프로세스 기준) 및 생성자 실행 시 파일 생성 여부")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (중앙값 출력)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 소요시간 상위 모듈 수 (QualityCheck import 기준)")
+    args = parser.parse_args()
+
+    print(f"{'target':>16} {'total(ms)':>10} {'pandas 제외(ms)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for target, stmt in Targets.items():
+            # pandas 제외: numpy/pandas 를 먼저 불러온 후 측정 (패키지 자체 import 및 생성자 소요시간)
+            total_ = statistics.median(total(import_times(stmt, tmp)) for _ in range(args.repeat))
+            own = statistics.median(total(import_times(f"import numpy, pandas\n{stmt}", tmp), exclude=["numpy", "pandas"]) for _ in range(args.repeat))
+            print(f"{target:>16} {total_ * 1000:>10.1f} {own * 1000:>15.1f}")
+        print(f"생성자 실행 후 작업 폴더 파일: {sorted(os.listdir(tmp)) or '없음'}")
+
+        Modules = loaded_modules(Targets["QualityCheck()"], tmp)
+        print(f"생성자 실행 후 불러온 지연 로딩 대상 모듈: {Modules or '없음'}")
+
+        Times = import_times(f"import numpy, pandas\n{Targets['QualityCheck']}", tmp)
+        print(f"소요시간 상위 {args.top} 개 모듈 (QualityCheck, numpy/pandas 제외, 누적 소요시간):")
+        for name, value in sorted(drop_subtrees(Times, ["numpy", "pandas"]), key=lambda x: -x[1])[: args.top]:
+            print(f"  {name:<50} {value * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
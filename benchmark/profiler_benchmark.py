@@ -0,0 +1,60 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from NexR_qc.Profiler import Profiler
+
+
+def make_data(n_rows, n_cols, seed=0):
+    # 연속형(float/int), 범주형(저/고 카디널리티) 컬럼이 섞인 가상 데이터 생성
+    rng = np.random.default_rng(seed)
+    DataDict = {}
+    for i in range(n_cols):
+        kind = i % 4
+        if kind == 0:
+            values = rng.normal(100, 10, n_rows)
+            values[rng.random(n_rows) < 0.05] = np.nan
+        elif kind == 1:
+            values = rng.integers(0, 1000, n_rows)
+        elif kind == 2:
+            values = rng.choice(["A", "B", "C", "D", None], n_rows)
+        else:
+            values = np.char.add("ID", rng.integers(0, n_rows, n_rows).astype(str)).astype(object)
+        DataDict[f"COL_{i:03d}"] = values
+    return pd.DataFrame(DataDict)
+
+
+def make_column_info(data):
+    return {col: {"컬럼 영문명": col, "컬럼 한글명": None, "데이터 타입": data[col].dtypes.name, "코드대분류": None, "코드값": None} for col in data.columns}
+
+
+def measure(func, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profiler 컬럼 단위 반복 방식 vs frame 단위 일괄 계산 방식 비교")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--cols", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    profiler = Profiler()
+    print(f"{'rows':>12} {'cols':>6} {'loop(s)':>10} {'vectorized(s)':>14} {'speedup':>8} {'same':>6}")
+    for n_rows in args.rows:
+        data = make_data(n_rows, args.cols)
+        ColumnInfo = make_column_info(data)
+        loop_time, loop_result = measure(lambda: profiler.profile("BENCH", data, ColumnInfo, engine="loop"), args.repeat)
+        vec_time, vec_result = measure(lambda: profiler.profile("BENCH", data, ColumnInfo), args.repeat)
+        print(f"{n_rows:>12,} {args.cols:>6} {loop_time:>10.3f} {vec_time:>14.3f} {loop_time / vec_time:>7.1f}x {str(loop_result.to_dict() == vec_result.to_dict()):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+import NexR_qc
+from NexR_qc.QualityCheck import QualityCheck
+from NexR_qc.Timer import peak_rss_mb
+from synthetic import make_data, make_documents, time_columns
+
+# 크기 단계 별 (행 수, 컬럼 수, 테이블 수)
+Tiers = {
+    "xs": (1_000, 10, 1),
+    "s": (100_000, 20, 5),
+    "m": (1_000_000, 50, 10),
+    "l": (10_000_000, 10, 1),
+    "wide": (10_000, 1_000, 1),
+    "many": (1_000, 10, 500),
+}
+Stages = ["data_check", "document_check", "na_check", "run", "save"]
+ResultPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "qc_benchmark.jsonl")
+
+
+def version_label():
+    # 패키지 버전 + git commit (git 저장소가 아닌 경우 패키지 버전만 사용)
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.strip()
+        return f"{NexR_qc.__version__}+{commit}"
+    except (OSError, subprocess.CalledProcessError):
+        return NexR_qc.__version__
+
+
+def run_stages(DataDict, config, memory):
+    # Step 1 ~ 6 를 단계 별로 측정 (memory: 단계 별 tracemalloc 최대 메모리, 측정 시 처리 속도 저하)
+    Process = QualityCheck(DataDict, config=config)
+    Measured = {}
+    for stage in Stages:
+        if memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        getattr(Process, stage)()
+        elapsed = time.perf_counter() - start
+        peak = None
+        if memory:
+            peak = tracemalloc.get_traced_memory()[1] / 1024**2
+            tracemalloc.stop()
+        Measured[stage] = {"seconds": elapsed, "peak_mb": peak, "rss_mb": peak_rss_mb()}
+    Process.logger.close()
+    return Measured
+
+
+def benchmark(tier, n_rows, n_cols, n_tables, args):
+    DataDict = make_data(n_tables, n_rows, n_cols, null_ratio=args.null_ratio, cardinality=args.cardinality)
+    config = {"interactive": False, "timeColumns": time_columns(DataDict), "excelEngine": args.excel_engine, "workers": args.workers, "pipelineSave": args.pipeline_save, "shardTables": args.shard_tables, "shardWorkers": args.shard_workers, "logLevel": "ERROR"}  # QC 진행 로그는 출력하지 않음
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # QualityCheck 는 현재 경로 기준으로 documents/log/output 폴더를 사용
+        make_documents(DataDict, os.path.join(tmp, "documents"), cardinality=args.cardinality)
+        os.chdir(tmp)
+        try:
+            Measured = run_stages(DataDict, config, memory=False)
+            if args.memory:
+                for stage, values in run_stages(DataDict, config, memory=True).items():
+                    Measured[stage]["peak_mb"] = values["peak_mb"]
+        finally:
+            os.chdir(cwd)
+
+    Common = {
+        "version": args.label or version_label(),
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "tier": tier,
+        "rows": n_rows,
+        "cols": n_cols,
+        "tables": n_tables,
+        "excelEngine": args.excel_engine,
+        "workers": args.workers,
+        "pipelineSave": args.pipeline_save,
+        "shardTables": args.shard_tables,
+        "shardWorkers": args.shard_workers,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+    }
+    return [{**Common, "stage": stage, **values} for stage, values in Measured.items()]
+
+
+def compare(Records, version):
+    # 단계 별로 현재 버전과 직전에 측정된 다른 버전의 소요시간/최대 메모리 비교
+    Latest = {}
+    for record in Records:
+        key = (record["tier"], record["rows"], record["cols"], record["tables"], record["excelEngine"], record["workers"], record.get("pipelineSave", False), record.get("shardTables", 0), record.get("shardWorkers", 1), record["stage"])
+        Latest.setdefault(key, {})[record["version"]] = record
+    print(f"{'tier':>6} {'stage':>15} {'previous':>16} {'prev(s)':>9} {'curr(s)':>9} {'ratio':>7} {'prev(MB)':>9} {'curr(MB)':>9}")
+    for key, Versions in Latest.items():
+        if version not in Versions or len(Versions) < 2:
+            continue
+        current = Versions[version]
+        previous = [record for v, record in Versions.items() if v != version][-1]
+        memory = [f"{record['peak_mb']:>9.1f}" if record["peak_mb"] is not None else f"{'-':>9}" for record in [previous, current]]
+        print(f"{key[0]:>6} {key[-1]:>15} {previous['version']:>16} {previous['seconds']:>9.3f} {current['seconds']:>9.3f} {current['seconds'] / previous['seconds']:>6.2f}x {memory[0]} {memory[1]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QualityCheck 단계 별(data_check/document_check/na_check/run/save) 소요시간 및 최대 메모리 측정")
+    parser.add_argument("--tiers", nargs="+", default=["xs", "s"], choices=list(Tiers), help="크기 단계 (xs/s/m/l/wide/many)")
+    parser.add_argument("--rows", type=int, help="행 수 (지정 시 --tiers 대신 custom 단계로 측정)")
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--tables", type=int, default=1)
+    parser.add_argument("--null-ratio", type=float, default=0.05)
+    parser.add_argument("--cardinality", type=int, default=20, help="코드 컬럼 범주 수")
+    parser.add_argument("--excel-engine", choices=["openpyxl", "xlsxwriter"], default="openpyxl")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--pipeline-save", action="store_true", help="run 단계에서 테이블 별 결과서 시트를 background 로 작성 (xlsxwriter)")
+    parser.add_argument("--shard-tables", type=int, default=0, help="결과서 파일 1 개당 최대 테이블 수 (0: 분할하지 않음)")
+    parser.add_argument("--shard-workers", type=int, default=1, help="분할 결과서 병렬 작성 worker 수")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="tracemalloc 최대 메모리 측정 생략")
+    parser.add_argument("--label", help="결과 저장 시 사용할 버전명 (미입력 시 패키지 버전 + git commit)")
+    parser.add_argument("--output", default=ResultPath, help="결과 저장 경로 (jsonl, 실행 결과 누적)")
+    parser.add_argument("--compare", action="store_true", help="저장된 이전 버전 결과와 비교")
+    args = parser.parse_args()
+
+    Targets = {"custom": (args.rows, args.cols, args.tables)} if args.rows else {tier: Tiers[tier] for tier in args.tiers}
+    Records = []
+    print(f"{'tier':>6} {'rows':>12} {'cols':>6} {'tables':>6} {'stage':>15} {'seconds':>9} {'peak(MB)':>9} {'rss(MB)':>9}")
+    for tier, (n_rows, n_cols, n_tables) in Targets.items():
+        for record in benchmark(tier, n_rows, n_cols, n_tables, args):
+            Records.append(record)
+            peak = f"{record['peak_mb']:>9.1f}" if record["peak_mb"] is not None else f"{'-':>9}"
+            rss = f"{record['rss_mb']:>9.1f}" if record["rss_mb"] is not None else f"{'-':>9}"
+            print(f"{tier:>6} {n_rows:>12,} {n_cols:>6} {n_tables:>6} {record['stage']:>15} {record['seconds']:>9.3f} {peak} {rss}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "a", encoding="utf-8") as f:
+        for record in Records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    print(f"결과 저장 경로: {args.output}")
+
+    if args.compare:
+        with open(args.output, "r", encoding="utf-8") as f:
+            compare([json.loads(line) for line in f if line.strip()], Records[0]["version"] if Records else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# 컬럼 유형 별 정의서 데이터 타입 (float/int: 연속형, code/id: 범주형, datetime: 날짜/시간)
+DocumentTypes = {"float": "numeric", "int": "numeric", "code": "char", "id": "varchar", "datetime": "datetime"}
+DefaultMix = {"float": 3, "int": 2, "code": 3, "id": 1, "datetime": 1}
+
+
+def column_kinds(n_cols, mix=None):
+    # mix 비율대로 컬럼 유형을 순서대로 배정 ({"float": 3, "code": 1} → float, float, float, code, ...)
+    mix = mix or DefaultMix
+    cycle = [kind for kind, weight in mix.items() for _ in range(weight)]
+    return [cycle[i % len(cycle)] for i in range(n_cols)]
+
+
+def make_table(n_rows, n_cols, mix=None, null_ratio=0.05, cardinality=20, seed=0):
+    """Synthetic table with a configurable dtype mix, null ratio and code-column cardinality
+
+    code 컬럼은 cardinality 개의 코드값 중 하나 (코드정의서에는 마지막 1 개를 제외하여 정의된 범주 외 값 발생)
+    """
+    rng = np.random.default_rng(seed)
+    DataDict = {}
+    for i, kind in enumerate(column_kinds(n_cols, mix)):
+        if kind == "float":
+            values = pd.Series(rng.normal(100, 10, n_rows))
+        elif kind == "int":
+            values = pd.Series(rng.integers(0, 10_000, n_rows)).astype("float64" if null_ratio > 0 else "int64")
+        elif kind == "code":
+            values = pd.Series(np.char.add("C", rng.integers(0, cardinality, n_rows).astype(str)), dtype=object)
+        elif kind == "id":
+            values = pd.Series(np.char.add("ID", rng.integers(0, n_rows, n_rows).astype(str)), dtype=object)
+        else:
+            values = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365 * 24 * 3600, n_rows), unit="s"))
+        if null_ratio > 0:
+            values[rng.random(n_rows) < null_ratio] = None
+        DataDict[f"{kind.upper()}_{i:04d}"] = values
+    return pd.DataFrame(DataDict)
+
+
+def make_data(n_tables, n_rows, n_cols, mix=None, null_ratio=0.05, cardinality=20, seed=0):
+    # {"TABLE_0001": dataframe, ...}
+    return {f"TABLE_{t + 1:04d}": make_table(n_rows, n_cols, mix=mix, null_ratio=null_ratio, cardinality=cardinality, seed=seed + t) for t in range(n_tables)}
+
+
+def time_columns(DataDict):
+    # QualityCheck config 의 timeColumns 값
+    return {data_name: [col for col in data.columns if col.startswith("DATETIME_")] for data_name, data in DataDict.items()}
+
+
+def _write_document(path, title, document):
+    # 기존 정의서와 동일한 형태 (1 행: 문서명, 2 행: 헤더)
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        document.to_excel(writer, index=False, startrow=1)
+        writer.sheets["Sheet1"].cell(row=1, column=1).value = title
+
+
+def make_documents(DataDict, folder, cardinality=20):
+    """Write 테이블정의서/컬럼정의서/코드정의서 matching DataDict into folder"""
+    os.makedirs(folder, exist_ok=True)
+    TableRows, ColumnRows, CodeRows, CodeMajors = [], [], [], set()
+    for t, (data_name, data) in enumerate(DataDict.items()):
+        TableRows.append([t + 1, "BENCH", "벤치마크DB", "BENCH", data_name, f"가상 테이블 {t + 1}"])
+        for col in data.columns:
+            kind = col.rsplit("_", 1)[0].lower()
+            # 동일한 컬럼명의 code 컬럼은 테이블 간 코드 대분류 공유
+            code_major = col if kind == "code" else None
+            ColumnRows.append([len(ColumnRows) + 1, "BENCH", "벤치마크DB", data_name, f"가상 테이블 {t + 1}", col, f"{col} 한글명", DocumentTypes[kind], code_major])
+            if code_major is not None and code_major not in CodeMajors:
+                CodeMajors.add(code_major)
+                CodeRows += [[len(CodeRows) + 1, code_major, code + 1, f"C{code}", f"코드 {code}"] for code in range(cardinality - 1)]
+
+    _write_document(os.path.join(folder, "테이블정의서.xlsx"), "테이블정의서", pd.DataFrame(TableRows, columns=["No.", "시스템 영문명", "시스템 한글명", "스키마명", "테이블 영문명", "테이블 한글명"]))
+    _write_document(os.path.join(folder, "컬럼정의서.xlsx"), "컬럼정의서", pd.DataFrame(ColumnRows, columns=["No.", "시스템명(영문)", "시스템명(한글)", "테이블 영문명", "테이블 한글명", "컬럼 영문명", "컬럼 한글명", "데이터\n타입", "코드대분류"]))
+    _write_document(os.path.join(folder, "코드정의서.xlsx"), "코드정의서", pd.DataFrame(CodeRows, columns=["No", "코드 대분류", "코드번호", "코드값", "코드명"]))
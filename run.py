@@ -1,16 +1,18 @@
+from NexR_qc.Ingestion import load_folder
 from NexR_qc.QualityCheck import *
 
-PathDict = {}
-PathDict["ROOT"] = os.getcwd()
-PathDict["DATA"] = os.path.join(PathDict["ROOT"], "data", "data1")
+if __name__ == "__main__":
 
-DataDict = {}
-for path in os.listdir(PathDict["DATA"]):
-    if not path.startswith("."):
-        data_name = os.path.splitext(os.path.basename(path))[0].upper()
-        DataDict[data_name] = pd.read_csv(os.path.join(PathDict["DATA"], path))
+    # 병렬 처리(workers > 1) 시 worker 프로세스에서 데이터를 다시 읽지 않도록 main 블록 내에서 데이터 로딩
+    PathDict = {}
+    PathDict["ROOT"] = os.getcwd()
+    PathDict["DATA"] = os.path.join(PathDict["ROOT"], "data", "data1")
 
-if __name__ == "__main__":
+    # 결측값은 읽기 단계에서 처리 (config.json 의 naList 사용), 정수 downcast 및 문자열 컬럼 category 변환으로 메모리 절감
+    naList = json.load(open(os.path.join(PathDict["ROOT"], "config.json")))["naList"] if os.path.exists(os.path.join(PathDict["ROOT"], "config.json")) else None
+
+    # 하위 폴더의 csv/xlsx/parquet/feather 파일을 동시에 불러옴 (workers: 동시에 읽을 파일 수)
+    DataDict = load_folder(PathDict["DATA"], naList=naList, workers=4)
 
     Process = QualityCheck(DataDict)
     Process.data_check()
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from NexR_qc.DateTimeInference import infer_datetime_columns
+from NexR_qc.Ingestion import optimize_frame
+
+
+def make_frame():
+    return pd.DataFrame({"dt": [f"2023-01-0{i % 9 + 1}" for i in range(1_000)], "code": ["a", "b"] * 500, "num": range(1_000)})
+
+
+def test_infer_datetime_columns():
+    assert infer_datetime_columns(make_frame()) == ["dt"]
+
+
+def test_infer_datetime_columns_after_ingestion():
+    # 불러오기 시 category 로 변환된 날짜 문자열 컬럼도 날짜/시간 컬럼으로 추론
+    data = optimize_frame(make_frame())
+    assert isinstance(data["dt"].dtype, pd.CategoricalDtype)
+    assert infer_datetime_columns(data) == ["dt"]
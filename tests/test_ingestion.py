@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+from NexR_qc.Ingestion import DefaultNaList, read_raw, read_table
+
+
+def test_read_table_csv(tmp_path):
+    # csv 는 pyarrow 설치 여부와 무관하게 C 엔진으로 읽음 (naList 는 읽기 시점에 결측값 처리)
+    path = tmp_path / "T.csv"
+    path.write_text("code,num,dt\na,1,2023-01-01\n?,2,2023-01-02\nnull,3,2023-01-03\n")
+    data = read_table(str(path))
+    assert data["code"].isna().sum() == 2
+    assert data.attrs["ingest"]["dtypes"] == {col: (dtype.name, data.dtypes[col].name) for col, dtype in pd.read_csv(path, na_values=DefaultNaList, engine="c").dtypes.items()}
+
+
+def test_read_raw_parquet_replaces_text_columns_only(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "T.parquet"
+    pd.DataFrame({"code": ["a", "?", "null"], "num": [1.0, -1.0, 2.0]}).to_parquet(path)
+    data = read_raw(str(path), DefaultNaList + [-1.0])
+    assert data["code"].isna().sum() == 2
+    assert data["num"].tolist() == [1.0, -1.0, 2.0]
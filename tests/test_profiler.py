@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from NexR_qc.Profiler import Profiler, profile_table
+from NexR_qc.Streaming import TableAccumulator, iter_chunks
+
+
+def column_info(data, dtypes=None):
+    # 컬럼 정의서가 없는 경우와 동일한 컬럼 정보 (데이터 타입: 실제 dtype 명)
+    dtypes = dtypes or {}
+    return {col: {"컬럼 영문명": col, "컬럼 한글명": None, "데이터 타입": dtypes.get(col, data.dtypes[col].name), "코드대분류": None, "코드값": None, "검증 규칙": None} for col in data.columns}
+
+
+def test_profile_empty_table():
+    # 행이 없는 테이블: %null / %적재건수는 NaN
+    data = pd.DataFrame({"num": pd.Series([], dtype="float64"), "code": pd.Series([], dtype=object), "mixed": pd.Series([], dtype=object)})
+    Result, _, _, _ = profile_table("T", data, column_info(data, {"mixed": "int64"}))
+    Frame = Result.to_frame(formatted=False)
+    assert (Frame["null 개수"] == 0).all()
+    assert (Frame["적재건수"] == 0).all()
+    assert Frame["%null"].isna().all()
+    assert Frame["%적재건수"].isna().all()
+
+
+def test_profile_empty_stream(tmp_path):
+    # 헤더만 있는 csv 를 chunk 단위로 집계한 테이블
+    path = tmp_path / "EMPTY.csv"
+    path.write_text("num,code\n")
+    data = TableAccumulator().consume(iter_chunks(str(path), 2, None), [])
+    assert data.shape == (0, 2)
+    Result, _, _, _ = profile_table("EMPTY", data, {col: {"컬럼 영문명": col, "컬럼 한글명": None, "데이터 타입": "object", "코드대분류": None, "코드값": None, "검증 규칙": None} for col in data.columns})
+    Frame = Result.to_frame(formatted=False)
+    assert (Frame["적재건수"] == 0).all()
+    assert Frame["%null"].isna().all()
+    assert Frame["%적재건수"].isna().all()
+
+
+def mixed_frame(n_rows):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "float": rng.normal(size=n_rows),
+            "int": rng.integers(0, 100, n_rows),
+            "all_null": np.full(n_rows, np.nan),
+            "all_null_text": pd.Series([None] * n_rows, dtype=object),
+            "multi_mode": pd.Series(["a", "b", "c", "d"] * (n_rows // 4) + ["e"] * (n_rows % 4), dtype=object),
+            "flag": rng.integers(0, 2, n_rows).astype(bool),
+            "category": pd.Series(rng.choice(["x", "y", None], n_rows), dtype="category"),
+            "dt": pd.date_range("2023-01-01", periods=n_rows, freq="h"),
+            "empty_text": pd.Series([""] * n_rows, dtype=object),
+            "text_as_int": pd.Series(["1", "two", None] * (n_rows // 3) + ["3"] * (n_rows % 3), dtype=object),
+        }
+    )
+    data.loc[::7, "float"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 200])
+def test_profile_frame_matches_column_loop(n_rows):
+    # 벡터화 방식(profile_frame)과 컬럼 단위 방식(_profile_column) 결과 비교
+    data = mixed_frame(n_rows)
+    ColumnInfo = column_info(data, {"flag": "varchar", "dt": "datetime", "multi_mode": "varchar", "text_as_int": "int64"})
+    ColumnInfo["category"]["코드값"] = ["x", "z"]
+    Vectorized = Profiler().profile("T", data, ColumnInfo, engine="vectorized")
+    Loop = Profiler().profile("T", data, ColumnInfo, engine="loop")
+    assert Vectorized.to_dict() == Loop.to_dict()